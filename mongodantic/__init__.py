@@ -4,6 +4,9 @@ from .connection import (
     set_connection_env,
     get_connection_env,
 )
+from .encoders import set_json_backend
+from .retry import RetryPolicy
+from .pipeline import Pipeline
 
 
 __author__ = 'bzdvdn'
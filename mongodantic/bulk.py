@@ -0,0 +1,88 @@
+from typing import Any, Dict, List, Optional
+
+__all__ = ('BulkResult', 'BatchError')
+
+
+class BatchError(object):
+    """failed batch of bulk operation
+
+    Args:
+        batch (int): batch number
+        offset (int): index of first batch item in source models
+        write_errors (List[Dict]): pymongo writeErrors with index inside batch
+    """
+
+    def __init__(self, batch: int, offset: int, write_errors: List[Dict]):
+        self.batch = batch
+        self.offset = offset
+        self.write_errors = write_errors
+
+    @property
+    def indices(self) -> List[int]:
+        """indices of failed items in source models"""
+        return [self.offset + error['index'] for error in self.write_errors]
+
+    @property
+    def messages(self) -> List[str]:
+        return [error.get('errmsg', '') for error in self.write_errors]
+
+    def __repr__(self):
+        return f'BatchError(batch={self.batch}, indices={self.indices})'
+
+
+class BulkResult(object):
+    """summary of bulk_create, bulk_update and bulk_update_or_create batches"""
+
+    def __init__(
+        self,
+        inserted_count: int = 0,
+        matched_count: int = 0,
+        modified_count: int = 0,
+        upserted_count: int = 0,
+        errors: Optional[List[BatchError]] = None,
+    ):
+        self.inserted_count = inserted_count
+        self.matched_count = matched_count
+        self.modified_count = modified_count
+        self.upserted_count = upserted_count
+        self.errors: List[BatchError] = errors or []
+
+    @classmethod
+    def from_bulk_write(cls, result: Any) -> 'BulkResult':
+        """from pymongo BulkWriteResult"""
+        return cls(
+            inserted_count=result.inserted_count,
+            matched_count=result.matched_count,
+            modified_count=result.modified_count,
+            upserted_count=result.upserted_count,
+        )
+
+    @classmethod
+    def from_error(cls, batch: int, offset: int, details: Dict) -> 'BulkResult':
+        """from pymongo BulkWriteError details, successful writes of batch are counted"""
+        return cls(
+            inserted_count=details.get('nInserted', 0),
+            matched_count=details.get('nMatched', 0),
+            modified_count=details.get('nModified', 0),
+            upserted_count=details.get('nUpserted', 0),
+            errors=[BatchError(batch, offset, details.get('writeErrors', []))],
+        )
+
+    def merge(self, other: 'BulkResult') -> 'BulkResult':
+        self.inserted_count += other.inserted_count
+        self.matched_count += other.matched_count
+        self.modified_count += other.modified_count
+        self.upserted_count += other.upserted_count
+        self.errors.extend(other.errors)
+        return self
+
+    @property
+    def failed_indices(self) -> List[int]:
+        return sorted(index for error in self.errors for index in error.indices)
+
+    def __repr__(self):
+        return (
+            f'BulkResult(inserted={self.inserted_count}, matched={self.matched_count}, '
+            f'modified={self.modified_count}, upserted={self.upserted_count}, '
+            f'errors={len(self.errors)})'
+        )
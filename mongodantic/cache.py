@@ -0,0 +1,229 @@
+import hashlib
+from threading import Lock
+from time import monotonic
+from typing import Any, Dict, List, Optional, Tuple
+from weakref import WeakSet
+
+import bson
+from bson.errors import InvalidDocument
+
+from .helpers import LRUCache
+
+__all__ = ('CacheBackend', 'MemoryCacheBackend', 'RedisCacheBackend', 'ResultCache')
+
+DEFAULT_RESULT_CACHE_SIZE = 1024
+
+# result caches which read namespace, writes invalidate all of them
+_namespace_caches: Dict[str, 'WeakSet[ResultCache]'] = {}
+_namespace_caches_lock = Lock()
+
+
+class CacheBackend(object):
+    """interface of result cache storage, values are bytes
+
+    Counters are used for invalidation and must not be evicted before values.
+    """
+
+    def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        raise NotImplementedError
+
+    def incr(self, key: str) -> int:
+        """increment counter and return new value"""
+        raise NotImplementedError
+
+    def counter(self, key: str) -> int:
+        """current counter value, 0 if it is not set"""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class MemoryCacheBackend(CacheBackend):
+    """in-process LRU backend
+
+    Args:
+        maxsize (int, optional): max count of cached results. Defaults to 1024.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_RESULT_CACHE_SIZE):
+        self._values = LRUCache(maxsize)
+        self._counters: Dict[str, int] = {}
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        item = self._values.get(key)
+        if item is None:
+            return None
+        value, expires_at = item
+        if expires_at is not None and expires_at <= monotonic():
+            return None
+        return value
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        expires_at = monotonic() + ttl if ttl else None
+        self._values.set(key, (value, expires_at))
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def counter(self, key: str) -> int:
+        return self._counters.get(key, 0)
+
+    def clear(self) -> None:
+        self._values.clear()
+        with self._lock:
+            self._counters.clear()
+
+
+class RedisCacheBackend(CacheBackend):
+    """backend on top of redis-py compatible client (get, set with px, incr, scan_iter, delete)
+
+    Args:
+        client (Any): redis client, it is not imported by mongodantic
+        prefix (str, optional): prefix of all keys. Defaults to 'mongodantic:'.
+    """
+
+    def __init__(self, client: Any, prefix: str = 'mongodantic:'):
+        self._client = client
+        self._prefix = prefix
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._client.get(self._prefix + key)
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        if ttl:
+            self._client.set(self._prefix + key, value, px=int(ttl * 1000))
+        else:
+            self._client.set(self._prefix + key, value)
+
+    def incr(self, key: str) -> int:
+        return int(self._client.incr(self._prefix + key))
+
+    def counter(self, key: str) -> int:
+        return int(self._client.get(self._prefix + key) or 0)
+
+    def clear(self) -> None:
+        for key in self._client.scan_iter(f'{self._prefix}*'):
+            self._client.delete(key)
+
+
+class ResultCache(object):
+    """read-through cache of find_one, get, count and distinct results
+
+    Keys contain collection generation, every write through model querybuilders
+    increments it, so cached results of previous generation are not read anymore.
+    Generation is incremented in caches of all models of the collection,
+    even if they have own backends.
+    Writes in transaction increment it again when the transaction is finished,
+    this is checked before every cached read.
+
+    Args:
+        backend (CacheBackend): storage
+        ttl (Optional[float], optional): seconds to keep result. Defaults to None - until eviction or write.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: Optional[float] = None):
+        self.backend = backend
+        self.ttl = ttl
+        self._lock = Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'invalidations': 0}
+        # (namespace, session) of writes in not finished transactions
+        self._deferred: List[Tuple[str, Any]] = []
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+
+    def _register(self, namespace: str) -> List['ResultCache']:
+        """register cache as reader of namespace
+
+        Returns:
+            List[ResultCache]: all caches of namespace
+        """
+        with _namespace_caches_lock:
+            caches = _namespace_caches.setdefault(namespace, WeakSet())
+            caches.add(self)
+            return list(caches)
+
+    def key(self, namespace: str, method: str, params: Tuple) -> Optional[str]:
+        """cache key of query, None if params are not bson serializable"""
+        if namespace not in _namespace_caches or self not in _namespace_caches[namespace]:
+            self._register(namespace)
+        if self._deferred:
+            self._flush_deferred()
+        try:
+            encoded = bson.encode({'p': list(params)})
+        except (InvalidDocument, TypeError):
+            return None
+        generation = self.backend.counter(f'{namespace}:generation')
+        digest = hashlib.sha1(encoded).hexdigest()
+        return f'{namespace}:{generation}:{method}:{digest}'
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """(found, value) of cached result"""
+        data = self.backend.get(key)
+        if data is None:
+            self._count('misses')
+            return False, None
+        self._count('hits')
+        return True, bson.decode(data)['v']
+
+    def set(self, key: str, value: Any) -> None:
+        try:
+            data = bson.encode({'v': value})
+        except (InvalidDocument, TypeError):
+            return
+        self.backend.set(key, data, self.ttl)
+
+    def invalidate(self, namespace: str, session: Any = None) -> None:
+        """increment generation of namespace in all caches of namespace
+
+        Args:
+            namespace (str): collection namespace
+            session (Any, optional): session of write, in transaction results read
+                before commit are invalidated again after it. Defaults to None.
+        """
+        in_transaction = session is not None and getattr(session, 'in_transaction', False)
+        backends: List[CacheBackend] = []
+        for cache in self._register(namespace):
+            # caches of one backend share counter
+            if not any(backend is cache.backend for backend in backends):
+                backends.append(cache.backend)
+                cache.backend.incr(f'{namespace}:generation')
+            if in_transaction:
+                with cache._lock:
+                    cache._deferred.append((namespace, session))
+        self._count('invalidations')
+
+    def _flush_deferred(self) -> None:
+        with self._lock:
+            finished = {
+                namespace
+                for namespace, session in self._deferred
+                if not session.in_transaction
+            }
+            if not finished:
+                return
+            self._deferred = [
+                (namespace, session)
+                for namespace, session in self._deferred
+                if session.in_transaction
+            ]
+        for namespace in finished:
+            self.invalidate(namespace)
+
+    def info(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def clear(self) -> None:
+        self.backend.clear()
+        with self._lock:
+            for key in self._stats:
+                self._stats[key] = 0
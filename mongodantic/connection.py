@@ -1,7 +1,12 @@
 import os
-from typing import Optional
+from typing import Optional, Dict, Any, Tuple, TYPE_CHECKING
 from pymongo import MongoClient, database
 
+from .exceptions import MongoConnectionError
+
+if TYPE_CHECKING:
+    from .retry import RetryPolicy
+
 __all__ = (
     'connect',
     'set_connection_env',
@@ -11,8 +16,17 @@ __all__ = (
 )
 
 DEFAULT_CONNECTION_NAME = 'default'
-_connections: dict = {}
+CONNECTION_ENV_VARIABLE = 'MONGODANTIC_DB_ENV'
+ASYNC_DRIVERS = ('executor', 'motor')
+# registry of connections by (pid, env name)
+_connections: Dict[Tuple[str, str], '_DBConnection'] = {}
 _connection_settings: dict = {}
+# current env and pid are cached, version is bumped when models must rebind connection
+_connection_state: Dict[str, Any] = {
+    'env': os.environ.get(CONNECTION_ENV_VARIABLE, DEFAULT_CONNECTION_NAME),
+    'pid': str(os.getpid()),
+    'version': 0,
+}
 
 
 def connect(
@@ -25,6 +39,8 @@ def connect(
     connect_timeout_ms: int = 30000,
     socket_timeout_ms: int = 60000,
     env_name: Optional[str] = None,
+    async_driver: str = 'executor',
+    retry_policy: Optional['RetryPolicy'] = None,
 ) -> None:
     """init connection to mongodb
 
@@ -38,10 +54,16 @@ def connect(
         connect_timeout_ms (int, optional): ConnectionTimeoutMS. Defaults to 30000.
         socket_timeout_ms (int, optional): SocketTimeoutMS. Defaults to 60000.
         env_name (Optional[str], optional): connection env name. Defaults to None.
+        async_driver (str, optional): backend for AQ queries, `executor` runs pymongo in thread pool, `motor` uses non-blocking motor client. Defaults to 'executor'.
+        retry_policy (Optional[RetryPolicy], optional): retry policy for connection errors of this env. Defaults to None.
     """
+    if async_driver not in ASYNC_DRIVERS:
+        raise ValueError(
+            f'invalid async_driver - {async_driver}, must be one of {ASYNC_DRIVERS}'
+        )
     set_connection_env(env_name)
     connection_env = get_connection_env()
-    _connection_settings[connection_env] = {
+    settings = {
         'connection_str': connection_str,
         'dbname': dbname,
         'ssl': ssl,
@@ -50,23 +72,46 @@ def connect(
         'connect_timeout_ms': connect_timeout_ms,
         'socket_timeout_ms': socket_timeout_ms,
         'ssl_cert_path': ssl_cert_path,
+        'async_driver': async_driver,
+        'retry_policy': retry_policy,
     }
-    _get_connection(str(os.getpid()), env_name=connection_env)
+    if _connection_settings.get(connection_env) != settings:
+        _connection_settings[connection_env] = settings
+        old_connection = _connections.get((_connection_state['pid'], connection_env))
+        if old_connection:
+            old_connection.close()
+    _get_connection(_connection_state['pid'], env_name=connection_env)
 
 
 def set_connection_env(name: Optional[str] = None):
-    os.environ['MONGODANTIC_DB_ENV'] = name or DEFAULT_CONNECTION_NAME
+    name = name or DEFAULT_CONNECTION_NAME
+    os.environ[CONNECTION_ENV_VARIABLE] = name
+    if _connection_state['env'] != name:
+        _connection_state['env'] = name
+        _connection_state['version'] += 1
 
 
 def get_connection_env() -> str:
-    return os.environ.get('MONGODANTIC_DB_ENV', DEFAULT_CONNECTION_NAME)
+    return _connection_state['env']
+
+
+def _reset_after_fork() -> None:
+    """drop connections inherited from parent process, pymongo clients are not fork-safe"""
+    _connections.clear()
+    _connection_state['pid'] = str(os.getpid())
+    _connection_state['version'] += 1
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
 
 
 class _DBConnection(object):
-    def __init__(
-        self, alias: str = str(os.getpid()), env_name: str = get_connection_env()
-    ):
-        self._alias = alias
+    def __init__(self, alias: Optional[str] = None, env_name: Optional[str] = None):
+        self._alias = alias or _connection_state['pid']
+        self._pid = str(os.getpid())
+        env_name = env_name or get_connection_env()
+        self._env_name = env_name
         if env_name not in _connection_settings:
             raise RuntimeError('not execute `connect` or empty connection settings')
         self.connection_string = _connection_settings[env_name]['connection_str']
@@ -79,12 +124,16 @@ class _DBConnection(object):
         ]
         self.connect_timeout_ms = _connection_settings[env_name]['connect_timeout_ms']
         self.socket_timeout_ms = _connection_settings[env_name]['socket_timeout_ms']
+        self.async_driver = _connection_settings[env_name].get(
+            'async_driver', 'executor'
+        )
         self._mongo_connection = self._init_mongo_connection()
         self._database: Optional[database.Database] = None
+        self._motor_connection: Any = None
+        self._motor_database: Any = None
 
-    def _init_mongo_connection(self, connect: bool = False) -> MongoClient:
+    def _connection_params(self) -> Dict[str, Any]:
         connection_params = dict(
-            connect=connect,
             serverSelectionTimeoutMS=self.server_selection_timeout_ms,
             maxPoolSize=self.max_pool_size,
             connectTimeoutMS=self.connect_timeout_ms,
@@ -95,11 +144,28 @@ class _DBConnection(object):
         if self.ssl:
             connection_params['tlsCAFile'] = self.ssl_cert_path
             connection_params['tlsAllowInvalidCertificates'] = self.ssl
-        return MongoClient(self.connection_string, **connection_params)
+        return connection_params
+
+    def _init_mongo_connection(self, connect: bool = False) -> MongoClient:
+        return MongoClient(
+            self.connection_string, connect=connect, **self._connection_params()
+        )
 
-    def _reconnect(self):
+    def _init_motor_connection(self) -> Any:
+        try:
+            from motor.motor_asyncio import AsyncIOMotorClient
+        except ImportError:
+            raise MongoConnectionError(
+                'motor is not installed, run `pip install motor` for async_driver=motor'
+            )
+        return AsyncIOMotorClient(self.connection_string, **self._connection_params())
+
+    def _reconnect(self) -> '_DBConnection':
         self.close()
-        return self.__init__(self._alias)
+        self.__init__(self._alias, self._env_name)  # type: ignore
+        _connections[(self._alias, self._env_name)] = self
+        _connection_state['version'] += 1
+        return self
 
     def get_database(self) -> database.Database:
         if hasattr(self, '_database') and self._database is not None:
@@ -107,22 +173,37 @@ class _DBConnection(object):
         self._database = self._mongo_connection.get_database(self.db_name)
         return self._database
 
+    def get_motor_database(self) -> Any:
+        if self._motor_database is not None:
+            return self._motor_database
+        if self._motor_connection is None:
+            self._motor_connection = self._init_motor_connection()
+        self._motor_database = self._motor_connection.get_database(self.db_name)
+        return self._motor_database
+
     def close(self) -> None:
-        if _connections:
-            old_connection = _connections.pop(self._alias, None)
-            if old_connection:
-                old_connection._mongo_connection.close()
-                del old_connection
+        key = (self._alias, self._env_name)
+        if _connections.get(key) is self:
+            del _connections[key]
+            _connection_state['version'] += 1
+        # clients inherited from parent process must not be closed in child
+        if self._pid != str(os.getpid()):
+            return
+        self._mongo_connection.close()
+        if self._motor_connection is not None:
+            self._motor_connection.close()
 
     def __del__(self):
-        self.close()
+        if getattr(self, '_mongo_connection', None) is not None:
+            self.close()
 
 
-def _get_connection(alias: str, env_name: str = get_connection_env()) -> _DBConnection:
-    connection = _connections.get(str(alias))
+def _get_connection(alias: str, env_name: Optional[str] = None) -> _DBConnection:
+    key = (str(alias), env_name or get_connection_env())
+    connection = _connections.get(key)
     if not connection:
-        connection = _DBConnection(str(alias), env_name=env_name)
-        _connections[alias] = connection
+        connection = _DBConnection(*key)
+        _connections[key] = connection
     return connection
 
 
@@ -137,5 +218,7 @@ def init_db_connection_params(
     connect_timeout_ms: int = 30000,
     socket_timeout_ms: int = 60000,
     env_name: str = DEFAULT_CONNECTION_NAME,
+    async_driver: str = 'executor',
+    retry_policy: Optional['RetryPolicy'] = None,
 ):
     return connect(**locals())
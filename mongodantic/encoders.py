@@ -0,0 +1,125 @@
+import json
+import base64
+from uuid import UUID
+from decimal import Decimal
+from datetime import date, datetime, time
+from typing import Any, Callable, Dict, Optional
+from bson import ObjectId, DBRef, Decimal128
+from pydantic import BaseModel
+
+__all__ = (
+    'bson_default',
+    'json_dumps',
+    'set_json_backend',
+    'get_json_backend',
+)
+
+JSON_BACKENDS = ('orjson', 'ujson', 'json')
+DEFAULT_JSON_BACKEND = 'json'
+
+
+def bson_default(obj: Any) -> Any:
+    """default hook for json encoders, converts bson and common python types
+
+    Args:
+        obj (Any): not serializable object
+
+    Raises:
+        TypeError: if type is unknown
+
+    Returns:
+        Any: json serializable value
+    """
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Decimal128):
+        return str(obj.to_decimal())
+    if isinstance(obj, (Decimal, UUID)):
+        return str(obj)
+    if isinstance(obj, DBRef):
+        return {'$ref': obj.collection, '$id': bson_default(obj.id)}
+    if isinstance(obj, BaseModel):
+        return obj.dict()
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if isinstance(obj, bytes):
+        return base64.b64encode(obj).decode()
+    raise TypeError(f'Object of type {obj.__class__.__name__} is not JSON serializable')
+
+
+def _json_backend() -> Callable[[Any], str]:
+    def dumps(obj: Any) -> str:
+        return json.dumps(obj, default=bson_default)
+
+    return dumps
+
+
+def _orjson_backend() -> Callable[[Any], str]:
+    import orjson
+
+    option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj: Any) -> str:
+        return orjson.dumps(obj, default=bson_default, option=option).decode()
+
+    return dumps
+
+
+def _ujson_backend() -> Callable[[Any], str]:
+    import ujson
+
+    # default hook is supported since ujson 5
+    ujson.dumps(ObjectId(), default=bson_default)
+
+    def dumps(obj: Any) -> str:
+        return ujson.dumps(obj, default=bson_default)
+
+    return dumps
+
+
+_backend_factories: Dict[str, Callable[[], Callable[[Any], str]]] = {
+    'orjson': _orjson_backend,
+    'ujson': _ujson_backend,
+    'json': _json_backend,
+}
+_backend: Dict[str, Any] = {'name': None, 'dumps': None}
+
+
+def set_json_backend(name: Optional[str] = DEFAULT_JSON_BACKEND) -> str:
+    """set encoder for QuerySet.json, serialize_json and json_stream,
+    orjson and ujson are opt-in, their output is compact and not byte-identical to json
+
+    Args:
+        name (Optional[str], optional): one of orjson, ujson, json, None - first installed. Defaults to json.
+
+    Raises:
+        ValueError: if invalid backend name or backend is not installed
+
+    Returns:
+        str: backend name
+    """
+    if name is not None and name not in JSON_BACKENDS:
+        raise ValueError(f'invalid json backend - {name}, must be one of {JSON_BACKENDS}')
+    for backend_name in (name,) if name else JSON_BACKENDS:
+        try:
+            dumps = _backend_factories[backend_name]()
+        except (ImportError, TypeError):
+            continue
+        _backend['name'], _backend['dumps'] = backend_name, dumps
+        return backend_name
+    raise ValueError(f'json backend {name} is not installed or not supported')
+
+
+def get_json_backend() -> str:
+    if _backend['name'] is None:
+        set_json_backend(DEFAULT_JSON_BACKEND)
+    return _backend['name']
+
+
+def json_dumps(obj: Any) -> str:
+    """encode object with configured json backend"""
+    if _backend['dumps'] is None:
+        set_json_backend(DEFAULT_JSON_BACKEND)
+    return _backend['dumps'](obj)
@@ -44,3 +44,12 @@ class DoesNotExist(BaseMongodanticException):
 
     def __str__(self):
         return f'row does not exist for model: {self.model_name}'
+
+
+class BulkOperationError(BaseMongodanticException):
+    def __init__(self, result, *args):
+        super().__init__(*args)
+        self.result = result
+
+    def __str__(self):
+        return f'bulk operation failed for indices: {self.result.failed_indices}'
@@ -1,6 +1,7 @@
+from collections import OrderedDict
 from re import compile, IGNORECASE
-from time import sleep
-from types import GeneratorType
+from threading import Lock
+from time import monotonic
 from typing import (
     Generator,
     List,
@@ -9,20 +10,16 @@ from typing import (
     Tuple,
     Union,
     Optional,
-    Callable,
     TYPE_CHECKING,
     Type,
+    Callable,
 )
 from bson import ObjectId
+from pydantic import BaseModel
 from pymongo import UpdateOne
-from pymongo.errors import (
-    ServerSelectionTimeoutError,
-    AutoReconnect,
-    NetworkTimeout,
-    ConnectionFailure,
-)
 
-from .exceptions import MongoConnectionError, MongoValidationError
+from .exceptions import MongoValidationError, NotDeclaredField
+from .retry import handle_and_convert_connection_errors
 from .types import ObjectIdStr
 
 if TYPE_CHECKING:
@@ -31,13 +28,16 @@ if TYPE_CHECKING:
 __all__ = (
     'handle_and_convert_connection_errors',
     'ExtraQueryMapper',
+    'LRUCache',
     'chunk_by_length',
     'bulk_query_generator',
+    'compile_bulk_query',
     'cached_classproperty',
     'group_by_aggregate_generation',
     'classproperty',
     'sort_validation',
     'generate_name_field',
+    'generate_projection',
     '_validate_value',
 )
 
@@ -54,6 +54,65 @@ class cached_classproperty(classmethod):
         return self.obj[cls]
 
 
+class LRUCache(object):
+    """bounded thread-safe mapping with least recently used eviction,
+    entries expire after `ttl` seconds if it is set"""
+
+    def __init__(self, maxsize: int = 128, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            if self.ttl is not None:
+                value, expires_at = value
+                if expires_at <= monotonic():
+                    del self._data[key]
+                    self.misses += 1
+                    return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Any, value: Any) -> None:
+        if self.ttl is not None:
+            value = (value, monotonic() + self.ttl)
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'maxsize': self.maxsize,
+            'currsize': len(self._data),
+        }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._data
+
+
 class classproperty(classmethod):
     def __init__(self, method=None):
         self.fget = method
@@ -245,6 +304,118 @@ def chunk_by_length(items: List, step: int) -> Generator:
         yield items[i : i + step]
 
 
+def _to_bson(value: Any) -> Any:
+    """nested pydantic models to dicts, like BaseModel.dict for field values"""
+    if isinstance(value, BaseModel):
+        return value.dict()
+    if isinstance(value, list):
+        return [_to_bson(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _to_bson(v) for k, v in value.items()}
+    return value
+
+
+def _field_converter(field: Any) -> Optional[Callable]:
+    """converter for raw field value, None if value can be sent as is"""
+    if field is None:
+        return None
+    types = [field.type_] + [sub_field.type_ for sub_field in field.sub_fields or ()]
+    for type_ in types:
+        if type_ is Any or (isinstance(type_, type) and issubclass(type_, BaseModel)):
+            return _to_bson
+    return None
+
+
+def compile_bulk_query(
+    model: Type['MongoModel'],
+    updated_fields: Tuple[str, ...] = (),
+    query_fields: Tuple[str, ...] = (),
+) -> Callable:
+    """build UpdateOne factory for model objects, fields and value converters are resolved once,
+    values are taken from object __dict__ without dict() copies, properties are skipped;
+    factories are cached on model class until its fields are changed
+
+    Args:
+        model (Type[MongoModel]): model class
+        updated_fields (Tuple[str, ...], optional): $set fields, filter by _id. Defaults to ().
+        query_fields (Tuple[str, ...], optional): filter fields, other fields are $set. Defaults to ().
+
+    Returns:
+        Callable: function(obj, upsert) -> UpdateOne, raises MongoValidationError for not fetched fields
+    """
+    cache = model.__dict__.get('__bulk_query_cache__')
+    key = (updated_fields, query_fields)
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None and cached[0] is model.__fields__:
+            return cached[1]
+    build = _compile_bulk_query(model, updated_fields, query_fields)
+    if cache is not None:
+        cache[key] = (model.__fields__, build)
+    return build
+
+
+def _field_value(values: Dict[str, Any], name: str) -> Any:
+    try:
+        return values[name]
+    except KeyError:
+        raise MongoValidationError(f'field {name} is not fetched and can not be saved')
+
+
+def _compile_bulk_query(
+    model: Type['MongoModel'],
+    updated_fields: Tuple[str, ...],
+    query_fields: Tuple[str, ...],
+) -> Callable:
+    fields = model.__fields__
+    if updated_fields:
+        # properties and other attributes are allowed in updated_fields
+        setters = tuple(
+            (name, name in fields, _field_converter(fields.get(name)))
+            for name in updated_fields
+        )
+
+        def build_by_id(obj: Any, upsert: bool) -> UpdateOne:
+            values = obj.__dict__
+            update = {}
+            for name, is_field, convert in setters:
+                value = _field_value(values, name) if is_field else getattr(obj, name)
+                update[name] = convert(value) if convert else value
+            return UpdateOne(
+                {'_id': ObjectId(obj._id)}, {'$set': update}, upsert=upsert
+            )
+
+        return build_by_id
+
+    query_setters = tuple(
+        (name, _field_converter(field))
+        for name, field in fields.items()
+        if name in query_fields
+    )
+    update_setters = tuple(
+        (name, _field_converter(field))
+        for name, field in fields.items()
+        if name not in query_fields
+    )
+    query_by_id = '_id' in query_fields
+
+    def build_by_query(obj: Any, upsert: bool) -> UpdateOne:
+        values = obj.__dict__
+        query = {}
+        for name, convert in query_setters:
+            value = _field_value(values, name)
+            query[name] = convert(value) if convert else value
+        if query_by_id:
+            query['_id'] = ObjectId(obj._id)
+        update = {}
+        for name, convert in update_setters:
+            value = _field_value(values, name)
+            update[name] = convert(value) if convert else value
+        return UpdateOne(query, {'$set': update}, upsert=upsert)
+
+    return build_by_query
+
+
 def bulk_query_generator(
     requests: List,
     updated_fields: Optional[List] = None,
@@ -253,67 +424,57 @@ def bulk_query_generator(
 ) -> List:
     """ "helper for generate bulk query"""
 
+    if not requests or not (updated_fields or query_fields):
+        return []
+    updated_fields = tuple(updated_fields or ())
+    query_fields = tuple(query_fields or ())
+    model = requests[0].__class__
+    build = compile_bulk_query(model, updated_fields, query_fields)
     data = []
-    if updated_fields:
-        for obj in requests:
-            query = {'_id': ObjectId(obj._id)}
-            update = {}
-            for field in updated_fields:
-                value = getattr(obj, field)
-                update.update({field: value})
-            data.append(UpdateOne(query, {'$set': update}, upsert=upsert))
-    elif query_fields:
-        for obj in requests:
-            query = {}
-            update = {}
-            for field, value in obj.data.items():
-                if field not in query_fields:
-                    update.update({field: value})
-                else:
-                    query.update({field: value})
-            data.append(UpdateOne(query, {'$set': update}, upsert=upsert))
+    for obj in requests:
+        if obj.__class__ is not model:
+            model = obj.__class__
+            build = compile_bulk_query(model, updated_fields, query_fields)
+        data.append(build(obj, upsert))
     return data
 
 
-def handle_and_convert_connection_errors(func: Callable) -> Any:
-    """decorator for handle connection errors and raise MongoConnectionError
-
-    Args:
-        func (Callable):any query to mongo
+def generate_name_field(name: Union[dict, str, None] = None) -> Optional[str]:
+    if isinstance(name, dict):
+        return '|'.join(str(v) for v in name.values())
+    return name
 
-    Returns:
-        Any: data
-    """
 
-    def generator_wrapper(generator):
-        yield from generator
+def generate_projection(
+    model: Type['MongoModel'],
+    only: Union[list, tuple, None] = None,
+    exclude: Union[list, tuple, None] = None,
+) -> Optional[Dict[str, int]]:
+    """projection for find queries
 
-    def main_wrapper(*args, **kwargs):
-        counter = 1
-        while True:
-            try:
-                result = func(*args, **kwargs)
-                if isinstance(result, GeneratorType):
-                    result = generator_wrapper(result)
-                return result
-            except (
-                AutoReconnect,
-                ServerSelectionTimeoutError,
-                NetworkTimeout,
-                ConnectionFailure,
-            ) as e:
-                counter += 1
-                if counter > 5:
-                    raise MongoConnectionError(str(e))
-                sleep(counter)
-
-    return main_wrapper
+    Args:
+        model (Type[MongoModel]): mongo model class
+        only (Union[list, tuple, None], optional): fields to fetch. Defaults to None.
+        exclude (Union[list, tuple, None], optional): fields to skip. Defaults to None.
 
+    Raises:
+        MongoValidationError: if only and exclude passed together
+        NotDeclaredField: if field not declared in model
 
-def generate_name_field(name: Union[dict, str, None] = None) -> Optional[str]:
-    if isinstance(name, dict):
-        return '|'.join(str(v) for v in name.values())
-    return name
+    Returns:
+        Optional[Dict[str, int]]: pymongo projection
+    """
+    if only and exclude:
+        raise MongoValidationError('only and exclude cannot be used together')
+    fields = only or exclude
+    if not fields:
+        return None
+    for field in fields:
+        name = field.split('.')[0]
+        if name not in model.__fields__ and name != '_id':
+            raise NotDeclaredField(name, list(model.__fields__.keys()))
+    value = 1 if only else 0
+    return {field: value for field in fields}
 
 
 def sort_validation(
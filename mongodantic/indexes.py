@@ -0,0 +1,837 @@
+import json
+from collections import Counter
+from logging import getLogger
+from threading import Event, Lock, Thread
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    IO,
+    TYPE_CHECKING,
+)
+
+from pymongo import IndexModel
+from pymongo.errors import OperationFailure
+
+from .monitoring import QueryEvent, QueryListener
+
+if TYPE_CHECKING:
+    from .models import MongoModel
+
+__all__ = (
+    'QueryShape',
+    'ShapeRecorder',
+    'IndexReport',
+    'load_shapes',
+    'advise_indexes',
+    'IndexPlan',
+    'IndexSyncTask',
+    'plan_indexes',
+)
+
+logger = getLogger('mongodantic')
+
+IndexKeys = Tuple[Tuple[str, Any], ...]
+
+SHAPE_METHODS: Tuple[str, ...] = (
+    'find',
+    'find_one',
+    'count_documents',
+    'aggregate',
+    'update_one',
+    'update_many',
+    'replace_one',
+    'delete_one',
+    'delete_many',
+    'find_one_and_update',
+    'find_one_and_replace',
+    'find_one_and_delete',
+)
+
+_EQUALITY_OPERATORS = frozenset(('$eq', '$in', '$elemMatch', '$all', '$size'))
+# index options which change index semantics, such indexes are never reported as excess
+_SEMANTIC_OPTIONS = (
+    'unique',
+    'sparse',
+    'partialFilterExpression',
+    'expireAfterSeconds',
+    'collation',
+)
+
+
+class QueryShape(object):
+    """normalized query: equality fields, sort and range fields
+
+    Args:
+        model (str): model name
+        collection (str): collection name
+        equality (Iterable[str]): fields compared by value, $eq or $in
+        sort (Iterable[Tuple[str, int]]): sort fields and directions
+        range (Iterable[str]): fields with range or other operators
+    """
+
+    __slots__ = ('model', 'collection', 'equality', 'sort', 'range')
+
+    def __init__(
+        self,
+        model: str,
+        collection: str,
+        equality: Iterable[str] = (),
+        sort: Iterable[Tuple[str, int]] = (),
+        range: Iterable[str] = (),
+    ):
+        self.model = model
+        self.collection = collection
+        self.equality: Tuple[str, ...] = tuple(sorted(set(equality)))
+        self.sort: Tuple[Tuple[str, int], ...] = tuple(
+            (field, int(direction)) for field, direction in sort
+        )
+        self.range: Tuple[str, ...] = tuple(
+            sorted(set(range) - set(self.equality))
+        )
+
+    def _key(self) -> Tuple:
+        return (self.model, self.collection, self.equality, self.sort, self.range)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, QueryShape) and self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self):
+        return (
+            f'QueryShape({self.model}, equality={list(self.equality)}, '
+            f'sort={list(self.sort)}, range={list(self.range)})'
+        )
+
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        return self.equality + tuple(f for f, _ in self.sort) + self.range
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'model': self.model,
+            'collection': self.collection,
+            'equality': list(self.equality),
+            'sort': [list(item) for item in self.sort],
+            'range': list(self.range),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'QueryShape':
+        return cls(
+            data['model'],
+            data['collection'],
+            data.get('equality', ()),
+            [tuple(item) for item in data.get('sort', ())],
+            data.get('range', ()),
+        )
+
+    def recommended_keys(self) -> IndexKeys:
+        """index keys by ESR rule: equality fields, sort fields, range fields"""
+        keys: List[Tuple[str, Any]] = [(field, 1) for field in self.equality]
+        keys.extend(item for item in self.sort if item[0] not in self.equality)
+        used = {field for field, _ in keys}
+        keys.extend((field, 1) for field in self.range if field not in used)
+        return tuple(keys)
+
+
+def _classify(
+    filter_: Dict, equality: Dict[str, None], range_: Dict[str, None]
+) -> List[Dict]:
+    """split filter fields into equality and range, returns $or branches"""
+    branches: List[Dict] = []
+    for key, value in filter_.items():
+        if key == '$and':
+            for item in value:
+                branches.extend(_classify(item, equality, range_))
+        elif key == '$or':
+            branches.extend(value)
+        elif key.startswith('$'):
+            # $expr, $text, $where and $nor are not matched with indexes here
+            continue
+        elif (
+            isinstance(value, dict)
+            and value
+            and all(isinstance(op, str) and op.startswith('$') for op in value)
+        ):
+            if set(value) <= _EQUALITY_OPERATORS:
+                equality[key] = None
+            else:
+                range_[key] = None
+        else:
+            equality[key] = None
+    return branches
+
+
+def _filter_shapes(
+    model: str, collection: str, filter_: Any, sort: Iterable[Tuple[str, int]]
+) -> List[QueryShape]:
+    if not isinstance(filter_, dict):
+        filter_ = {}
+    equality: Dict[str, None] = {}
+    range_: Dict[str, None] = {}
+    branches = _classify(filter_, equality, range_)
+    sort = list(sort)
+    if not branches:
+        return [QueryShape(model, collection, equality, sort, range_)]
+    shapes = []
+    # every $or clause is planned separately with own index
+    for branch in branches:
+        branch_equality = dict(equality)
+        branch_range = dict(range_)
+        _classify(branch, branch_equality, branch_range)
+        shapes.append(QueryShape(model, collection, branch_equality, sort, branch_range))
+    return shapes
+
+
+def _sort_items(sort: Any) -> List[Tuple[str, int]]:
+    if not sort:
+        return []
+    items = sort.items() if isinstance(sort, dict) else sort
+    return [(field, direction) for field, direction in items]
+
+
+def extract_shapes(event: QueryEvent) -> List[QueryShape]:
+    """query shapes of driver call, leading $match and $sort stages for aggregate"""
+    model = event.model.__name__
+    collection = event.model._collection_name
+    if event.method_name == 'aggregate':
+        filter_: Dict = {}
+        sort: List[Tuple[str, int]] = []
+        for stage in event.query or ():
+            if '$match' in stage and not sort:
+                filter_ = {'$and': [filter_, stage['$match']]} if filter_ else stage['$match']
+            elif '$sort' in stage and not sort:
+                sort = _sort_items(stage['$sort'])
+            else:
+                break
+        shapes = _filter_shapes(model, collection, filter_, sort)
+    else:
+        shapes = _filter_shapes(
+            model, collection, event.query, _sort_items(event.options.get('sort'))
+        )
+    return [shape for shape in shapes if shape.fields]
+
+
+class ShapeRecorder(QueryListener):
+    """listener which counts query shapes of model querybuilders
+
+    Args:
+        methods (Tuple[str, ...], optional): driver methods. Defaults to find, count, aggregate, update and delete methods.
+    """
+
+    def __init__(self, methods: Tuple[str, ...] = SHAPE_METHODS):
+        self.methods = frozenset(methods)
+        self._counts: Counter = Counter()
+        self._lock = Lock()
+
+    def started(self, event: QueryEvent) -> None:
+        # shape is known before query is executed, lazy cursors are counted too
+        if event.method_name not in self.methods or event.retries:
+            return
+        shapes = extract_shapes(event)
+        with self._lock:
+            self._counts.update(shapes)
+
+    def shapes(self) -> Dict[QueryShape, int]:
+        with self._lock:
+            return dict(self._counts)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+    def dump(self, file: Union[str, IO[str]]) -> None:
+        """write shapes with counts as json lines, for `load_shapes` and offline `advise_indexes`
+
+        Args:
+            file (Union[str, IO[str]]): path or text file, path is appended
+        """
+        lines = [
+            json.dumps({**shape.to_dict(), 'count': count})
+            for shape, count in self.shapes().items()
+        ]
+        if isinstance(file, str):
+            with open(file, 'a') as f:
+                f.writelines(f'{line}\n' for line in lines)
+        else:
+            file.writelines(f'{line}\n' for line in lines)
+
+
+def load_shapes(file: Union[str, IO[str]]) -> Dict[QueryShape, int]:
+    """read shape log written by `ShapeRecorder.dump`, counts of equal shapes are summed
+
+    Args:
+        file (Union[str, IO[str]]): path or text file
+
+    Returns:
+        Dict[QueryShape, int]: shapes with counts
+    """
+
+    def read(lines: Iterable[str]) -> Dict[QueryShape, int]:
+        counts: Counter = Counter()
+        for line in lines:
+            if line.strip():
+                data = json.loads(line)
+                counts[QueryShape.from_dict(data)] += data.get('count', 1)
+        return dict(counts)
+
+    if isinstance(file, str):
+        with open(file) as f:
+            return read(f)
+    return read(file)
+
+
+def _index_keys(index: IndexModel) -> IndexKeys:
+    return tuple(index.document['key'].items())
+
+
+def _is_btree(keys: IndexKeys) -> bool:
+    return all(isinstance(direction, int) for _, direction in keys)
+
+
+def _is_prefix(prefix: IndexKeys, keys: IndexKeys) -> bool:
+    """prefix keys in the same or in all reversed directions"""
+    if len(prefix) > len(keys) or not _is_btree(prefix) or not _is_btree(keys):
+        return False
+    head = keys[: len(prefix)]
+    return head == prefix or head == tuple((f, -d) for f, d in prefix)
+
+
+def supports(keys: IndexKeys, shape: QueryShape) -> bool:
+    """index serves shape by ESR rule: all equality fields are index prefix,
+    sort follows in index order (or reversed) and then the first range field"""
+    fields = [field for field, _ in keys]
+    equality = set(shape.equality)
+    i = 0
+    while i < len(fields) and fields[i] in equality:
+        equality.discard(fields[i])
+        i += 1
+    if equality:
+        return False
+    direction = None
+    for field, order in shape.sort:
+        if field in shape.equality:
+            continue
+        if i >= len(keys) or fields[i] != field or not isinstance(keys[i][1], int):
+            return False
+        if direction is None:
+            direction = keys[i][1] * order
+        elif direction != keys[i][1] * order:
+            return False
+        i += 1
+    if shape.range and (i >= len(fields) or fields[i] not in shape.range):
+        return False
+    return True
+
+
+class IndexReport(object):
+    """result of `advise_indexes`
+
+    `missing` - recommended keys with shapes which have no supporting index,
+    `redundant` - declared indexes which are not used by recorded shapes,
+    `shadowed` - declared indexes which are prefix of other declared index.
+    Indexes with unique, sparse, partial, TTL or collation options are never
+    reported as redundant or shadowed.
+    """
+
+    def __init__(self):
+        self.missing: List[Dict[str, Any]] = []
+        self.redundant: List[Dict[str, Any]] = []
+        self.shadowed: List[Dict[str, Any]] = []
+
+    def __bool__(self) -> bool:
+        return bool(self.missing or self.redundant or self.shadowed)
+
+    def __repr__(self):
+        return (
+            f'IndexReport(missing={len(self.missing)}, redundant={len(self.redundant)}, '
+            f'shadowed={len(self.shadowed)})'
+        )
+
+    def to_dict(self) -> Dict[str, List[Dict[str, Any]]]:
+        """json serializable report"""
+        return {
+            'missing': [
+                {**item, 'shapes': [shape.to_dict() for shape in item['shapes']]}
+                for item in self.missing
+            ],
+            'redundant': self.redundant,
+            'shadowed': self.shadowed,
+        }
+
+    def format(self) -> str:
+        """human readable report"""
+
+        def keys(items: Iterable) -> str:
+            return ', '.join(f'{field}: {direction}' for field, direction in items)
+
+        lines = []
+        for item in self.missing:
+            lines.append(
+                f"missing {item['model']} {{{keys(item['keys'])}}} "
+                f"for {len(item['shapes'])} shapes, {item['count']} queries"
+            )
+        for item in self.redundant:
+            lines.append(f"redundant {item['model']} {item['name']} - not used by shapes")
+        for item in self.shadowed:
+            lines.append(
+                f"shadowed {item['model']} {item['name']} - prefix of {item['shadowed_by']}"
+            )
+        return '\n'.join(lines)
+
+
+def _is_plain(index: IndexModel) -> bool:
+    document = index.document
+    return _is_btree(_index_keys(index)) and not any(
+        document.get(option) for option in _SEMANTIC_OPTIONS
+    )
+
+
+def _model_report(
+    model: Type['MongoModel'], shapes: Dict[QueryShape, int], report: IndexReport
+) -> None:
+    indexes: List[IndexModel] = list(getattr(model.__config__, 'indexes', []))
+    declared = [(index.document['name'], _index_keys(index)) for index in indexes]
+    available = [keys for _, keys in declared] + [(('_id', 1),)]
+
+    recommendations: List[Dict[str, Any]] = []
+    # longer recommendations first, they can serve shapes with shorter ones
+    ordered = sorted(
+        (shape for shape in shapes if not any(supports(k, shape) for k in available)),
+        key=lambda shape: (-len(shape.recommended_keys()), -shapes[shape]),
+    )
+    for shape in ordered:
+        for item in recommendations:
+            if supports(item['keys'], shape):
+                break
+        else:
+            item = {
+                'model': model.__name__,
+                'collection': model._collection_name,
+                'keys': shape.recommended_keys(),
+                'shapes': [],
+                'count': 0,
+            }
+            recommendations.append(item)
+        item['shapes'].append(shape)
+        item['count'] += shapes[shape]
+    report.missing.extend(sorted(recommendations, key=lambda item: -item['count']))
+
+    shadowed = set()
+    for position, (index, (name, keys)) in enumerate(zip(indexes, declared)):
+        if not _is_plain(index):
+            continue
+        for other_position, (other_name, other_keys) in enumerate(declared):
+            if other_position == position or not _is_prefix(keys, other_keys):
+                continue
+            # of equal indexes the later one is reported
+            if len(keys) == len(other_keys) and other_position > position:
+                continue
+            shadowed.add(name)
+            report.shadowed.append(
+                {
+                    'model': model.__name__,
+                    'collection': model._collection_name,
+                    'name': name,
+                    'keys': keys,
+                    'shadowed_by': other_name,
+                }
+            )
+            break
+
+    if not shapes:
+        return
+    used_fields = {field for shape in shapes for field in shape.fields}
+    for index, (name, keys) in zip(indexes, declared):
+        if name in shadowed or not _is_plain(index):
+            continue
+        if keys[0][0] not in used_fields:
+            report.redundant.append(
+                {
+                    'model': model.__name__,
+                    'collection': model._collection_name,
+                    'name': name,
+                    'keys': keys,
+                }
+            )
+
+
+def _iter_shapes(
+    shapes: Union[str, IO[str], Dict[QueryShape, int], ShapeRecorder]
+) -> Iterator[Tuple[QueryShape, int]]:
+    if isinstance(shapes, ShapeRecorder):
+        shapes = shapes.shapes()
+    elif not isinstance(shapes, dict):
+        shapes = load_shapes(shapes)
+    return iter(shapes.items())
+
+
+def advise_indexes(
+    models: Iterable[Type['MongoModel']],
+    shapes: Union[str, IO[str], Dict[QueryShape, int], ShapeRecorder],
+    min_count: int = 1,
+) -> IndexReport:
+    """compare recorded query shapes with `Config.indexes` of models,
+    database is not queried so it works offline with shape log
+
+    Args:
+        models (Iterable[Type[MongoModel]]): models with declared indexes
+        shapes (Union[str, IO[str], Dict[QueryShape, int], ShapeRecorder]): recorder, shapes or shape log path or file
+        min_count (int, optional): ignore shapes seen less times. Defaults to 1.
+
+    Returns:
+        IndexReport: missing, redundant and shadowed indexes
+    """
+    by_model: Dict[Tuple[str, str], Dict[QueryShape, int]] = {}
+    for shape, count in _iter_shapes(shapes):
+        if count >= min_count:
+            by_model.setdefault((shape.model, shape.collection), {})[shape] = count
+    report = IndexReport()
+    for model in models:
+        model_shapes = by_model.get((model.__name__, model._collection_name), {})
+        _model_report(model, model_shapes, report)
+    return report
+
+
+# options compared by reconciliation, other options like background do not change index
+_SPEC_OPTIONS: Dict[str, Any] = {
+    'unique': False,
+    'sparse': False,
+    'partialFilterExpression': None,
+    'expireAfterSeconds': None,
+    'collation': None,
+}
+
+
+def _normalize_direction(direction: Any) -> Any:
+    if isinstance(direction, (int, float)) and not isinstance(direction, bool):
+        return int(direction)
+    return direction
+
+
+def index_spec(document: Dict[str, Any]) -> Dict[str, Any]:
+    """comparable spec of index from IndexModel.document or list_indexes document
+
+    Text index keys are replaced by weights fields, because server stores them
+    as `_fts` and `_ftsx` keys.
+    """
+    keys = [
+        (field, _normalize_direction(direction))
+        for field, direction in document['key'].items()
+    ]
+    if 'weights' in document or any(direction == 'text' for _, direction in keys):
+        fields = set(document.get('weights') or ())
+        fields |= {
+            field for field, direction in keys if direction == 'text' and field != '_fts'
+        }
+        keys = [item for item in keys if item[1] != 'text' and item[0] not in ('_fts', '_ftsx')]
+        keys.append(('$text', tuple(sorted(fields))))
+    spec: Dict[str, Any] = {'key': tuple(keys)}
+    for option, default in _SPEC_OPTIONS.items():
+        value = document.get(option, default)
+        if option == 'expireAfterSeconds' and value is not None:
+            value = int(value)
+        spec[option] = default if value is None else value
+    return spec
+
+
+def _same_spec(declared: Dict[str, Any], existing: Dict[str, Any]) -> bool:
+    for option, value in declared.items():
+        other = existing[option]
+        if option == 'collation' and value and other:
+            # server returns collation with all defaults filled
+            if any(other.get(key) != item for key, item in value.items()):
+                return False
+        elif option in ('unique', 'sparse'):
+            if bool(value) != bool(other):
+                return False
+        elif value != other:
+            return False
+    return True
+
+
+class IndexPlan(object):
+    """operations to make collection indexes equal to declared ones
+
+    `rebuild` indexes are dropped before `create_indexes` call because server
+    rejects index with the same name or keys and other options, `drop`
+    indexes are dropped after new indexes are built. While `rebuild` index is
+    dropped and built again, its replacement with temporary name keeps queries
+    and unique constraint covered, if server rejects the replacement (same keys
+    with other options) the index is missing until the build is finished.
+    """
+
+    def __init__(self):
+        self.create: List[IndexModel] = []
+        self.rebuild: List[IndexModel] = []
+        self.rebuild_drop: List[str] = []
+        self.drop: List[str] = []
+        self.unchanged: List[str] = []
+
+    def __bool__(self) -> bool:
+        return bool(self.create or self.rebuild or self.drop)
+
+    def __repr__(self):
+        return (
+            f'IndexPlan(create={[i.document["name"] for i in self.create]}, '
+            f'rebuild={[i.document["name"] for i in self.rebuild]}, drop={self.drop})'
+        )
+
+    @property
+    def steps(self) -> int:
+        """count of driver calls to execute plan, all indexes are built by one call,
+        replacements of rebuilt indexes are built and dropped one by one"""
+        return (
+            2 * len(self.rebuild)
+            + len(self.rebuild_drop)
+            + bool(self.create or self.rebuild)
+            + len(self.drop)
+        )
+
+
+# server codes of index with the same keys or name and other options
+_INDEX_CONFLICT_CODES = (85, 86)
+
+
+def _replacement_index(index: IndexModel) -> IndexModel:
+    """copy of index with temporary name, it covers queries while index is rebuilt"""
+    options = dict(index.document)
+    keys = list(options.pop('key').items())
+    options['name'] = f'{options["name"]}__rebuild'
+    return IndexModel(keys, **options)
+
+
+def plan_indexes(
+    declared: Iterable[IndexModel],
+    existing: Iterable[Dict[str, Any]],
+    drop_unknown: bool = True,
+) -> IndexPlan:
+    """compare declared indexes with list_indexes documents by full spec
+
+    Args:
+        declared (Iterable[IndexModel]): indexes from Config.indexes
+        existing (Iterable[Dict[str, Any]]): documents of list_indexes
+        drop_unknown (bool, optional): drop indexes which are not declared. Defaults to True.
+
+    Returns:
+        IndexPlan: planned operations
+    """
+    plan = IndexPlan()
+    current = {
+        document['name']: index_spec(document)
+        for document in existing
+        if document['name'] != '_id_'
+    }
+    matched = set()
+    for index in declared:
+        name = index.document['name']
+        spec = index_spec(index.document)
+        if name in current:
+            matched.add(name)
+            if _same_spec(spec, current[name]):
+                plan.unchanged.append(name)
+                continue
+            plan.rebuild.append(index)
+            plan.rebuild_drop.append(name)
+            continue
+        plan.create.append(index)
+        for other_name, other_spec in current.items():
+            # index with the same keys and other name conflicts with new one
+            if other_name not in matched and other_spec['key'] == spec['key']:
+                matched.add(other_name)
+                plan.rebuild_drop.append(other_name)
+    if drop_unknown:
+        plan.drop = [name for name in current if name not in matched]
+    return plan
+
+
+class IndexSyncTask(object):
+    """reconciliation of model indexes, runs inline by `run` or in daemon thread by `start`
+
+    `progress` is dict with phase (pending, planning, replacing, dropping,
+    creating, cleanup, done or failed) and count of done and total steps, it is
+    passed to `on_progress` callback on every change.
+
+    Args:
+        model (Type[MongoModel]): model with Config.indexes
+        drop_unknown (bool, optional): drop indexes which are not declared. Defaults to True.
+        on_progress (Optional[Callable[[Dict[str, Any]], None]], optional): progress callback. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        model: Type['MongoModel'],
+        drop_unknown: bool = True,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ):
+        self.model = model
+        self.drop_unknown = drop_unknown
+        self.on_progress = on_progress
+        self.plan: Optional[IndexPlan] = None
+        self.error: Optional[BaseException] = None
+        self.progress: Dict[str, Any] = {'phase': 'pending', 'done': 0, 'total': 0}
+        self._finished = Event()
+        self._thread: Optional[Thread] = None
+
+    def __repr__(self):
+        return f'IndexSyncTask({self.model.__name__}, {self.progress})'
+
+    def _report(self, phase: Optional[str] = None, step: bool = False) -> None:
+        progress = dict(self.progress)
+        if phase is not None:
+            progress['phase'] = phase
+        if step:
+            progress['done'] += 1
+        self.progress = progress
+        if self.on_progress is not None:
+            try:
+                self.on_progress(dict(progress))
+            except Exception:
+                logger.exception('index progress callback failed')
+
+    def run(self) -> IndexPlan:
+        """plan and execute index operations in current thread
+
+        Returns:
+            IndexPlan: executed plan
+        """
+        try:
+            return self._run()
+        except BaseException as e:
+            self.error = e
+            self._report('failed')
+            raise
+        finally:
+            self._finished.set()
+
+    def _run(self) -> IndexPlan:
+        model = self.model
+        declared = list(getattr(model.__config__, 'indexes', []))
+        if not all(isinstance(index, IndexModel) for index in declared):
+            raise ValueError('indexes must be list of IndexModel instances')
+        if not declared:
+            self.plan = IndexPlan()
+            model.__indexes__ = set()
+            self._report('done')
+            return self.plan
+        self._report('planning')
+        existing = model.Q.list_indexes()
+        plan = self.plan = plan_indexes(declared, existing, self.drop_unknown)
+        self.progress['total'] = plan.steps
+        replacements = []
+        for index in plan.rebuild:
+            self._report('replacing')
+            replacement = _replacement_index(index)
+            try:
+                model.Q.create_indexes([replacement])
+                replacements.append(replacement.document['name'])
+            except OperationFailure as e:
+                if e.code not in _INDEX_CONFLICT_CODES:
+                    raise
+                logger.warning(
+                    'index %s of %s is missing until it is rebuilt: %s',
+                    index.document['name'],
+                    model.__name__,
+                    e,
+                )
+            self._report(step=True)
+        for name in plan.rebuild_drop:
+            self._report('dropping')
+            model.Q.drop_index(name, check=False)
+            self._report(step=True)
+        if plan.create or plan.rebuild:
+            self._report('creating')
+            model.Q.create_indexes(plan.create + plan.rebuild)
+            self._report(step=True)
+        for name in replacements:
+            self._report('cleanup')
+            model.Q.drop_index(name, check=False)
+            self._report(step=True)
+        # replacements are not built or already dropped
+        self.progress['done'] += len(plan.rebuild) - len(replacements)
+        for name in plan.drop:
+            self._report('cleanup')
+            model.Q.drop_index(name, check=False)
+            self._report(step=True)
+        dropped = set(plan.drop) | (set(plan.rebuild_drop) - {
+            index.document['name'] for index in plan.rebuild
+        })
+        model.__indexes__ = (
+            {document['name'] for document in existing} - dropped
+        ) | {index.document['name'] for index in declared}
+        self._report('done')
+        return plan
+
+    def _run_quietly(self) -> None:
+        try:
+            self.run()
+        except BaseException:
+            logger.exception('indexes of %s are not synchronized', self.model.__name__)
+
+    def start(self) -> 'IndexSyncTask':
+        """run in background daemon thread
+
+        Returns:
+            IndexSyncTask: self
+        """
+        self._thread = Thread(
+            target=self._run_quietly,
+            name=f'mongodantic-indexes-{self.model.__name__}',
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def done(self) -> bool:
+        return self._finished.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[IndexPlan]:
+        """wait for task, error of background run is raised
+
+        Args:
+            timeout (Optional[float], optional): seconds. Defaults to None - no limit.
+
+        Returns:
+            Optional[IndexPlan]: executed plan, None if timeout is expired
+        """
+        if not self._finished.wait(timeout):
+            return None
+        if self.error is not None:
+            raise self.error
+        return self.plan
+
+    def build_progress(self) -> List[Dict[str, Any]]:
+        """server progress of running index builds of collection from currentOp
+
+        Returns:
+            List[Dict[str, Any]]: msg and done, total keys of builds, empty if unknown
+        """
+        collection = self.model._collection
+        try:
+            result = collection.database.client.admin.command(
+                {
+                    'currentOp': True,
+                    'command.createIndexes': collection.name,
+                    'command.$db': collection.database.name,
+                }
+            )
+        except Exception:
+            return []
+        return [
+            {
+                'msg': operation.get('msg'),
+                'done': operation.get('progress', {}).get('done'),
+                'total': operation.get('progress', {}).get('total'),
+            }
+            for operation in result.get('inprog', ())
+        ]
@@ -1,15 +1,49 @@
-import os
-import json
+from datetime import date, time, timedelta
+from decimal import Decimal
+from enum import Enum
 from logging import getLogger
-from typing import Dict, Any, Union, Optional, List, Tuple, Set, TYPE_CHECKING
+from uuid import UUID
+from typing import (
+    Dict,
+    Any,
+    Union,
+    Optional,
+    List,
+    Tuple,
+    Set,
+    Generator,
+    Iterable,
+    Callable,
+    FrozenSet,
+    TYPE_CHECKING,
+)
 from pymongo.client_session import ClientSession
 from bson import ObjectId
 from pydantic.main import ModelMetaclass as PydanticModelMetaclass
-from pydantic import BaseModel as BasePydanticModel
+from pydantic import BaseModel as BasePydanticModel, ValidationError, PrivateAttr
+from pydantic.fields import (
+    ModelField,
+    SHAPE_DEFAULTDICT,
+    SHAPE_DEQUE,
+    SHAPE_DICT,
+    SHAPE_FROZENSET,
+    SHAPE_LIST,
+    SHAPE_MAPPING,
+    SHAPE_SET,
+    SHAPE_SINGLETON,
+    SHAPE_TUPLE,
+    SHAPE_TUPLE_ELLIPSIS,
+)
+from pydantic.typing import is_literal_type
 from pymongo.collection import Collection
-from pymongo import IndexModel, database
+from pymongo import database
 
-from .connection import _DBConnection, _get_connection
+from .connection import (
+    _DBConnection,
+    _get_connection,
+    _connection_settings,
+    _connection_state,
+)
 from .types import ObjectIdStr
 from .exceptions import (
     NotDeclaredField,
@@ -18,12 +52,20 @@ from .exceptions import (
 )
 from .helpers import (
     ExtraQueryMapper,
+    LRUCache,
     classproperty,
     _validate_value,
 )
-from .querybuilder import QueryBuilder, AsyncQueryBuilder
+from .querybuilder import QueryBuilder, AsyncQueryBuilder, MotorQueryBuilder
+from .indexes import IndexSyncTask
 from .logical import LogicalCombination, Query
 from .connection import get_connection_env
+from .encoders import json_dumps
+from .cache import (
+    DEFAULT_RESULT_CACHE_SIZE,
+    MemoryCacheBackend,
+    ResultCache,
+)
 
 if TYPE_CHECKING:
     from pydantic.typing import DictStrAny
@@ -33,6 +75,120 @@ __all__ = ('MongoModel', 'Query')
 
 logger = getLogger('mongodantic')
 
+COLLECTION_OPTIONS = ('codec_options', 'read_preference', 'write_concern', 'read_concern')
+DEFAULT_QUERY_PLAN_CACHE_SIZE = 256
+DEFAULT_COUNT_CACHE_SIZE = 256
+
+_EXCLUDED_PROPERTIES = (
+    "__values__",
+    "fields",
+    "data",
+    "_connection",
+    "_collection_name",
+    "_collection",
+    "_motor_collection",
+    "querybuilder",
+    "Q",
+    "AQ",
+    "async_querybuilder",
+    "pk",
+    "query_data",
+    "fields_all",
+    "all_fields",
+)
+
+
+def _collect_properties(cls: type) -> Tuple[str, ...]:
+    """names of model properties, resolved without touching class attributes,
+    first definition of name in MRO wins, so overridden properties are skipped"""
+    definitions: Dict[str, Any] = {}
+    for klass in cls.__mro__:
+        for name, value in vars(klass).items():
+            definitions.setdefault(name, value)
+    return tuple(
+        sorted(
+            name
+            for name, value in definitions.items()
+            if isinstance(value, property) and name not in _EXCLUDED_PROPERTIES
+        )
+    )
+
+
+def _build_result_cache(config: Any) -> Optional[ResultCache]:
+    """result cache from Config.result_cache, result_cache_ttl, result_cache_size
+    and result_cache_backend"""
+    if not getattr(config, 'result_cache', False):
+        return None
+    backend = getattr(config, 'result_cache_backend', None) or MemoryCacheBackend(
+        getattr(config, 'result_cache_size', DEFAULT_RESULT_CACHE_SIZE)
+    )
+    return ResultCache(backend, getattr(config, 'result_cache_ttl', None))
+
+
+def _fingerprint(value: Any) -> int:
+    return hash(repr(value))
+
+
+# values of these types are changed only by assignment
+_IMMUTABLE_TYPES = (
+    str,
+    bytes,
+    int,
+    float,
+    Decimal,
+    date,
+    time,
+    timedelta,
+    ObjectId,
+    UUID,
+    Enum,
+)
+_SNAPSHOT_TYPES = (list, dict, set)
+_SNAPSHOT_SHAPES = (
+    SHAPE_LIST,
+    SHAPE_SET,
+    SHAPE_DICT,
+    SHAPE_MAPPING,
+    SHAPE_DEFAULTDICT,
+    SHAPE_DEQUE,
+)
+
+
+def _is_immutable_field(field: ModelField) -> bool:
+    if field.shape in (SHAPE_TUPLE, SHAPE_TUPLE_ELLIPSIS, SHAPE_FROZENSET) or (
+        field.shape == SHAPE_SINGLETON and field.sub_fields
+    ):
+        return all(_is_immutable_field(sub_field) for sub_field in field.sub_fields or ())
+    if field.shape != SHAPE_SINGLETON:
+        return False
+    if is_literal_type(field.type_):
+        return True
+    return isinstance(field.type_, type) and issubclass(field.type_, _IMMUTABLE_TYPES)
+
+
+def _mutable_fields(cls: Any) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """split fields changeable in place by declared type
+
+    Returns:
+        Tuple[FrozenSet[str], FrozenSet[str]]: list, dict and set fields, which are
+            checked by snapshot hash, and fields of other mutable types (nested models,
+            Any), which are treated as changed in every save
+    """
+    snapshot, opaque = set(), set()
+    for name, field in cls.__fields__.items():
+        if _is_immutable_field(field):
+            continue
+        if field.shape in _SNAPSHOT_SHAPES or (
+            field.shape == SHAPE_SINGLETON
+            and not field.sub_fields
+            and isinstance(field.type_, type)
+            and issubclass(field.type_, _SNAPSHOT_TYPES)
+        ):
+            snapshot.add(name)
+        else:
+            opaque.add(name)
+    return frozenset(snapshot), frozenset(opaque)
+
 _is_mongo_model_class_defined = False
 
 
@@ -49,13 +205,61 @@ class ModelMetaclass(PydanticModelMetaclass):
             if async_querybuilder is None:
                 async_querybuilder = AsyncQueryBuilder(cls)  # type: ignore
                 setattr(cls, '__async_querybuilder__', async_querybuilder)
+            if getattr(cls, '__motor_querybuilder__') is None:
+                setattr(cls, '__motor_querybuilder__', MotorQueryBuilder(cls))  # type: ignore
             # setattr(cls, 'querybuilder', querybuilder)
         json_encoders = getattr(cls.Config, 'json_encoders', {})  # type: ignore
         json_encoders.update({ObjectId: lambda f: str(f)})
         setattr(cls.Config, 'json_encoders', json_encoders)  # type: ignore
         exclude_fields = getattr(cls.Config, 'exclude_fields', tuple())  # type: ignore
+        query_plan_cache_size = getattr(
+            cls.__config__, 'query_plan_cache_size', DEFAULT_QUERY_PLAN_CACHE_SIZE  # type: ignore
+        )
         setattr(cls, '__indexes__', indexes)
         setattr(cls, '__mongo_exclude_fields__', exclude_fields)
+        setattr(
+            cls, '__connection_env__', getattr(cls.__config__, 'connection_env', None)
+        )
+        setattr(
+            cls,
+            '__collection_options__',
+            {
+                option: getattr(cls.__config__, option)
+                for option in COLLECTION_OPTIONS
+                if getattr(cls.__config__, option, None) is not None
+            },
+        )
+        # connection and collection are cached per class, see MongoModel._connection
+        setattr(cls, '__connection__', None)
+        setattr(cls, '__connection_version__', None)
+        setattr(cls, '__collection__', None)
+        setattr(cls, '__motor_collection__', None)
+        setattr(cls, '__mongo_properties__', _collect_properties(cls))
+        setattr(
+            cls, '__dirty_tracking__', getattr(cls.__config__, 'dirty_tracking', True)
+        )
+        snapshot_fields, opaque_fields = _mutable_fields(cls)
+        setattr(cls, '__snapshot_fields__', snapshot_fields)
+        setattr(cls, '__opaque_fields__', opaque_fields)
+        setattr(
+            cls,
+            '__query_plan_cache__',
+            LRUCache(query_plan_cache_size) if query_plan_cache_size else None,
+        )
+        count_cache_ttl = getattr(cls.__config__, 'count_cache_ttl', None)
+        setattr(
+            cls,
+            '__count_cache__',
+            LRUCache(
+                getattr(cls.__config__, 'count_cache_size', DEFAULT_COUNT_CACHE_SIZE),
+                count_cache_ttl,
+            )
+            if count_cache_ttl
+            else None,
+        )
+        setattr(cls, '__result_cache__', _build_result_cache(cls.__config__))
+        # compiled bulk UpdateOne factories, see helpers.compile_bulk_query
+        setattr(cls, '__bulk_query_cache__', {})
         return cls
 
 
@@ -63,49 +267,151 @@ class MongoModel(BasePydanticModel, metaclass=ModelMetaclass):
     __indexes__: Set['str'] = set()
     __mongo_exclude_fields__: Union[Tuple, List] = tuple()
     __connection__: Optional[_DBConnection] = None
+    __connection_env__: Optional[str] = None
+    __connection_version__: Optional[int] = None
+    __collection__: Optional[Collection] = None
+    __collection_options__: Dict[str, Any] = {}
+    __motor_collection__: Any = None
     __querybuilder__: Optional[QueryBuilder] = None
     __async_querybuilder__: Optional[AsyncQueryBuilder] = None
+    __motor_querybuilder__: Optional[MotorQueryBuilder] = None
+    __query_plan_cache__: Optional[LRUCache] = None
+    __count_cache__: Optional[LRUCache] = None
+    __result_cache__: Optional[ResultCache] = None
+    __bulk_query_cache__: Dict[Tuple[Tuple[str, ...], Tuple[str, ...]], Tuple] = {}
+    __mongo_properties__: Tuple[str, ...] = tuple()
+    __dirty_tracking__: bool = True
+    __snapshot_fields__: FrozenSet[str] = frozenset()
+    __opaque_fields__: FrozenSet[str] = frozenset()
     _id: Optional[ObjectIdStr] = None
+    # None until object is loaded from or saved to db
+    _dirty_fields: Optional[Set[str]] = PrivateAttr(None)
+    _snapshot: Optional[Dict[str, int]] = PrivateAttr(None)
 
     def __setattr__(self, key, value):
         if key in self.__fields__:
+            if self._dirty_fields is not None:
+                self._dirty_fields.add(key)
             return super().__setattr__(key, value)
         self.__dict__[key] = value
         return value
 
+    def _track_changes(self, fields: Optional[Iterable[str]] = None) -> None:
+        """start dirty tracking, current values are treated as stored in db
+
+        Args:
+            fields (Optional[Iterable[str]], optional): loaded fields, None - all fields. Defaults to None.
+        """
+        if not self.__dirty_tracking__:
+            return
+        object.__setattr__(self, '_dirty_fields', set())
+        object.__setattr__(self, '_snapshot', {})
+        self._mark_saved(self.__fields__ if fields is None else fields)
+
+    def _mark_saved(self, fields: Iterable[str]) -> None:
+        fields = tuple(fields)
+        if self._dirty_fields is None:
+            # untracked object becomes tracked when all fields are saved
+            if self.__dirty_tracking__ and set(self.__fields__) <= set(fields):
+                self._track_changes()
+            return
+        snapshot_fields = self.__snapshot_fields__
+        for name in fields:
+            self._dirty_fields.discard(name)
+            if name in snapshot_fields:
+                self._snapshot[name] = _fingerprint(self.__dict__.get(name))  # type: ignore
+
+    def get_dirty_fields(self) -> Optional[Set[str]]:
+        """fields changed since object was loaded or saved, in-place changes
+        of list, dict and set fields are detected by snapshot hash,
+        nested models and Any fields are always treated as changed
+
+        Returns:
+            Optional[Set[str]]: changed fields, None if object is not tracked
+        """
+        if self._dirty_fields is None:
+            return None
+        dirty = set(self._dirty_fields)
+        dirty.update(name for name in self.__opaque_fields__ if name in self.__dict__)
+        for name, fingerprint in self._snapshot.items():  # type: ignore
+            if name not in dirty and _fingerprint(self.__dict__.get(name)) != fingerprint:
+                dirty.add(name)
+        return dirty
+
+    def copy(self, *args, **kwargs) -> 'MongoModel':  # type: ignore
+        obj = super().copy(*args, **kwargs)
+        if obj._dirty_fields is not None:
+            # copy tracks own changes
+            object.__setattr__(obj, '_dirty_fields', set(obj._dirty_fields))
+            object.__setattr__(obj, '_snapshot', dict(obj._snapshot))  # type: ignore
+        return obj
+
     @classmethod
     def _get_properties(cls) -> list:
-        return [
-            prop
-            for prop in dir(cls)
-            if prop
-            not in (
-                "__values__",
-                "fields",
-                "data",
-                "_connection",
-                "_collection_name",
-                "_collection",
-                "querybuilder",
-                "Q",
-                "AQ",
-                "async_querybuilder",
-                "pk",
-                "query_data",
-                "fields_all",
-                "all_fields",
-            )
-            and isinstance(getattr(cls, prop), property)
-        ]
+        return list(cls.__mongo_properties__)
+
+    @classmethod
+    def _filter_properties(
+        cls,
+        include: Optional['AbstractSetIntStr'] = None,
+        exclude: Optional['AbstractSetIntStr'] = None,
+    ) -> Tuple[str, ...]:
+        props = cls.__mongo_properties__
+        if include:
+            props = tuple(prop for prop in props if prop in include)
+        if exclude:
+            props = tuple(prop for prop in props if prop not in exclude)
+        return props
 
     @classmethod
     def parse_obj(cls, data: Any) -> Any:
         obj = super().parse_obj(data)
         if '_id' in data:
             obj._id = data['_id']
+            obj._track_changes()
         # print(reference_fields)
         return obj
 
+    @classmethod
+    def _construct_obj(cls, data: Dict) -> Any:
+        """build model from trusted document without validation"""
+        return cls.construct(**data)
+
+    @classmethod
+    def _parse_partial(cls, data: Dict) -> Any:
+        """build model from projected document, only present fields are validated
+
+        Args:
+            data (Dict): document from mongo
+
+        Returns:
+            MongoModel: partial model, fields absent in document are not set,
+                defaults are not filled, so `data` and `save` skip them
+        """
+        values: Dict = {}
+        errors = []
+        for name, field in cls.__fields__.items():
+            if field.alias not in data:
+                continue
+            value, error = field.validate(
+                data[field.alias], values, loc=field.alias, cls=cls  # type: ignore
+            )
+            if error:
+                errors.append(error)
+            else:
+                values[name] = value
+        if errors:
+            raise ValidationError(errors, cls)  # type: ignore
+        obj = cls.construct(_fields_set=set(values), **values)
+        for name in cls.__fields__:
+            if name not in values:
+                # defaults of unfetched fields are not stored values
+                obj.__dict__.pop(name, None)
+        if '_id' in data:
+            obj._id = data['_id']
+            obj._track_changes(values)
+        return obj
+
     @classmethod
     def __validate_field(cls, field: str) -> bool:
         if field not in cls.__fields__ and field != '_id':
@@ -126,38 +432,121 @@ class MongoModel(BasePydanticModel, metaclass=ModelMetaclass):
         return field_param, extra
 
     @classmethod
-    def _validate_query_data(cls, query: Dict) -> 'DictStrAny':
-        """main validation method
+    def _compile_query_plan(cls, query_fields: Tuple[str, ...]) -> Tuple:
+        """split query keys into reusable plan, only values are handled later
 
         Args:
-            query (Dict): basic query
+            query_fields (Tuple[str, ...]): query keys like ('name', 'position__gte')
 
         Returns:
-            Dict: parsed query
+            Tuple: plan steps
         """
-        data = {}
-        for query_field, value in query.items():
+        plan = []
+        for query_field in query_fields:
             field, *extra_params = query_field.split("__")
             inners, extra_params = cls._parse_extra_params(extra_params)
             if not cls.__validate_field(field):
                 continue
-            extra = ExtraQueryMapper(cls, field).extra_query(extra_params, value)
-            if extra:
-                value = extra[field]
+            target = f'{field}.{".".join(i for i in inners)}' if inners else field
+            mapper = ExtraQueryMapper(cls, field) if extra_params else None
+            merge = mapper is not None and (
+                '__gt' in query_field or '__lt' in query_field
+            )
+            plan.append(
+                (query_field, field, target, mapper, extra_params, bool(inners), merge)
+            )
+        return tuple(plan)
+
+    @classmethod
+    def _get_query_plan(cls, query_fields: Tuple[str, ...]) -> Tuple:
+        cache = cls.__query_plan_cache__
+        if cache is None:
+            return cls._compile_query_plan(query_fields)
+        plan = cache.get(query_fields)
+        if plan is None:
+            plan = cls._compile_query_plan(query_fields)
+            cache.set(query_fields, plan)
+        return plan
+
+    @classmethod
+    def query_plan_cache_info(cls) -> Dict[str, int]:
+        """query plan cache statistics
+
+        Returns:
+            Dict[str, int]: hits, misses, maxsize and currsize
+        """
+        cache = cls.__query_plan_cache__
+        if cache is None:
+            return {'hits': 0, 'misses': 0, 'maxsize': 0, 'currsize': 0}
+        return cache.info()
+
+    @classmethod
+    def count_cache_info(cls) -> Dict[str, int]:
+        """find_with_count cache statistics, cache is enabled by Config.count_cache_ttl
+
+        Returns:
+            Dict[str, int]: hits, misses, maxsize and currsize
+        """
+        cache = cls.__count_cache__
+        if cache is None:
+            return {'hits': 0, 'misses': 0, 'maxsize': 0, 'currsize': 0}
+        return cache.info()
+
+    @classmethod
+    def clear_count_cache(cls) -> None:
+        """drop cached counts, e.g. after bulk writes"""
+        if cls.__count_cache__ is not None:
+            cls.__count_cache__.clear()
+
+    @classmethod
+    def result_cache_info(cls) -> Dict[str, int]:
+        """find_one, get, count and distinct cache statistics, cache is enabled by Config.result_cache
+
+        Returns:
+            Dict[str, int]: hits, misses and invalidations
+        """
+        cache = cls.__result_cache__
+        if cache is None:
+            return {'hits': 0, 'misses': 0, 'invalidations': 0}
+        return cache.info()
+
+    @classmethod
+    def clear_result_cache(cls) -> None:
+        """drop cached results of model, needed after writes made outside of model"""
+        if cls.__result_cache__ is not None:
+            cls.__result_cache__.invalidate(cls.Q._result_cache_namespace())
+
+    @classmethod
+    def _validate_query_data(cls, query: Dict) -> 'DictStrAny':
+        """main validation method
+
+        Args:
+            query (Dict): basic query
+
+        Returns:
+            Dict: parsed query
+        """
+        data: Dict = {}
+        for (
+            query_field,
+            field,
+            target,
+            mapper,
+            extra_params,
+            inners,
+            merge,
+        ) in cls._get_query_plan(tuple(query)):
+            value = query[query_field]
+            if mapper is not None:
+                value = mapper.extra_query(extra_params, value)[field]
             elif field == '_id':
                 value = ObjectId(value)
+            elif not inners:
+                value = _validate_value(cls, field, value)
+            if merge and target in data:
+                data[target].update(value)
             else:
-                value = _validate_value(cls, field, value) if not inners else value
-            if inners:
-                field = f'{field}.{".".join(i for i in inners)}'
-            if (
-                extra
-                and field in data
-                and ('__gt' in query_field or '__lt' in query_field)
-            ):
-                data[field].update(value)
-            else:
-                data[field] = value
+                data[target] = value
         return data
 
     @classproperty
@@ -225,19 +614,46 @@ class MongoModel(BasePydanticModel, metaclass=ModelMetaclass):
             exclude_none=exclude_none,
         )
         if with_props:
-            props = self._get_properties()
-            # Include and exclude properties
-            if include:
-                props = [prop for prop in props if prop in include]
-            if exclude:
-                props = [prop for prop in props if prop not in exclude]
-
-            # Update the attribute dict with the properties
+            props = self._filter_properties(include, exclude)
             if props:
                 attribs.update({prop: getattr(self, prop) for prop in props})
 
         return attribs
 
+    @classmethod
+    def _data_generator(cls, objs: Iterable) -> Generator:
+        """bulk `data` for many objects, property list is resolved once,
+        objects of models with own `dict` use it"""
+        props = cls.__mongo_properties__
+        base_dict = BasePydanticModel.dict
+        for obj in objs:
+            if type(obj).dict is not MongoModel.dict:
+                yield obj._data()
+                continue
+            data = base_dict(obj)
+            for prop in props:
+                data[prop] = getattr(obj, prop)
+            if '_id' in data:
+                data['_id'] = data['_id'].__str__()
+            yield data
+
+    @classmethod
+    def _serialize_generator(
+        cls, objs: Iterable, fields: Union[Tuple, List]
+    ) -> Generator:
+        """bulk `serialize` for many objects, include filter is resolved once"""
+        include = set(fields)
+        props = cls._filter_properties(include)
+        base_dict = BasePydanticModel.dict
+        for obj in objs:
+            if type(obj).dict is not MongoModel.dict:
+                yield obj.serialize(fields)
+                continue
+            data = base_dict(obj, include=include)
+            for prop in props:
+                data[prop] = getattr(obj, prop)
+            yield {f: data[f] for f in fields}
+
     def _data(self, with_props: bool = True) -> 'DictStrAny':
         data = self.dict(with_props=with_props)
         if '_id' in data:
@@ -254,12 +670,22 @@ class MongoModel(BasePydanticModel, metaclass=ModelMetaclass):
 
     @classmethod
     def _get_connection(cls) -> _DBConnection:
-        return _get_connection(alias=str(os.getpid()), env_name=get_connection_env())
+        return _get_connection(
+            alias=_connection_state['pid'],
+            env_name=cls.__connection_env__ or get_connection_env(),
+        )
+
+    @classmethod
+    def _bind_connection(cls, connection: Optional[_DBConnection]) -> None:
+        cls.__connection__ = connection
+        cls.__collection__ = None
+        cls.__motor_collection__ = None
+        cls.__connection_version__ = _connection_state['version']
 
     @classproperty
     def _connection(cls) -> Optional[_DBConnection]:
-        if not cls.__connection__ or cls.__connection__._alias != str(os.getpid()):
-            cls.__connection__ = cls._get_connection()
+        if cls.__connection_version__ != _connection_state['version']:
+            cls._bind_connection(cls._get_connection())
         return cls.__connection__
 
     @classmethod
@@ -277,14 +703,25 @@ class MongoModel(BasePydanticModel, metaclass=ModelMetaclass):
 
     @classmethod
     def get_collection(cls) -> Collection:
+        """new collection object with codec_options, read_preference, write_concern
+        and read_concern from model Config, use `_collection` for cached one
+
+        Returns:
+            Collection: pymongo collection
+        """
         db = cls.get_database()
-        return db.get_collection(cls._collection_name)
+        return db.get_collection(cls._collection_name, **cls.__collection_options__)
+
+    @classmethod
+    def get_motor_collection(cls) -> Any:
+        db = cls._connection.get_motor_database()
+        return db.get_collection(cls._collection_name, **cls.__collection_options__)
 
     @classmethod
     def _reconnect(cls):
         if cls.__connection__:
-            cls.__connection__ = cls.__connection__._reconnect()
-        cls.__connection__ = cls._get_connection()
+            cls.__connection__._reconnect()
+        cls._bind_connection(cls._get_connection())
 
     @classproperty
     def _collection_name(cls) -> str:
@@ -292,7 +729,22 @@ class MongoModel(BasePydanticModel, metaclass=ModelMetaclass):
 
     @classproperty
     def _collection(cls) -> Collection:
-        return cls.get_collection()
+        # collection is resolved once per bound connection
+        if (
+            cls.__collection__ is None
+            or cls.__connection_version__ != _connection_state['version']
+        ):
+            cls.__collection__ = cls.get_collection()
+        return cls.__collection__
+
+    @classproperty
+    def _motor_collection(cls) -> Any:
+        if (
+            cls.__motor_collection__ is None
+            or cls.__connection_version__ != _connection_state['version']
+        ):
+            cls.__motor_collection__ = cls.get_motor_collection()
+        return cls.__motor_collection__
 
     @classproperty
     def Q(cls) -> Optional[QueryBuilder]:
@@ -300,6 +752,12 @@ class MongoModel(BasePydanticModel, metaclass=ModelMetaclass):
 
     @classproperty
     def AQ(cls) -> Optional[AsyncQueryBuilder]:
+        # driver is taken from connect settings, connection is not opened here
+        settings = _connection_settings.get(
+            cls.__connection_env__ or get_connection_env(), {}
+        )
+        if settings.get('async_driver') == 'motor':
+            return cls.__motor_querybuilder__
         return cls.__async_querybuilder__
 
     @classproperty
@@ -313,31 +771,66 @@ class MongoModel(BasePydanticModel, metaclass=ModelMetaclass):
         return cls.AQ
 
     @classmethod
-    def execute_indexes(cls):
-        """method for create/update/delete indexes if indexes declared in Config property"""
-
-        indexes = getattr(cls.__config__, 'indexes', [])
-        if not all([isinstance(index, IndexModel) for index in indexes]):
-            raise ValueError('indexes must be list of IndexModel instances')
-        if indexes:
-            db_indexes = cls.Q.check_indexes()
-            indexes_to_create = [
-                i for i in indexes if i.document['name'] not in db_indexes
-            ]
-            indexes_to_delete = [
-                i
-                for i in db_indexes
-                if i not in [i.document['name'] for i in indexes] and i != '_id_'
-            ]
-            result = []
-            if indexes_to_create:
-                result = cls.Q.create_indexes(indexes_to_create)
-            if indexes_to_delete:
-                for index_name in indexes_to_delete:
-                    cls.Q.drop_index(index_name)
-                db_indexes = cls.Q.check_indexes()
-            indexes = set(list(db_indexes.keys()) + result)
-        setattr(cls, '__indexes__', indexes)
+    def execute_indexes(
+        cls,
+        background: bool = False,
+        drop_unknown: bool = True,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> IndexSyncTask:
+        """create, rebuild and drop indexes to match indexes declared in Config property,
+        indexes are compared by keys, unique, sparse, partial filter, TTL and collation
+
+        Args:
+            background (bool, optional): run in daemon thread, startup is not blocked by index builds. Defaults to False.
+            drop_unknown (bool, optional): drop indexes which are not declared. Defaults to True.
+            on_progress (Optional[Callable[[Dict[str, Any]], None]], optional): called with progress dict. Defaults to None.
+
+        Returns:
+            IndexSyncTask: finished or started task with plan and progress
+        """
+        task = IndexSyncTask(cls, drop_unknown=drop_unknown, on_progress=on_progress)
+        if background:
+            return task.start()
+        task.run()
+        return task
+
+    def _prepare_save_data(
+        self, updated_fields: Union[Tuple, List]
+    ) -> Tuple['DictStrAny', Tuple[str, ...]]:
+        """update query for stored object, tracked objects update only dirty fields,
+        fields which are not fetched by projection are skipped
+
+        Args:
+            updated_fields (Union[Tuple, List]): fields for update, empty - dirty or all fields
+
+        Raises:
+            MongoValidationError: if invalid field in updated_fields
+
+        Returns:
+            Tuple[DictStrAny, Tuple[str, ...]]: update_one query (empty if nothing to save) and updated fields
+        """
+        loaded = self.__dict__
+        if updated_fields:
+            if not all(field in self.__fields__ for field in updated_fields):
+                raise MongoValidationError('invalid field in updated_fields')
+            not_loaded = [field for field in updated_fields if field not in loaded]
+            if not_loaded:
+                raise MongoValidationError(
+                    f'fields {not_loaded} are not fetched and can not be saved'
+                )
+            fields = tuple(updated_fields)
+        else:
+            dirty = self.get_dirty_fields()
+            if dirty is None:
+                fields = tuple(field for field in self.__fields__ if field in loaded)
+            else:
+                fields = tuple(field for field in self.__fields__ if field in dirty)
+        if not fields:
+            return {}, fields
+        data = {'_id': ObjectId(self._id)}
+        for field in fields:
+            data[f'{field}__set'] = getattr(self, field)
+        return data, fields
 
     def save(
         self,
@@ -345,18 +838,13 @@ class MongoModel(BasePydanticModel, metaclass=ModelMetaclass):
         session: Optional[ClientSession] = None,
     ) -> Any:
         if self._id is not None:
-            data = {'_id': ObjectId(self._id)}
-            if updated_fields:
-                if not all(field in self.__fields__ for field in updated_fields):
-                    raise MongoValidationError('invalid field in updated_fields')
-            else:
-                updated_fields = tuple(self.__fields__.keys())
-            for field in updated_fields:
-                data[f'{field}__set'] = getattr(self, field)
-            self.Q.update_one(
-                session=session,
-                **data,
-            )
+            data, fields = self._prepare_save_data(updated_fields)
+            if data:
+                self.Q.update_one(
+                    session=session,
+                    **data,
+                )
+                self._mark_saved(fields)
             return self
         data = {
             field: value
@@ -368,6 +856,7 @@ class MongoModel(BasePydanticModel, metaclass=ModelMetaclass):
             **data,
         )
         self._id = object_id
+        self._track_changes()
         return self
 
     def delete(self, session: Optional[ClientSession] = None) -> None:
@@ -388,18 +877,13 @@ class MongoModel(BasePydanticModel, metaclass=ModelMetaclass):
         session: Optional[ClientSession] = None,
     ) -> Any:
         if self._id is not None:
-            data = {'_id': ObjectId(self._id)}
-            if updated_fields:
-                if not all(field in self.__fields__ for field in updated_fields):
-                    raise MongoValidationError('invalid field in updated_fields')
-            else:
-                updated_fields = tuple(self.__fields__.keys())
-            for field in updated_fields:
-                data[f'{field}__set'] = getattr(self, field)
-            await self.AQ.update_one(
-                session=session,
-                **data,
-            )
+            data, fields = self._prepare_save_data(updated_fields)
+            if data:
+                await self.AQ.update_one(
+                    session=session,
+                    **data,
+                )
+                self._mark_saved(fields)
             return self
         data = {
             field: value
@@ -411,6 +895,7 @@ class MongoModel(BasePydanticModel, metaclass=ModelMetaclass):
             **data,
         )
         self._id = object_id
+        self._track_changes()
         return self
 
     def __hash__(self):
@@ -423,7 +908,7 @@ class MongoModel(BasePydanticModel, metaclass=ModelMetaclass):
         return {f: data[f] for f in fields}
 
     def serialize_json(self, fields: Union[Tuple, List]) -> str:
-        return json.dumps(self.serialize(fields))
+        return json_dumps(self.serialize(fields))
 
     @property
     def pk(self):
@@ -0,0 +1,678 @@
+from bisect import bisect_left
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from logging import Logger, getLogger
+from threading import Lock
+from time import monotonic, time
+from typing import Any, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+
+import bson
+from bson import SON
+
+from .helpers import LRUCache
+from .retry import current_attempt
+
+if TYPE_CHECKING:
+    from .models import MongoModel
+
+__all__ = (
+    'QueryEvent',
+    'QueryListener',
+    'QueryMetrics',
+    'SlowQueryLogger',
+    'register_listener',
+    'unregister_listener',
+    'get_listeners',
+)
+
+logger = getLogger('mongodantic')
+
+# seconds, like prometheus client defaults
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+_listeners: Tuple['QueryListener', ...] = ()
+_listeners_lock = Lock()
+
+
+class QueryEvent(object):
+    """one driver call of querybuilder
+
+    Find events and motor aggregate events are finished with the first batch
+    of cursor, so `duration` covers query execution, next batches (getMore)
+    are not measured.
+
+    Args:
+        model (MongoModel): model class
+        method_name (str): pymongo collection method
+        query (Any): compiled filter, or document, pipeline or requests for
+            insert, aggregate and bulk_write
+        options (Optional[Dict], optional): driver keyword arguments like sort,
+            skip, limit and projection, without session. Defaults to None.
+    """
+
+    __slots__ = (
+        'model',
+        'method_name',
+        'query',
+        'options',
+        'retries',
+        'started_at',
+        'duration',
+        'error',
+        '_started',
+        '_result',
+    )
+
+    def __init__(
+        self,
+        model: 'MongoModel',
+        method_name: str,
+        query: Any,
+        options: Optional[Dict[str, Any]] = None,
+    ):
+        self.model = model
+        self.method_name = method_name
+        self.query = query
+        self.options = options or {}
+        self.retries = current_attempt() - 1
+        self.started_at = time()
+        self.duration: Optional[float] = None
+        self.error: Optional[BaseException] = None
+        self._started = monotonic()
+        self._result: Any = None
+
+    def __repr__(self):
+        return (
+            f'QueryEvent({self.model.__name__}.{self.method_name}, '
+            f'duration={self.duration}, retries={self.retries})'
+        )
+
+    @property
+    def result(self) -> Any:
+        return self._result
+
+    @property
+    def documents(self) -> Optional[int]:
+        """count of returned documents, None if result is cursor or not documents"""
+        result = self._result
+        if result is None:
+            return 0 if self.method_name.startswith('find_one') else None
+        if isinstance(result, dict):
+            return 1
+        if isinstance(result, list):
+            return len(result)
+        return None
+
+    @property
+    def bytes(self) -> Optional[int]:
+        """bson size of returned documents, computed on access"""
+        result = self._result
+        if isinstance(result, dict):
+            return len(bson.encode(result))
+        if isinstance(result, list) and all(isinstance(r, dict) for r in result):
+            return sum(len(bson.encode(r)) for r in result)
+        return None
+
+    def _finish(self, result: Any = None, error: Optional[BaseException] = None):
+        self.duration = monotonic() - self._started
+        self._result = result
+        self.error = error
+
+
+class QueryListener(object):
+    """base class of query listeners, override needed callbacks"""
+
+    def started(self, event: QueryEvent) -> None:
+        pass
+
+    def succeeded(self, event: QueryEvent) -> None:
+        pass
+
+    def failed(self, event: QueryEvent) -> None:
+        pass
+
+
+def register_listener(listener: QueryListener) -> None:
+    """add listener for all models querybuilders"""
+    global _listeners
+    with _listeners_lock:
+        if listener not in _listeners:
+            _listeners = _listeners + (listener,)
+
+
+def unregister_listener(listener: QueryListener) -> None:
+    global _listeners
+    with _listeners_lock:
+        _listeners = tuple(item for item in _listeners if item is not listener)
+
+
+def get_listeners() -> Tuple[QueryListener, ...]:
+    return _listeners
+
+
+def _notify(hook: str, event: QueryEvent) -> None:
+    for listener in _listeners:
+        try:
+            getattr(listener, hook)(event)
+        except Exception:
+            # monitoring must not break queries
+            logger.exception('query listener %r failed', listener)
+
+
+def start_event(
+    model: 'MongoModel',
+    method_name: str,
+    query: Tuple,
+    kwargs: Optional[Dict[str, Any]] = None,
+) -> Optional[QueryEvent]:
+    """event of driver call or None if there are no listeners"""
+    if not _listeners:
+        return None
+    options = (
+        {key: value for key, value in kwargs.items() if key != 'session'}
+        if kwargs
+        else None
+    )
+    event = QueryEvent(model, method_name, query[0] if query else None, options)
+    _notify('started', event)
+    return event
+
+
+def finish_event(
+    event: Optional[QueryEvent],
+    result: Any = None,
+    error: Optional[BaseException] = None,
+) -> None:
+    if event is None:
+        return
+    event._finish(result, error)
+    _notify('failed' if error is not None else 'succeeded', event)
+
+
+class _MonitoredCursorProxy(object):
+    """cursor proxy, event is finished when cursor is closed or collected
+    before the first batch"""
+
+    __slots__ = ('_cursor', '_event')
+
+    def __init__(self, cursor: Any, event: QueryEvent):
+        self._cursor = cursor
+        self._event: Optional[QueryEvent] = event
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cursor, name)
+
+    def _finish_unfetched(self) -> None:
+        event = getattr(self, '_event', None)
+        if event is not None:
+            self._event = None
+            finish_event(event)
+
+    def __del__(self) -> None:
+        self._finish_unfetched()
+
+
+class MonitoredCursor(_MonitoredCursorProxy):
+    """proxy of pymongo cursor, finishes event when the first batch is fetched"""
+
+    __slots__ = ()
+
+    def close(self) -> None:
+        self._finish_unfetched()
+        self._cursor.close()
+
+    def __iter__(self) -> 'MonitoredCursor':
+        return self
+
+    def __next__(self) -> Any:
+        event = self._event
+        if event is None:
+            return next(self._cursor)
+        self._event = None
+        try:
+            document = next(self._cursor)
+        except StopIteration:
+            finish_event(event, [])
+            raise
+        except Exception as e:
+            finish_event(event, error=e)
+            raise
+        finish_event(event)
+        return document
+
+    next = __next__
+
+
+class MonitoredAsyncCursor(_MonitoredCursorProxy):
+    """proxy of motor cursor, finishes event when the first batch is fetched"""
+
+    __slots__ = ()
+
+    def close(self) -> Any:
+        self._finish_unfetched()
+        # close of motor cursor is awaitable
+        return self._cursor.close()
+
+    def __aiter__(self) -> 'MonitoredAsyncCursor':
+        return self
+
+    async def __anext__(self) -> Any:
+        event = self._event
+        if event is None:
+            return await self._cursor.next()
+        self._event = None
+        try:
+            document = await self._cursor.next()
+        except StopAsyncIteration:
+            finish_event(event, [])
+            raise
+        except Exception as e:
+            finish_event(event, error=e)
+            raise
+        finish_event(event)
+        return document
+
+    next = __anext__
+
+    async def to_list(self, length: Optional[int]) -> List:
+        event, self._event = self._event, None
+        try:
+            documents = await self._cursor.to_list(length)
+        except Exception as e:
+            finish_event(event, error=e)
+            raise
+        finish_event(event, documents)
+        return documents
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class _Series(object):
+    __slots__ = ('buckets', 'count', 'sum', 'errors', 'retries')
+
+    def __init__(self, size: int):
+        self.buckets = [0] * size
+        self.count = 0
+        self.sum = 0.0
+        self.errors = 0
+        self.retries = 0
+
+
+class QueryMetrics(QueryListener):
+    """in-memory latency histogram per model and method
+
+    Args:
+        buckets (Tuple[float, ...], optional): upper bounds in seconds. Defaults to DEFAULT_BUCKETS.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.bounds = tuple(sorted(buckets))
+        self._series: Dict[Tuple[str, str], _Series] = {}
+        self._lock = Lock()
+
+    def _observe(self, event: QueryEvent) -> None:
+        key = (event.model.__name__, event.method_name)
+        duration = event.duration or 0.0
+        index = bisect_left(self.bounds, duration)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _Series(len(self.bounds) + 1)
+            series.buckets[index] += 1
+            series.count += 1
+            series.sum += duration
+            series.retries += event.retries
+            if event.error is not None:
+                series.errors += 1
+
+    succeeded = _observe
+    failed = _observe
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def _percentile(self, series: _Series, q: float) -> float:
+        """estimate from buckets with linear interpolation inside bucket"""
+        rank = q * series.count
+        seen = 0
+        for index, count in enumerate(series.buckets):
+            if count and seen + count >= rank:
+                lower = self.bounds[index - 1] if index else 0.0
+                if index == len(self.bounds):
+                    return lower
+                upper = self.bounds[index]
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return 0.0
+
+    def summary(
+        self, percentiles: Tuple[float, ...] = (0.5, 0.9, 0.99)
+    ) -> Dict[Tuple[str, str], Dict[str, float]]:
+        """count, errors, retries, avg and percentiles per (model, method)
+
+        Returns:
+            Dict[Tuple[str, str], Dict[str, float]]: e.g. {('User', 'find_one'): {'count': 10, 'p50': 0.002, ...}}
+        """
+        result = {}
+        with self._lock:
+            for key, series in self._series.items():
+                data: Dict[str, float] = {
+                    'count': series.count,
+                    'errors': series.errors,
+                    'retries': series.retries,
+                    'avg': series.sum / series.count,
+                }
+                for q in percentiles:
+                    data[f'p{round(q * 100):g}'] = self._percentile(series, q)
+                result[key] = data
+        return result
+
+    def prometheus_text(self, prefix: str = 'mongodantic') -> str:
+        """metrics in prometheus text exposition format
+
+        Args:
+            prefix (str, optional): metric names prefix. Defaults to 'mongodantic'.
+
+        Returns:
+            str: text for /metrics endpoint
+        """
+        name = f'{prefix}_query_duration_seconds'
+        lines: List[str] = [
+            f'# HELP {name} Query duration by model and method.',
+            f'# TYPE {name} histogram',
+        ]
+        errors: List[str] = []
+        retries: List[str] = []
+        with self._lock:
+            items = sorted(self._series.items())
+            for (model, method), series in items:
+                labels = f'model="{_escape(model)}",method="{_escape(method)}"'
+                cumulative = 0
+                for bound, count in zip(self.bounds + (None,), series.buckets):
+                    cumulative += count
+                    le = '+Inf' if bound is None else repr(bound)
+                    lines.append(f'{name}_bucket{{{labels},le="{le}"}} {cumulative}')
+                lines.append(f'{name}_sum{{{labels}}} {series.sum!r}')
+                lines.append(f'{name}_count{{{labels}}} {series.count}')
+                errors.append(f'{prefix}_query_errors_total{{{labels}}} {series.errors}')
+                retries.append(f'{prefix}_query_retries_total{{{labels}}} {series.retries}')
+        lines.append(f'# HELP {prefix}_query_errors_total Failed queries.')
+        lines.append(f'# TYPE {prefix}_query_errors_total counter')
+        lines.extend(errors)
+        lines.append(f'# HELP {prefix}_query_retries_total Retries of queries.')
+        lines.append(f'# TYPE {prefix}_query_retries_total counter')
+        lines.extend(retries)
+        return '\n'.join(lines) + '\n'
+
+
+SLOW_QUERY_METHODS: Tuple[str, ...] = ('find', 'count_documents', 'aggregate')
+
+
+def query_shape(value: Any) -> Any:
+    """value with literals replaced by '?', field names and operators are kept
+
+    Args:
+        value (Any): filter or pipeline
+
+    Returns:
+        Any: normalized shape, equal for queries which differ only by values
+    """
+    if isinstance(value, dict):
+        return {str(key): query_shape(value[key]) for key in sorted(value, key=str)}
+    if isinstance(value, (list, tuple)) and any(
+        isinstance(item, (dict, list, tuple)) for item in value
+    ):
+        return [query_shape(item) for item in value]
+    return '?'
+
+
+def _plan_stages(node: Any, stages: Set[str], in_plan: bool = False) -> None:
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if in_plan and key == 'stage' and isinstance(value, str):
+                stages.add(value)
+            else:
+                _plan_stages(value, stages, in_plan or key == 'winningPlan')
+    elif isinstance(node, list):
+        for item in node:
+            _plan_stages(item, stages, in_plan)
+
+
+def plan_flags(explain: Dict[str, Any]) -> List[str]:
+    """COLLSCAN and in-memory SORT of winning plan in explain output
+
+    Args:
+        explain (Dict[str, Any]): result of explain command
+
+    Returns:
+        List[str]: found flags
+    """
+    stages: Set[str] = set()
+    _plan_stages(explain, stages)
+    for stage in explain.get('stages') or ():
+        # $sort of aggregation which was not pushed down to query layer
+        if isinstance(stage, dict) and '$sort' in stage:
+            stages.add('SORT')
+    return [flag for flag in ('COLLSCAN', 'SORT') if flag in stages]
+
+
+class _ShapeState(object):
+    __slots__ = ('flags', 'explaining', 'logged_at', 'suppressed')
+
+    def __init__(self):
+        self.flags: Optional[List[str]] = None
+        self.explaining = False
+        self.logged_at: Optional[float] = None
+        self.suppressed = 0
+
+
+class SlowQueryLogger(QueryListener):
+    """logs find, count and aggregate queries slower than threshold
+
+    Explain runs once per query shape in background thread, COLLSCAN and
+    in-memory SORT of winning plan are logged as flags. Every shape is logged
+    at most once per `interval` and all shapes at most `max_per_interval`
+    times, skipped records are counted in the next one. Record dict is passed
+    in `slow_query` attribute of log record.
+
+    Args:
+        threshold (float, optional): seconds. Defaults to 0.1.
+        explain (bool, optional): run explain with queryPlanner verbosity. Defaults to True.
+        methods (Tuple[str, ...], optional): driver methods. Defaults to find, count_documents and aggregate.
+        interval (float, optional): seconds of rate limit window. Defaults to 60.
+        max_per_interval (int, optional): records of all shapes per interval. Defaults to 10.
+        max_shapes (int, optional): count of remembered shapes. Defaults to 1000.
+        logger (Optional[Logger], optional): Defaults to 'mongodantic.slow_queries' logger.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.1,
+        explain: bool = True,
+        methods: Tuple[str, ...] = SLOW_QUERY_METHODS,
+        interval: float = 60.0,
+        max_per_interval: int = 10,
+        max_shapes: int = 1000,
+        logger: Optional[Logger] = None,
+    ):
+        self.threshold = threshold
+        self.explain = explain
+        self.methods = frozenset(methods)
+        self.interval = interval
+        self.max_per_interval = max_per_interval
+        self.logger = logger or getLogger('mongodantic.slow_queries')
+        self._shapes = LRUCache(max_shapes)
+        self._lock = Lock()
+        self._window_started = monotonic()
+        self._window_count = 0
+        self._dropped = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Set[Future] = set()
+
+    @staticmethod
+    def shape(event: QueryEvent) -> str:
+        """key of query shape: model, method, normalized filter, sort and
+        presence of skip and limit"""
+        options = event.options
+        sort = options.get('sort')
+        return repr(
+            (
+                event.model.__name__,
+                event.method_name,
+                query_shape(event.query),
+                list(sort.items()) if isinstance(sort, dict) else sort,
+                'skip' in options,
+                'limit' in options,
+            )
+        )
+
+    def succeeded(self, event: QueryEvent) -> None:
+        if event.method_name not in self.methods or (event.duration or 0) < self.threshold:
+            return
+        shape = self.shape(event)
+        now = monotonic()
+        with self._lock:
+            state = self._shapes.get(shape)
+            if state is None:
+                state = _ShapeState()
+                self._shapes.set(shape, state)
+            if state.logged_at is not None and now - state.logged_at < self.interval:
+                state.suppressed += 1
+                return
+            if now - self._window_started >= self.interval:
+                self._window_started = now
+                self._window_count = 0
+            if self._window_count >= self.max_per_interval:
+                self._dropped += 1
+                return
+            self._window_count += 1
+            state.logged_at = now
+            record = self._record(event, shape, state.suppressed, self._dropped)
+            state.suppressed = 0
+            self._dropped = 0
+            explain = self.explain and state.flags is None and not state.explaining
+            if explain:
+                state.explaining = True
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix='mongodantic-explain'
+                    )
+                executor = self._executor
+        if not explain:
+            record['flags'] = state.flags
+            self._log(record)
+            return
+        future = executor.submit(self._explain_and_log, event, state, record)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._done)
+
+    def _done(self, future: Future) -> None:
+        with self._lock:
+            self._pending.discard(future)
+
+    @staticmethod
+    def _record(
+        event: QueryEvent, shape: str, suppressed: int, dropped: int
+    ) -> Dict[str, Any]:
+        options = event.options
+        return {
+            'model': event.model.__name__,
+            'method': event.method_name,
+            'filter': event.query,
+            'sort': options.get('sort'),
+            'skip': options.get('skip'),
+            'limit': options.get('limit'),
+            'duration': event.duration,
+            'started_at': event.started_at,
+            'shape': shape,
+            'flags': None,
+            'suppressed': suppressed,
+            'dropped': dropped,
+        }
+
+    def _explain(self, event: QueryEvent) -> Dict[str, Any]:
+        """explain output of event query, verbosity is queryPlanner so query is not executed"""
+        collection = event.model._collection
+        options = event.options
+        if event.method_name == 'aggregate':
+            command = SON(
+                [
+                    ('aggregate', collection.name),
+                    ('pipeline', event.query),
+                    ('cursor', {}),
+                ]
+            )
+        else:
+            query_key = 'filter' if event.method_name == 'find' else 'query'
+            name = 'find' if event.method_name == 'find' else 'count'
+            command = SON([(name, collection.name), (query_key, event.query or {})])
+            sort = options.get('sort')
+            if sort and name == 'find':
+                command['sort'] = SON(sort)
+            if options.get('projection') and name == 'find':
+                command['projection'] = options['projection']
+            for key in ('skip', 'limit'):
+                if options.get(key):
+                    command[key] = options[key]
+        return collection.database.command(
+            'explain', command, verbosity='queryPlanner'
+        )
+
+    def _explain_and_log(
+        self, event: QueryEvent, state: _ShapeState, record: Dict[str, Any]
+    ) -> None:
+        try:
+            state.flags = record['flags'] = plan_flags(self._explain(event))
+        except Exception as e:
+            # shape is explained again when it is logged next time
+            record['explain_error'] = repr(e)
+        finally:
+            state.explaining = False
+        self._log(record)
+
+    def _log(self, record: Dict[str, Any]) -> None:
+        self.logger.warning(
+            'slow query %s.%s %.3fs filter=%r sort=%r skip=%r limit=%r flags=%s',
+            record['model'],
+            record['method'],
+            record['duration'],
+            record['filter'],
+            record['sort'],
+            record['skip'],
+            record['limit'],
+            ','.join(record['flags']) if record['flags'] else '-',
+            extra={'slow_query': record},
+        )
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """wait for background explains
+
+        Args:
+            timeout (Optional[float], optional): seconds. Defaults to None - no limit.
+        """
+        with self._lock:
+            pending = list(self._pending)
+        wait(pending, timeout)
+
+    def close(self) -> None:
+        """wait for background explains and stop their thread"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
@@ -0,0 +1,140 @@
+import base64
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union, TYPE_CHECKING
+
+import bson
+from bson.errors import BSONError
+
+from .exceptions import MongoValidationError
+from .helpers import sort_validation
+
+if TYPE_CHECKING:
+    from .queryset import QuerySet
+
+__all__ = ('Keyset', 'Page')
+
+
+def _get_path(document: Dict, path: str) -> Any:
+    value: Any = document
+    for key in path.split('.'):
+        value = value.get(key) if isinstance(value, dict) else None
+    return value
+
+
+def _is_prefix(path: str, key: str) -> bool:
+    """path is key or its parent document"""
+    return path == key or key.startswith(path + '.')
+
+
+class Keyset(object):
+    """sort keys of keyset (seek) pagination, `_id` is added as tiebreaker
+
+    Args:
+        sort_fields (Union[Tuple, List, None], optional): sort fields. Defaults to None - `_id`.
+        sort (Optional[int], optional): 1 or -1 for all fields. Defaults to None - 1.
+    """
+
+    def __init__(
+        self,
+        sort_fields: Union[Tuple, List, None] = None,
+        sort: Optional[int] = None,
+    ):
+        sort, sort_fields = sort_validation(sort, sort_fields)
+        keys = list(sort_fields or ())
+        if '_id' not in keys:
+            keys.append('_id')
+        self.keys: Tuple[str, ...] = tuple(keys)
+        self.direction: int = sort or 1
+
+    @property
+    def sort(self) -> List[Tuple[str, int]]:
+        return [(key, self.direction) for key in self.keys]
+
+    def encode(self, document: Dict) -> str:
+        """opaque token with sort key values of document"""
+        values = [_get_path(document, key) for key in self.keys]
+        data = bson.encode({'k': list(self.keys), 'd': self.direction, 'v': values})
+        return base64.urlsafe_b64encode(data).decode()
+
+    def decode(self, token: str) -> List[Any]:
+        """sort key values from token
+
+        Raises:
+            MongoValidationError: if token is broken or created for other sort
+        """
+        try:
+            data = bson.decode(base64.urlsafe_b64decode(token.encode()))
+        except (BSONError, ValueError, TypeError):
+            raise MongoValidationError('invalid pagination token')
+        if tuple(data.get('k', ())) != self.keys or data.get('d') != self.direction:
+            raise MongoValidationError('pagination token does not match sort')
+        return data['v']
+
+    def _after(self, value: Any) -> List[Any]:
+        """conditions for values after value, null and missing values sort first"""
+        if self.direction == 1:
+            return [{'$ne': None}] if value is None else [{'$gt': value}]
+        return [] if value is None else [{'$lt': value}, None]
+
+    def seek_query(self, values: List[Any]) -> Dict:
+        """range predicate for rows after values: (k1 > v1) or (k1 = v1 and k2 > v2) ...,
+        `{k: None}` matches both null and missing values"""
+        branches = []
+        for i, key in enumerate(self.keys):
+            for condition in self._after(values[i]):
+                branch = {self.keys[j]: values[j] for j in range(i)}
+                branch[key] = condition
+                branches.append(branch)
+        return {'$or': branches}
+
+    def apply(self, filter_: Dict, after: Optional[str] = None) -> Dict:
+        if not after:
+            return filter_
+        seek = self.seek_query(self.decode(after))
+        return {'$and': [filter_, seek]} if filter_ else seek
+
+    def projection(self, projection: Optional[Dict]) -> Optional[Dict]:
+        """projection with sort keys, they are needed for next token,
+        paths of sort key and its parents or children are not mixed (path collision)"""
+        if not projection:
+            return projection
+        projection = dict(projection)
+        included = 1 in projection.values()
+        for key in self.keys:
+            if included and any(
+                value == 1 and _is_prefix(path, key) for path, value in projection.items()
+            ):
+                continue
+            for path in [
+                path for path in projection if _is_prefix(path, key) or _is_prefix(key, path)
+            ]:
+                del projection[path]
+            if included:
+                projection[key] = 1
+        return projection or None
+
+
+class Page(object):
+    """page of keyset pagination
+
+    Args:
+        items (QuerySet): page rows
+        next_token (Optional[str]): token for next page, None if it is last page
+        count (Optional[int], optional): count of all rows, if requested. Defaults to None.
+    """
+
+    def __init__(
+        self, items: 'QuerySet', next_token: Optional[str], count: Optional[int] = None
+    ):
+        self.items = items
+        self.next_token = next_token
+        self.count = count
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_token is not None
+
+    def __iter__(self) -> Iterator:
+        return iter(self.items)
+
+    def __repr__(self):
+        return f'Page(has_next={self.has_next}, count={self.count})'
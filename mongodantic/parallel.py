@@ -0,0 +1,163 @@
+from datetime import timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, TYPE_CHECKING
+
+from bson import ObjectId
+
+from .connection import (
+    _connection_settings,
+    get_connection_env,
+    set_connection_env,
+)
+
+if TYPE_CHECKING:
+    from .models import MongoModel
+
+__all__ = ('sample_boundaries', 'interpolate_ids', 'id_ranges')
+
+IdRange = Tuple[Any, Any]
+PartitionResult = Tuple[int, Any]
+
+SPLIT_METHODS = ('sample', 'interpolate')
+# sampled _id values per partition, more samples give more even partitions
+SAMPLES_PER_PARTITION = 20
+
+
+def sample_boundaries(ids: List[Any], partitions: int) -> List[Any]:
+    """quantiles of sampled _id values
+
+    Args:
+        ids (List[Any]): sampled _id values of one bson type
+        partitions (int): count of partitions
+
+    Returns:
+        List[Any]: sorted unique boundaries, at most partitions - 1
+    """
+    ids = sorted(ids)
+    boundaries: List[Any] = []
+    if not ids:
+        return boundaries
+    for i in range(1, partitions):
+        value = ids[len(ids) * i // partitions]
+        if not boundaries or boundaries[-1] < value:
+            boundaries.append(value)
+    return boundaries
+
+
+def interpolate_ids(low: Any, high: Any, partitions: int) -> List[Any]:
+    """evenly spaced boundaries between min and max _id, ObjectId values are
+    interpolated by generation time, so partitions are even for uniform inserts
+
+    Args:
+        low (Any): min _id
+        high (Any): max _id
+        partitions (int): count of partitions
+
+    Returns:
+        List[Any]: boundaries, empty if _id type is not ObjectId or int
+    """
+    if isinstance(low, ObjectId) and isinstance(high, ObjectId):
+        start = low.generation_time
+        step = (high.generation_time - start) / partitions
+        if step < timedelta(seconds=1):
+            # ObjectId time has seconds precision
+            return []
+        values = [ObjectId.from_datetime(start + step * i) for i in range(1, partitions)]
+    elif (
+        isinstance(low, int)
+        and isinstance(high, int)
+        and not isinstance(low, bool)
+        and not isinstance(high, bool)
+    ):
+        values = [low + (high - low) * i // partitions for i in range(1, partitions)]
+    else:
+        return []
+    return sorted(set(value for value in values if low < value <= high))
+
+
+def id_ranges(boundaries: List[Any]) -> List[IdRange]:
+    """half-open [low, high) _id ranges, first and last ones are unbounded, so
+    documents out of sampled or interpolated values are scanned too"""
+    edges = [None] + list(boundaries) + [None]
+    return list(zip(edges[:-1], edges[1:]))
+
+
+def range_filter(filter_: Dict, id_range: IdRange) -> Dict:
+    low, high = id_range
+    condition: Dict[str, Any] = {}
+    if low is not None:
+        condition['$gte'] = low
+    if high is not None:
+        condition['$lt'] = high
+    if not condition:
+        return filter_
+    if not filter_:
+        return {'_id': condition}
+    return {'$and': [filter_, {'_id': condition}]}
+
+
+def worker_settings(model: Type['MongoModel']) -> Tuple[str, Dict[str, Dict]]:
+    """current connection env and settings of envs used by model for worker
+    initializer, they are pickled for spawn and forkserver workers
+
+    Args:
+        model (Type[MongoModel]): scanned model
+
+    Returns:
+        Tuple[str, Dict[str, Dict]]: current env name and settings by env name
+    """
+    env_name = get_connection_env()
+    env_names = {env_name, model.__connection_env__ or env_name}
+    return env_name, {
+        name: _connection_settings[name]
+        for name in env_names
+        if name in _connection_settings
+    }
+
+
+def init_worker(env_name: str, settings: Dict[str, Dict]) -> None:
+    """set connection settings of parent in spawned worker, forked workers
+    already have them, every worker opens own client by per-pid registry"""
+    for name, env_settings in settings.items():
+        _connection_settings.setdefault(name, env_settings)
+    if get_connection_env() != env_name:
+        set_connection_env(env_name)
+
+
+def _fold(reduce: Callable[[Any, Any], Any], values: Iterable[Any]) -> PartitionResult:
+    count = 0
+    result = None
+    for value in values:
+        result = value if not count else reduce(result, value)
+        count += 1
+    return count, result
+
+
+def scan_partition(
+    model: Type['MongoModel'],
+    filter_: Dict,
+    projection: Optional[Dict],
+    batch_size: int,
+    fn: Callable[[Any], Any],
+    reduce: Optional[Callable[[Any, Any], Any]],
+) -> PartitionResult:
+    """count of documents and fn results of partition, folded if reduce is set"""
+    querybuilder = model.Q
+    parser = querybuilder._get_parser(projection)
+    values = (
+        fn(parser(document))
+        for document in querybuilder._scan(filter_, projection, batch_size)
+    )
+    if reduce is not None:
+        return _fold(reduce, values)
+    result = list(values)
+    return len(result), result
+
+
+def merge_results(
+    results: List[PartitionResult], reduce: Optional[Callable[[Any, Any], Any]]
+) -> Any:
+    """results of partitions in _id order: concatenated lists or folded values,
+    None if reduce is set and there are no documents"""
+    if reduce is None:
+        return [value for _, partition in results for value in partition]
+    return _fold(reduce, (value for count, value in results if count))[1]
@@ -0,0 +1,345 @@
+from copy import deepcopy
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    TYPE_CHECKING,
+)
+
+from .aggregation import BasicDefaultAggregation, Count
+from .exceptions import MongoValidationError, NotDeclaredField
+from .helpers import group_by_aggregate_generation
+from .logical import LogicalCombination, Query
+
+if TYPE_CHECKING:
+    from .models import MongoModel
+
+__all__ = ('Pipeline',)
+
+
+class Pipeline(object):
+    """fluent builder of aggregation pipeline
+
+    Field names are validated against model fields on the first stages and
+    against the output fields of previous stage after $group, $project,
+    $facet and $bucket. After `stage` with raw dict output is unknown and
+    validation is skipped.
+
+    Args:
+        mongo_model (MongoModel): model of source collection
+    """
+
+    def __init__(self, mongo_model: 'MongoModel'):
+        self._mongo_model = mongo_model
+        self._stages: List[Dict] = []
+        self._fields: Optional[Set[str]] = set(mongo_model.__fields__) | {'_id'}
+        self._model_shape = True
+
+    def __repr__(self):
+        return f'Pipeline({self._mongo_model.__name__}, stages={len(self._stages)})'
+
+    def __len__(self) -> int:
+        return len(self._stages)
+
+    @property
+    def stages(self) -> List[Dict]:
+        """copy of pipeline stages for raw_aggregate or driver"""
+        return deepcopy(self._stages)
+
+    def branch(self) -> 'Pipeline':
+        """empty pipeline with current output fields, for facet"""
+        pipeline = self.__class__(self._mongo_model)
+        pipeline._fields = None if self._fields is None else set(self._fields)
+        pipeline._model_shape = self._model_shape
+        return pipeline
+
+    def _check_field(self, path: str) -> str:
+        root = path.split('.', 1)[0]
+        if self._fields is not None and root not in self._fields:
+            raise NotDeclaredField(root, sorted(self._fields))
+        return path
+
+    def _check_expression(self, expression: Any) -> Any:
+        """validate `$field` references inside expression, `$$` variables are skipped"""
+        if isinstance(expression, str):
+            if expression.startswith('$') and not expression.startswith('$$'):
+                self._check_field(expression[1:])
+        elif isinstance(expression, dict):
+            for value in expression.values():
+                self._check_expression(value)
+        elif isinstance(expression, (list, tuple)):
+            for value in expression:
+                self._check_expression(value)
+        return expression
+
+    def _accumulator(self, aggregation: Any) -> Dict:
+        if isinstance(aggregation, Count):
+            return {'$sum': 1}
+        if isinstance(aggregation, BasicDefaultAggregation):
+            self._check_field(aggregation.field)
+            return {f'${aggregation.operation}': f'${aggregation.field}'}
+        if isinstance(aggregation, dict):
+            return self._check_expression(aggregation)
+        raise MongoValidationError(
+            f'invalid accumulator {aggregation!r}, must be Sum, Max, Min, Avg, Count or dict'
+        )
+
+    def _accumulators(
+        self, aggregations: Iterable[BasicDefaultAggregation], named: Dict[str, Any]
+    ) -> Dict[str, Dict]:
+        accumulators = {}
+        for aggregation in aggregations:
+            if not isinstance(aggregation, BasicDefaultAggregation):
+                raise MongoValidationError(
+                    'positional accumulators must be Sum, Max, Min, Avg or Count'
+                )
+            name = f'{aggregation.field}__{aggregation.operation}'
+            accumulators[name] = self._accumulator(aggregation)
+        for name, aggregation in named.items():
+            accumulators[name] = self._accumulator(aggregation)
+        return accumulators
+
+    def _add(self, stage: Dict, fields: Optional[Set[str]] = None) -> 'Pipeline':
+        self._stages.append(stage)
+        if fields is not None:
+            self._fields = fields
+            self._model_shape = False
+        return self
+
+    def match(
+        self,
+        logical_query: Union[Query, LogicalCombination, None] = None,
+        **query,
+    ) -> 'Pipeline':
+        """$match stage, while documents have model shape query is validated as in find
+
+        Args:
+            logical_query (Union[Query, LogicalCombination, None], optional): Query | LogicalCombination. Defaults to None.
+
+        Returns:
+            Pipeline: self
+        """
+        if self._model_shape:
+            filter_ = (
+                self._mongo_model._check_query_args(logical_query)
+                if logical_query
+                else self._mongo_model._validate_query_data(query)
+            )
+        elif logical_query:
+            raise MongoValidationError(
+                'Query objects are supported only before $group, $project, $facet and $bucket'
+            )
+        else:
+            filter_ = {self._check_field(key): value for key, value in query.items()}
+        return self._add({'$match': filter_})
+
+    def project(self, *fields: str, **expressions: Any) -> 'Pipeline':
+        """$project stage
+
+        Args:
+            fields (str): included fields
+            expressions (Any): new field name - expression, 0 excludes field
+
+        Returns:
+            Pipeline: self
+        """
+        projection: Dict[str, Any] = {self._check_field(field): 1 for field in fields}
+        for name, expression in expressions.items():
+            if expression is True or expression == 1:
+                self._check_field(name)
+            else:
+                self._check_expression(expression)
+            projection[name] = expression
+        excluded = {name for name, value in projection.items() if value in (0, False)}
+        if excluded and len(excluded) == len(projection):
+            # exclusion projection keeps other fields
+            output = None if self._fields is None else self._fields - excluded
+        else:
+            output = {name.split('.', 1)[0] for name in projection} - excluded
+            if '_id' not in excluded:
+                output.add('_id')
+        self._add({'$project': projection})
+        self._fields = output
+        self._model_shape = False
+        return self
+
+    def group(
+        self,
+        by: Union[str, List, Tuple, Dict, None] = None,
+        *aggregations: BasicDefaultAggregation,
+        **accumulators: Any,
+    ) -> 'Pipeline':
+        """$group stage
+
+        Args:
+            by (Union[str, List, Tuple, Dict, None], optional): group key, field or fields. Defaults to None - all documents.
+            aggregations (BasicDefaultAggregation): Sum, Max, Min, Avg or Count, named as `field__operation`
+            accumulators (Any): output field name - Sum(...) or accumulator dict
+
+        Returns:
+            Pipeline: self
+        """
+        if isinstance(by, dict):
+            group_id: Any = self._check_expression(by)
+        elif by:
+            for field in (by,) if isinstance(by, str) else by:
+                self._check_field(field.lstrip('$'))
+            group_id = group_by_aggregate_generation(by)
+        else:
+            group_id = None
+        group = {'_id': group_id, **self._accumulators(aggregations, accumulators)}
+        return self._add({'$group': group}, set(group))
+
+    def sort(self, *fields: Union[str, Tuple[str, int]], sort: int = 1) -> 'Pipeline':
+        """$sort stage
+
+        Args:
+            fields (Union[str, Tuple[str, int]]): field or (field, direction)
+            sort (int, optional): direction for fields without it, 1 or -1. Defaults to 1.
+
+        Returns:
+            Pipeline: self
+        """
+        if not fields:
+            raise MongoValidationError('miss sort fields')
+        order: Dict[str, int] = {}
+        for field in fields:
+            name, direction = (field, sort) if isinstance(field, str) else field
+            if direction not in (1, -1):
+                raise ValueError(f'invalid sort value must be 1 or -1 not {direction}')
+            order[self._check_field(name)] = direction
+        return self._add({'$sort': order})
+
+    def skip(self, count: int) -> 'Pipeline':
+        return self._add({'$skip': count})
+
+    def limit(self, count: int) -> 'Pipeline':
+        return self._add({'$limit': count})
+
+    def lookup(
+        self,
+        from_: Union['MongoModel', str],
+        local_field: str,
+        foreign_field: str,
+        as_: str,
+    ) -> 'Pipeline':
+        """$lookup stage, joined documents are stored in `as_` array field
+
+        Args:
+            from_ (Union[MongoModel, str]): joined model or collection name
+            local_field (str): field of current documents
+            foreign_field (str): field of joined documents
+            as_ (str): output field
+
+        Returns:
+            Pipeline: self
+        """
+        if isinstance(from_, str):
+            collection = from_
+        else:
+            if foreign_field.split('.', 1)[0] not in set(from_.__fields__) | {'_id'}:
+                raise NotDeclaredField(foreign_field, list(from_.__fields__.keys()))
+            collection = from_._collection_name
+        stage = {
+            '$lookup': {
+                'from': collection,
+                'localField': self._check_field(local_field),
+                'foreignField': foreign_field,
+                'as': as_,
+            }
+        }
+        self._stages.append(stage)
+        if self._fields is not None:
+            self._fields.add(as_)
+        return self
+
+    def unwind(
+        self,
+        field: str,
+        preserve_null_and_empty_arrays: bool = False,
+        include_array_index: Optional[str] = None,
+    ) -> 'Pipeline':
+        """$unwind stage
+
+        Args:
+            field (str): array field
+            preserve_null_and_empty_arrays (bool, optional): keep documents without items. Defaults to False.
+            include_array_index (Optional[str], optional): output field for item index. Defaults to None.
+
+        Returns:
+            Pipeline: self
+        """
+        unwind: Dict[str, Any] = {'path': f'${self._check_field(field)}'}
+        if preserve_null_and_empty_arrays:
+            unwind['preserveNullAndEmptyArrays'] = True
+        if include_array_index:
+            unwind['includeArrayIndex'] = include_array_index
+            if self._fields is not None:
+                self._fields.add(include_array_index)
+        self._stages.append({'$unwind': unwind})
+        return self
+
+    def facet(self, **pipelines: Union['Pipeline', List[Dict]]) -> 'Pipeline':
+        """$facet stage, each output field is result of own sub-pipeline,
+        build them with `branch()`
+
+        Returns:
+            Pipeline: self
+        """
+        if not pipelines:
+            raise MongoValidationError('miss facet pipelines')
+        facet = {
+            name: pipeline.stages if isinstance(pipeline, Pipeline) else list(pipeline)
+            for name, pipeline in pipelines.items()
+        }
+        return self._add({'$facet': facet}, set(facet))
+
+    def bucket(
+        self,
+        group_by: Union[str, Dict],
+        boundaries: List[Any],
+        default: Any = None,
+        **output: Any,
+    ) -> 'Pipeline':
+        """$bucket stage
+
+        Args:
+            group_by (Union[str, Dict]): field or expression
+            boundaries (List[Any]): sorted bucket boundaries
+            default (Any, optional): bucket id for values out of boundaries. Defaults to None - no default bucket.
+            output (Any): output field name - Sum(...) or accumulator dict, `count` by default
+
+        Returns:
+            Pipeline: self
+        """
+        if isinstance(group_by, str) and not group_by.startswith('$'):
+            group_by = f'${group_by}'
+        bucket: Dict[str, Any] = {
+            'groupBy': self._check_expression(group_by),
+            'boundaries': list(boundaries),
+        }
+        if default is not None:
+            bucket['default'] = default
+        if output:
+            bucket['output'] = self._accumulators((), output)
+        fields = {'_id'} | (set(output) if output else {'count'})
+        return self._add({'$bucket': bucket}, fields)
+
+    def stage(self, stage: Dict) -> 'Pipeline':
+        """raw stage, output fields become unknown and are not validated
+
+        Args:
+            stage (Dict): stage in mongo syntax
+
+        Returns:
+            Pipeline: self
+        """
+        self._stages.append(stage)
+        self._fields = None
+        self._model_shape = False
+        return self
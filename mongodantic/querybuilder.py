@@ -1,3 +1,5 @@
+import asyncio
+import os
 from typing import (
     Union,
     List,
@@ -5,43 +7,169 @@ from typing import (
     Optional,
     Any,
     Tuple,
+    Type,
     TYPE_CHECKING,
     Generator,
+    Iterator,
+    Deque,
+    Callable,
+    AsyncGenerator,
     no_type_check,
 )
+from copy import copy
+from threading import Lock
+from collections import deque
 from collections.abc import Iterable
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from functools import partial
+from itertools import chain, islice
+from inspect import isawaitable
+from pydantic import BaseModel
 from pymongo import ReturnDocument
 from pymongo import IndexModel
 from pymongo.client_session import ClientSession
+from pymongo.collection import Collection
+from pymongo.errors import BulkWriteError
+import bson
 from bson import ObjectId
+from bson.errors import InvalidDocument
 
 from .exceptions import (
     MongoValidationError,
     MongoIndexError,
+    NotDeclaredField,
+    BulkOperationError,
 )
 from .helpers import (
-    chunk_by_length,
     bulk_query_generator,
     generate_name_field,
+    generate_projection,
     sort_validation,
     group_by_aggregate_generation,
+)
+from .retry import (
+    RetryPolicy,
     handle_and_convert_connection_errors,
+    async_handle_and_convert_connection_errors,
+    without_retries,
+)
+from .queryset import QuerySet, AsyncQuerySet, _raw_document
+from .bulk import BulkResult
+from .monitoring import (
+    MonitoredAsyncCursor,
+    MonitoredCursor,
+    start_event,
+    finish_event,
+)
+from .pagination import Keyset, Page
+from .pipeline import Pipeline
+from .parallel import (
+    SAMPLES_PER_PARTITION,
+    SPLIT_METHODS,
+    id_ranges,
+    init_worker,
+    interpolate_ids,
+    merge_results,
+    range_filter,
+    sample_boundaries,
+    scan_partition,
+    worker_settings,
 )
-from .queryset import QuerySet
 from .logical import LogicalCombination, Query
 from .aggregation import Sum, Max, Min, Avg
 from .exceptions import DoesNotExist
 from .sync_async import sync_to_async
+from .connection import _connection_settings, get_connection_env
 
 if TYPE_CHECKING:
     from .models import MongoModel
 
-__all__ = ('QueryBuilder', 'AsyncQueryBuilder')
+__all__ = ('QueryBuilder', 'AsyncQueryBuilder', 'MotorQueryBuilder')
+
+
+class _ValidatedQuery(dict):
+    """filter in mongo syntax, it is passed to driver without validation"""
+
+
+# driver methods which change collection, they invalidate result cache of model
+_WRITE_METHODS = frozenset(
+    (
+        'insert_one',
+        'insert_many',
+        'update_one',
+        'update_many',
+        'replace_one',
+        'delete_one',
+        'delete_many',
+        'find_one_and_update',
+        'find_one_and_replace',
+        'find_one_and_delete',
+        'bulk_write',
+        'drop',
+        'rename',
+        # legacy pymongo methods, available in raw_query
+        'insert',
+        'update',
+        'remove',
+        'save',
+        'find_and_modify',
+    )
+)
+
+
+# threads of shared pool for concurrent count of find_with_count and bulk batches
+THREAD_POOL_SIZE = 32
+_thread_pool: Optional[ThreadPoolExecutor] = None
+_thread_pool_lock = Lock()
+
+
+def _get_thread_pool() -> ThreadPoolExecutor:
+    """shared thread pool, created on first use and after fork"""
+    global _thread_pool
+    if _thread_pool is None:
+        with _thread_pool_lock:
+            if _thread_pool is None:
+                _thread_pool = ThreadPoolExecutor(
+                    max_workers=THREAD_POOL_SIZE, thread_name_prefix='mongodantic'
+                )
+    return _thread_pool
+
+
+def _reset_thread_pool_after_fork() -> None:
+    # threads of parent pool do not exist in child process
+    global _thread_pool, _thread_pool_lock
+    _thread_pool = None
+    _thread_pool_lock = Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_thread_pool_after_fork)
 
 
 class QueryBuilder(object):
+    _queryset_class = QuerySet
+
     def __init__(self, mongo_model: 'MongoModel'):
         self._mongo_model: 'MongoModel' = mongo_model
+        self._retry_policy: Optional[RetryPolicy] = None
+
+    def with_retry(self, retry_policy: RetryPolicy) -> Any:
+        """copy of querybuilder with own retry policy
+
+        Args:
+            retry_policy (RetryPolicy): policy for connection errors
+
+        Returns:
+            QueryBuilder: querybuilder of same model
+        """
+        querybuilder = copy(self)
+        querybuilder._retry_policy = retry_policy
+        return querybuilder
 
     @handle_and_convert_connection_errors
     def __query(
@@ -65,20 +193,119 @@ class QueryBuilder(object):
         Returns:
             Any: query result
         """
+        method = getattr(self._mongo_model._collection, method_name)
+        query, kwargs = self._prepare_query(
+            query_params, set_values, session, logical, **kwargs
+        )
+        event = start_event(self._mongo_model, method_name, query, kwargs)
+        try:
+            result = method(*query, **kwargs) if kwargs else method(*query)
+        except Exception as e:
+            finish_event(event, error=e)
+            raise
+        finally:
+            if method_name in _WRITE_METHODS:
+                self._invalidate_result_cache(session)
+        if event is not None and method_name == 'find':
+            # find is lazy, the event is finished with the first batch
+            return MonitoredCursor(result, event)
+        finish_event(event, result)
+        return result
+
+    def _compile_filter(
+        self, logical_query: Union[Query, LogicalCombination, None], query: Dict
+    ) -> _ValidatedQuery:
+        return _ValidatedQuery(
+            self._mongo_model._check_query_args(logical_query)
+            if logical_query
+            else self._mongo_model._validate_query_data(query)
+        )
+
+    def _result_cache_namespace(self) -> str:
+        # db.collection from connect settings, models of one collection share generation
+        env_name = self._mongo_model.__connection_env__ or get_connection_env()
+        dbname = _connection_settings.get(env_name, {}).get('dbname', env_name)
+        return f'{dbname}.{self._mongo_model._collection_name}'
+
+    def _result_cache_key(
+        self, method_name: str, session: Optional[ClientSession], *params: Any
+    ) -> Optional[str]:
+        """key of read query in model result cache, None if result is not cached"""
+        cache = self._mongo_model.__result_cache__
+        if cache is None or session is not None:
+            return None
+        return cache.key(self._result_cache_namespace(), method_name, params)
+
+    def _get_cached_result(self, key: Optional[str]) -> Tuple[bool, Any]:
+        if key is None:
+            return False, None
+        return self._mongo_model.__result_cache__.get(key)
+
+    def _set_cached_result(self, key: Optional[str], value: Any) -> None:
+        if key is not None:
+            self._mongo_model.__result_cache__.set(key, value)
+
+    def _invalidate_result_cache(
+        self, session: Optional[ClientSession] = None
+    ) -> None:
+        cache = self._mongo_model.__result_cache__
+        if cache is not None:
+            cache.invalidate(self._result_cache_namespace(), session)
+
+    def _prepare_query(
+        self,
+        query_params: Union[List, Dict, str, Query, LogicalCombination],
+        set_values: Optional[Dict] = None,
+        session: Optional[ClientSession] = None,
+        logical: bool = False,
+        **kwargs,
+    ) -> Tuple[tuple, Dict]:
+        """validate query params and build driver method arguments
+
+        Returns:
+            Tuple[tuple, Dict]: positional and keyword arguments for driver method
+        """
         if logical:
             query_params = self._mongo_model._check_query_args(query_params)
-        elif isinstance(query_params, dict):
+        elif isinstance(query_params, dict) and not isinstance(
+            query_params, _ValidatedQuery
+        ):
             query_params = self._mongo_model._validate_query_data(query_params)
 
-        method = getattr(self._mongo_model._collection, method_name)
         query: tuple = (query_params,)
         if session:
             kwargs['session'] = session
         if set_values:
             query = (query_params, set_values)
-        if kwargs:
-            return method(*query, **kwargs)
-        return method(*query)
+        return query, kwargs
+
+    def _monitored_call(self, method_name: str, query: Any, *args, **kwargs) -> Any:
+        """driver call which is not built by __query, reported to query listeners
+
+        Args:
+            method_name (str): pymongo collection method
+            query (Any): filter or document of event
+
+        Returns:
+            Any: query result
+        """
+        method = getattr(self._mongo_model._collection, method_name)
+        event = start_event(self._mongo_model, method_name, (query,), kwargs)
+        try:
+            result = method(*args, **kwargs)
+        except Exception as e:
+            finish_event(event, error=e)
+            raise
+        finish_event(event, result)
+        return result
+
+    def list_indexes(self) -> List[Dict]:
+        """full specs of collection indexes: key, name and options
+
+        Returns:
+            List[Dict]: list_indexes documents
+        """
+        return [dict(index) for index in self.__query('list_indexes', {})]
 
     def check_indexes(self) -> dict:
         """get indexes for this collection
@@ -86,10 +313,8 @@ class QueryBuilder(object):
         Returns:
             dict: indexes result
         """
-        index_list = list(self.__query('list_indexes', {}))
         return_data = {}
-        for index in index_list:
-            dict_index = dict(index)
+        for dict_index in self.list_indexes():
             data = {dict_index['name']: {'key': dict(dict_index['key'])}}
             return_data.update(data)
         return return_data
@@ -101,9 +326,20 @@ class QueryBuilder(object):
     ) -> List[str]:
         return self.__query('create_indexes', indexes, session=session)
 
-    def drop_index(self, index_name: str) -> str:
-        indexes = self.check_indexes()
-        if index_name in indexes:
+    def drop_index(self, index_name: str, check: bool = True) -> str:
+        """drop index by name
+
+        Args:
+            index_name (str): index name
+            check (bool, optional): check that index exists with extra list_indexes call. Defaults to True.
+
+        Raises:
+            MongoIndexError: if index does not exist
+
+        Returns:
+            str: message
+        """
+        if not check or index_name in self.check_indexes():
             self.__query('drop_index', index_name)
             return f'{index_name} dropped.'
         raise MongoIndexError(f'invalid index name - {index_name}')
@@ -123,19 +359,17 @@ class QueryBuilder(object):
         Returns:
             int: count of documents
         """
+        filter_ = self._compile_filter(logical_query, query)
+        key = self._result_cache_key('count', session, filter_)
+        found, count = self._get_cached_result(key)
+        if found:
+            return count
         if getattr(self._mongo_model._collection, 'count_documents'):
-            return self.__query(
-                'count_documents',
-                logical_query or query,
-                session=session,
-                logical=bool(logical_query),
-            )
-        return self.__query(
-            'count',
-            logical_query or query,
-            session=session,
-            logical=bool(logical_query),
-        )
+            count = self.__query('count_documents', filter_, session=session)
+        else:
+            count = self.__query('count', filter_, session=session)
+        self._set_cached_result(key, count)
+        return count
 
     def count_documents(
         self,
@@ -160,6 +394,8 @@ class QueryBuilder(object):
         session: Optional[ClientSession] = None,
         sort_fields: Optional[Union[Tuple, List]] = None,
         sort: Optional[int] = None,
+        only: Union[Tuple, List, None] = None,
+        exclude: Union[Tuple, List, None] = None,
         **query,
     ) -> Optional['MongoModel']:
         """find one document
@@ -169,20 +405,29 @@ class QueryBuilder(object):
             session (Optional[ClientSession], optional): pymongo session. Defaults to None.
             sort_fields (Optional[Union[Tuple, List]], optional): iterable from sort fielda. Defaults to None.
             sort (Optional[int], optional): sort value -1 or 1. Defaults to None.
+            only (Union[Tuple, List, None], optional): fetch only this fields. Defaults to None.
+            exclude (Union[Tuple, List, None], optional): skip this fields. Defaults to None.
 
         Returns:
             Optional[MongoModel]: MongoModel instance or None
         """
         sort, sort_fields = sort_validation(sort, sort_fields)
-        data = self.__query(
-            'find_one',
-            logical_query or query,
-            session=session,
-            logical=bool(logical_query),
-            sort=[(field, sort or 1) for field in sort_fields] if sort_fields else None,
-        )
+        projection = generate_projection(self._mongo_model, only, exclude)
+        filter_ = self._compile_filter(logical_query, query)
+        sort_ = [(field, sort or 1) for field in sort_fields] if sort_fields else None
+        key = self._result_cache_key('find_one', session, filter_, sort_, projection)
+        found, data = self._get_cached_result(key)
+        if not found:
+            data = self.__query(
+                'find_one',
+                filter_,
+                session=session,
+                sort=sort_,
+                projection=projection,
+            )
+            self._set_cached_result(key, data)
         if data:
-            obj = self._mongo_model.parse_obj(data)
+            obj = self._get_parser(projection)(data)
             return obj
         return None
 
@@ -194,21 +439,42 @@ class QueryBuilder(object):
         session: Optional[ClientSession] = None,
         sort_fields: Optional[Union[Tuple, List]] = None,
         sort: Optional[int] = None,
+        only: Union[Tuple, List, None] = None,
+        exclude: Union[Tuple, List, None] = None,
         **query,
     ) -> Generator:
-        data = self.__query(
-            'find', logical_query or query, session=session, logical=bool(logical_query)
+        return self.__query(
+            'find',
+            logical_query or query,
+            session=session,
+            logical=bool(logical_query),
+            projection=generate_projection(self._mongo_model, only, exclude),
+            **self._cursor_options(skip_rows, limit_rows, sort_fields, sort),
         )
+
+    def _get_parser(self, projection: Optional[Dict] = None) -> Callable:
+        if projection:
+            return self._mongo_model._parse_partial
+        return self._mongo_model.parse_obj
+
+    @staticmethod
+    def _cursor_options(
+        skip_rows: Optional[int] = None,
+        limit_rows: Optional[int] = None,
+        sort_fields: Optional[Union[Tuple, List]] = None,
+        sort: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """skip, limit and sort arguments of driver find, they are part of
+        query event and slow query shape"""
+        options: Dict[str, Any] = {}
         if skip_rows is not None:
-            data = data.skip(skip_rows)
+            options['skip'] = skip_rows
         if limit_rows:
-            data = data.limit(limit_rows)
+            options['limit'] = limit_rows
         sort, sort_fields = sort_validation(sort, sort_fields)
-        return (
-            data.sort([(field, sort or 1) for field in sort_fields])
-            if sort_fields
-            else data
-        )
+        if sort_fields:
+            options['sort'] = [(field, sort or 1) for field in sort_fields]
+        return options
 
     def find(
         self,
@@ -218,6 +484,9 @@ class QueryBuilder(object):
         session: Optional[ClientSession] = None,
         sort_fields: Optional[Union[Tuple, List]] = None,
         sort: Optional[int] = None,
+        only: Union[Tuple, List, None] = None,
+        exclude: Union[Tuple, List, None] = None,
+        validate: bool = True,
         **query,
     ) -> QuerySet:
         """find method
@@ -229,14 +498,114 @@ class QueryBuilder(object):
             session (Optional[ClientSession], optional): pymongo session. Defaults to None.
             sort_fields (Optional[Union[Tuple, List]], optional): iterable from sort fielda. Defaults to None.
             sort (Optional[int], optional): sort value -1 or 1. Defaults to None.
+            only (Union[Tuple, List, None], optional): fetch only this fields. Defaults to None.
+            exclude (Union[Tuple, List, None], optional): skip this fields. Defaults to None.
+            validate (bool, optional): if False QuerySet yields raw documents. Defaults to True.
 
         Returns:
             QuerySet: Mongodantic QuerySet
         """
         data = self._find(
-            logical_query, skip_rows, limit_rows, session, sort_fields, sort, **query
+            logical_query,
+            skip_rows,
+            limit_rows,
+            session,
+            sort_fields,
+            sort,
+            only=only,
+            exclude=exclude,
+            **query,
         )
-        return QuerySet(self._mongo_model, data)
+        queryset = QuerySet(
+            self._mongo_model,
+            data,
+            self._get_parser(generate_projection(self._mongo_model, only, exclude)),
+        )
+        return queryset if validate else queryset.raw()
+
+    def _prepare_count(
+        self,
+        logical_query: Union[Query, LogicalCombination, None],
+        session: Optional[ClientSession],
+        estimated: bool,
+        query: Dict,
+    ) -> Tuple[_ValidatedQuery, bool, Optional[Tuple]]:
+        """filter, estimated flag and count cache key (None if cache is disabled)
+
+        estimated_document_count reads collection metadata, so it is used only
+        for empty filter and outside of session
+        """
+        filter_ = self._compile_filter(logical_query, query)
+        estimated = estimated and not filter_ and session is None
+        if self._mongo_model.__count_cache__ is None:
+            return filter_, estimated, None
+        try:
+            encoded = bson.encode(filter_)
+        except (InvalidDocument, TypeError):
+            return filter_, estimated, None
+        env_name = self._mongo_model.__connection_env__ or get_connection_env()
+        return filter_, estimated, (env_name, estimated, encoded)
+
+    def _get_cached_count(self, key: Optional[Tuple]) -> Optional[int]:
+        if key is None:
+            return None
+        return self._mongo_model.__count_cache__.get(key)
+
+    def _set_cached_count(self, key: Optional[Tuple], count: int) -> None:
+        if key is not None:
+            self._mongo_model.__count_cache__.set(key, count)
+
+    @handle_and_convert_connection_errors
+    def _estimated_count(self) -> int:
+        return self._monitored_call('estimated_document_count', None)
+
+    def _count_with_cache(
+        self,
+        logical_query: Union[Query, LogicalCombination, None] = None,
+        session: Optional[ClientSession] = None,
+        estimated: bool = False,
+        query: Optional[Dict] = None,
+    ) -> int:
+        filter_, estimated, key = self._prepare_count(
+            logical_query, session, estimated, query or {}
+        )
+        count = self._get_cached_count(key)
+        if count is None:
+            if estimated:
+                count = self._estimated_count()
+            else:
+                count = self.__query('count_documents', filter_, session=session)
+            self._set_cached_count(key, count)
+        return count
+
+    @handle_and_convert_connection_errors
+    def _find_prefetched(
+        self,
+        logical_query: Union[Query, LogicalCombination, None],
+        skip_rows: Optional[int],
+        limit_rows: Optional[int],
+        session: Optional[ClientSession],
+        sort_fields: Optional[Union[Tuple, List]],
+        sort: Optional[int],
+        only: Union[Tuple, List, None],
+        exclude: Union[Tuple, List, None],
+        query: Dict,
+    ) -> Iterator:
+        """find sent to server now, first document is buffered"""
+        # the whole call with the first batch is retried by this method
+        cursor = without_retries(self.__query)(
+            'find',
+            logical_query or query,
+            session=session,
+            logical=bool(logical_query),
+            projection=generate_projection(self._mongo_model, only, exclude),
+            **self._cursor_options(skip_rows, limit_rows, sort_fields, sort),
+        )
+        try:
+            first = next(cursor)
+        except StopIteration:
+            return iter(())
+        return chain((first,), cursor)
 
     def find_with_count(
         self,
@@ -246,6 +615,10 @@ class QueryBuilder(object):
         session: Optional[ClientSession] = None,
         sort_fields: Optional[Union[Tuple, List]] = None,
         sort: Optional[int] = None,
+        only: Union[Tuple, List, None] = None,
+        exclude: Union[Tuple, List, None] = None,
+        estimated: bool = False,
+        concurrent: bool = False,
         **query,
     ) -> tuple:
         """find and count
@@ -257,26 +630,272 @@ class QueryBuilder(object):
             session (Optional[ClientSession], optional): pymongo session. Defaults to None.
             sort_fields (Optional[Union[Tuple, List]], optional): field for sort. Defaults to None.
             sort (Optional[int], optional): sort value. Defaults to None.
+            only (Union[Tuple, List, None], optional): fetch only this fields. Defaults to None.
+            exclude (Union[Tuple, List, None], optional): skip this fields. Defaults to None.
+            estimated (bool, optional): use estimated_document_count for empty filter. Defaults to False.
+            concurrent (bool, optional): run count in other thread (own pool connection) while first batch of find is fetched, ignored with session. Defaults to False.
 
         Returns:
             tuple: count of query data, QuerySet
         """
-        count = self.count(
-            session=session,
-            logical_query=logical_query,
-            **query,
+        if not concurrent or session is not None:
+            count = self._count_with_cache(logical_query, session, estimated, query)
+            results = self.find(
+                skip_rows=skip_rows,
+                limit_rows=limit_rows,
+                session=session,
+                logical_query=logical_query,
+                sort_fields=sort_fields,
+                sort=sort,
+                only=only,
+                exclude=exclude,
+                **query,
+            )
+            return count, results
+        future = _get_thread_pool().submit(
+            self._count_with_cache, logical_query, None, estimated, query
         )
-        results = self.find(
-            skip_rows=skip_rows,
-            limit_rows=limit_rows,
-            session=session,
-            logical_query=logical_query,
-            sort_fields=sort_fields,
-            sort=sort,
-            **query,
+        try:
+            data = self._find_prefetched(
+                logical_query,
+                skip_rows,
+                limit_rows,
+                None,
+                sort_fields,
+                sort,
+                only,
+                exclude,
+                query,
+            )
+        finally:
+            count = future.result()
+        results = QuerySet(
+            self._mongo_model,
+            data,
+            self._get_parser(generate_projection(self._mongo_model, only, exclude)),
         )
         return count, results
 
+    def _prepare_paginate(
+        self,
+        logical_query: Union[Query, LogicalCombination, None],
+        after: Optional[str],
+        limit: int,
+        sort_fields: Optional[Union[Tuple, List]],
+        sort: Optional[int],
+        only: Union[Tuple, List, None],
+        exclude: Union[Tuple, List, None],
+        query: Dict,
+    ) -> Tuple[Keyset, _ValidatedQuery, Optional[Dict]]:
+        if not limit or limit <= 0:
+            raise MongoValidationError('limit must be greater than 0')
+        keyset = Keyset(sort_fields, sort)
+        if logical_query:
+            filter_ = self._mongo_model._check_query_args(logical_query)
+        else:
+            filter_ = self._mongo_model._validate_query_data(query)
+        projection = keyset.projection(
+            generate_projection(self._mongo_model, only, exclude)
+        )
+        return keyset, _ValidatedQuery(keyset.apply(filter_, after)), projection
+
+    def _parse_page(
+        self,
+        keyset: Keyset,
+        documents: List[Dict],
+        limit: int,
+        projection: Optional[Dict],
+        count: Optional[int],
+        validate: bool,
+    ) -> Page:
+        next_token = None
+        if len(documents) > limit:
+            documents = documents[:limit]
+            next_token = keyset.encode(documents[-1])
+        items = QuerySet(self._mongo_model, documents, self._get_parser(projection))
+        return Page(items if validate else items.raw(), next_token, count)
+
+    def paginate(
+        self,
+        logical_query: Union[Query, LogicalCombination, None] = None,
+        after: Optional[str] = None,
+        limit: int = 100,
+        sort_fields: Optional[Union[Tuple, List]] = None,
+        sort: Optional[int] = None,
+        session: Optional[ClientSession] = None,
+        only: Union[Tuple, List, None] = None,
+        exclude: Union[Tuple, List, None] = None,
+        with_count: bool = False,
+        validate: bool = True,
+        **query,
+    ) -> Page:
+        """keyset pagination, next page starts after sort values of previous page last row,
+        so page latency does not depend on page depth unlike skip_rows
+
+        Args:
+            logical_query (Union[Query, LogicalCombination, None], optional): Query|LogicalCombination or None. Defaults to None.
+            after (Optional[str], optional): next_token of previous page, None - first page. Defaults to None.
+            limit (int, optional): page size. Defaults to 100.
+            sort_fields (Optional[Union[Tuple, List]], optional): sort fields, `_id` is added as tiebreaker. Defaults to None.
+            sort (Optional[int], optional): 1 or -1 for all sort fields. Defaults to None.
+            session (Optional[ClientSession], optional): pymongo session. Defaults to None.
+            only (Union[Tuple, List, None], optional): fetch only this fields. Defaults to None.
+            exclude (Union[Tuple, List, None], optional): skip this fields. Defaults to None.
+            with_count (bool, optional): count all rows of query. Defaults to False.
+            validate (bool, optional): False - rows are raw documents. Defaults to True.
+
+        Raises:
+            MongoValidationError: if invalid limit or token
+
+        Returns:
+            Page: rows, next_token and count
+        """
+        keyset, filter_, projection = self._prepare_paginate(
+            logical_query, after, limit, sort_fields, sort, only, exclude, query
+        )
+        documents = self._find_page(keyset, filter_, limit, projection, session)
+        count = None
+        if with_count:
+            count = self.count(logical_query, session=session, **query)
+        return self._parse_page(keyset, documents, limit, projection, count, validate)
+
+    def _find_page(
+        self,
+        keyset: Keyset,
+        filter_: Dict,
+        limit: int,
+        projection: Optional[Dict] = None,
+        session: Optional[ClientSession] = None,
+    ) -> List[Dict]:
+        """page documents and one more to know if next page exists"""
+        cursor = self.__query(
+            'find',
+            filter_,
+            session=session,
+            projection=projection,
+            sort=keyset.sort,
+            limit=limit + 1,
+        )
+        return list(cursor)
+
+    def _scan(
+        self, filter_: Dict, projection: Optional[Dict], batch_size: int
+    ) -> Any:
+        """cursor of validated filter in _id order for parallel_scan partition"""
+        return self.__query(
+            'find',
+            _ValidatedQuery(filter_),
+            projection=projection,
+            sort=[('_id', 1)],
+            batch_size=batch_size,
+        )
+
+    def _split_ids(self, filter_: Dict, partitions: int, split: str) -> List[Any]:
+        """_id boundaries of partitions by sampled quantiles or min/max interpolation,
+        empty if collection can not be split"""
+        if partitions < 2:
+            return []
+        if split == 'sample':
+            stages = [{'$match': filter_}] if filter_ else []
+            stages += [
+                {'$sample': {'size': partitions * SAMPLES_PER_PARTITION}},
+                {'$project': {'_id': 1}},
+            ]
+            ids = [row['_id'] for row in self.__query('aggregate', stages)]
+            try:
+                return sample_boundaries(ids, partitions)
+            except TypeError:
+                # _id values of different types are not comparable
+                return []
+        edges = []
+        for direction in (1, -1):
+            edge = list(
+                self.__query(
+                    'find',
+                    _ValidatedQuery(filter_),
+                    projection={'_id': 1},
+                    sort=[('_id', direction)],
+                    limit=1,
+                )
+            )
+            if not edge:
+                return []
+            edges.append(edge[0]['_id'])
+        return interpolate_ids(edges[0], edges[1], partitions)
+
+    def parallel_scan(
+        self,
+        fn: Callable[[Any], Any],
+        partitions: Optional[int] = None,
+        workers: Optional[int] = None,
+        logical_query: Union[Query, LogicalCombination, None] = None,
+        reduce: Optional[Callable[[Any, Any], Any]] = None,
+        split: str = 'sample',
+        batch_size: int = 1000,
+        only: Union[Tuple, List, None] = None,
+        exclude: Union[Tuple, List, None] = None,
+        mp_context: Any = None,
+        **query,
+    ) -> Any:
+        """scan of documents split into _id ranges in process pool, for CPU-bound
+        processing of models, every worker opens own connection
+
+        Model, fn and reduce are pickled to workers, so they must be defined at
+        module level.
+
+        Args:
+            fn (Callable[[Any], Any]): called with every model object in worker
+            partitions (Optional[int], optional): count of _id ranges. Defaults to None - workers * 4.
+            workers (Optional[int], optional): worker processes, 0 scans partitions in current process. Defaults to None - cpu count.
+            logical_query (Union[Query, LogicalCombination, None], optional): Query | LogicalCombination. Defaults to None.
+            reduce (Optional[Callable[[Any, Any], Any]], optional): associative function which folds fn results in workers and partition results in parent. Defaults to None - list of fn results.
+            split (str, optional): `sample` - quantiles of $sample _ids, `interpolate` - between min and max _id (ObjectId or int). Defaults to 'sample'.
+            batch_size (int, optional): cursor batch size. Defaults to 1000.
+            only (Union[Tuple, List, None], optional): fetch only this fields. Defaults to None.
+            exclude (Union[Tuple, List, None], optional): skip this fields. Defaults to None.
+            mp_context (Any, optional): multiprocessing context, like get_context('spawn'). Defaults to None - platform default.
+
+        Returns:
+            Any: fn results in _id order, or folded result (None for no documents) if reduce is set
+        """
+        if split not in SPLIT_METHODS:
+            raise ValueError(f'invalid split - {split}, must be one of {SPLIT_METHODS}')
+        if batch_size <= 0:
+            raise ValueError('batch_size must be greater than 0')
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if partitions is None:
+            partitions = max(workers, 1) * 4
+        if partitions < 1:
+            raise ValueError('partitions must be greater than 0')
+        filter_ = self._compile_filter(logical_query, query)
+        projection = generate_projection(self._mongo_model, only, exclude)
+        filters = [
+            _ValidatedQuery(range_filter(dict(filter_), id_range))
+            for id_range in id_ranges(self._split_ids(filter_, partitions, split))
+        ]
+        args = (projection, batch_size, fn, reduce)
+        if not workers:
+            results = [
+                scan_partition(self._mongo_model, partition_filter, *args)
+                for partition_filter in filters
+            ]
+            return merge_results(results, reduce)
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(filters)),
+            mp_context=mp_context,
+            initializer=init_worker,
+            initargs=worker_settings(self._mongo_model),
+        ) as executor:
+            futures = [
+                executor.submit(
+                    scan_partition, self._mongo_model, partition_filter, *args
+                )
+                for partition_filter in filters
+            ]
+            results = [future.result() for future in futures]
+        return merge_results(results, reduce)
+
     def insert_one(self, session: Optional[ClientSession] = None, **query) -> ObjectId:
         """insert one document
 
@@ -306,11 +925,7 @@ class QueryBuilder(object):
         Returns:
             int: count inserted ids
         """
-        parse_obj = self._mongo_model.parse_obj
-        query = [
-            parse_obj(obj).query_data if isinstance(obj, dict) else obj.query_data
-            for obj in data
-        ]
+        query = self._prepare_insert_data(data)
         r = self.__query(
             'insert_many',
             query,
@@ -320,6 +935,29 @@ class QueryBuilder(object):
         )
         return len(r.inserted_ids)
 
+    def _insert_documents(
+        self,
+        documents: List[Dict],
+        session: Optional[ClientSession] = None,
+        ordered: bool = True,
+        bypass_document_validation: bool = False,
+    ) -> int:
+        r = self.__query(
+            'insert_many',
+            documents,
+            session=session,
+            ordered=ordered,
+            bypass_document_validation=bypass_document_validation,
+        )
+        return len(r.inserted_ids)
+
+    def _prepare_insert_data(self, data: List) -> List[Dict]:
+        parse_obj = self._mongo_model.parse_obj
+        return [
+            parse_obj(obj).query_data if isinstance(obj, dict) else obj.query_data
+            for obj in data
+        ]
+
     def delete_one(
         self,
         logical_query: Union[Query, LogicalCombination, None] = None,
@@ -366,6 +1004,31 @@ class QueryBuilder(object):
         )
         return r.deleted_count
 
+    def _prepare_update_document(self, **fields) -> Tuple[Dict, Dict]:
+        """prepare filter and update document, `<field>__set` keys go to $set
+        and `<field>__unset=True` keys go to $unset"""
+
+        unset_values = {}
+        for name in tuple(fields):
+            if name.endswith('__unset'):
+                field = name[: -len('__unset')]
+                if field not in self._mongo_model.__fields__:
+                    raise NotDeclaredField(
+                        field, list(self._mongo_model.__fields__.keys())
+                    )
+                if fields.pop(name):
+                    unset_values[field] = ''
+        if unset_values and not any("__set" in f for f in fields):
+            query_params, set_values = fields, {}
+        else:
+            query_params, set_values = self._prepare_update_data(**fields)
+        update: Dict = {}
+        if set_values:
+            update['$set'] = set_values
+        if unset_values:
+            update['$unset'] = unset_values
+        return query_params, update
+
     def _prepare_update_data(self, **fields) -> tuple:
         """prepare and validate query data for update queries"""
 
@@ -421,6 +1084,8 @@ class QueryBuilder(object):
         session: Optional[ClientSession] = None,
         sort_fields: Optional[Union[Tuple, List]] = None,
         sort: Optional[int] = None,
+        only: Union[Tuple, List, None] = None,
+        exclude: Union[Tuple, List, None] = None,
         **query,
     ) -> Any:
         """method like django orm get"""
@@ -430,15 +1095,22 @@ class QueryBuilder(object):
             session=session,
             sort_fields=sort_fields,
             sort=sort,
+            only=only,
+            exclude=exclude,
             **query,
         )
         if not obj:
             raise DoesNotExist(self._mongo_model.__name__)  # type: ignore
         return obj
 
-    def __validate_raw_query(
+    def _validate_raw_query(
         self, method_name: str, raw_query: Union[Dict, List[Dict], Tuple[Dict]]
     ) -> tuple:
+        # driver collections return sub-collection for unknown attributes
+        if method_name.startswith('_') or not callable(
+            getattr(Collection, method_name, None)
+        ):
+            raise MongoValidationError('invalid method name')
         if (
             'insert' in method_name
             or 'replace' in method_name
@@ -511,12 +1183,17 @@ class QueryBuilder(object):
         Returns:
             Any: pymongo query result
         """
-        parsed_query = self.__validate_raw_query(method_name, raw_query)
+        parsed_query = self._validate_raw_query(method_name, raw_query)
         try:
-            query = getattr(self._mongo_model._collection, method_name)
-            return query(*parsed_query, session=session)
-        except AttributeError:
-            raise MongoValidationError('invalid method name')
+            return self._monitored_call(
+                method_name,
+                parsed_query[0] if parsed_query else None,
+                *parsed_query,
+                session=session,
+            )
+        finally:
+            if method_name in _WRITE_METHODS:
+                self._invalidate_result_cache(session)
 
     def _update(
         self,
@@ -536,10 +1213,8 @@ class QueryBuilder(object):
         Returns:
             int: updated documents count
         """
-        query, set_values = self._prepare_update_data(**query)
-        r = self.__query(
-            method, query, {'$set': set_values}, upsert=upsert, session=session
-        )
+        query, update = self._prepare_update_document(**query)
+        r = self.__query(method, query, update, upsert=upsert, session=session)
         return r.modified_count
 
     def update_one(
@@ -583,35 +1258,180 @@ class QueryBuilder(object):
             list: list of distinct values
         """
         query = self._mongo_model._validate_query_data(query)
-        method = getattr(self._mongo_model._collection, 'distinct')
-        return method(key=field, filter=query, session=session)
+        key = self._result_cache_key('distinct', session, field, query)
+        found, values = self._get_cached_result(key)
+        if found:
+            return values
+        values = self._monitored_call(
+            'distinct', query, key=field, filter=query, session=session
+        )
+        self._set_cached_result(key, values)
+        return values
+
+    def _raw_aggregate(
+        self,
+        data: Union[Pipeline, List[Dict[Any, Any]]],
+        session: Optional[ClientSession] = None,
+        stream: bool = False,
+        batch_size: Optional[int] = None,
+        allow_disk_use: bool = False,
+        parser: Callable = _raw_document,
+    ) -> Union[List, QuerySet]:
+        stages, options = self._prepare_pipeline(data, allow_disk_use, batch_size)
+        cursor = self.__query('aggregate', stages, session=session, **options)
+        if stream:
+            return self._queryset_class(self._mongo_model, cursor, parser)
+        return [parser(row) for row in cursor]
 
     def raw_aggregate(
-        self, data: List[Dict[Any, Any]], session: Optional[ClientSession] = None
-    ) -> list:
+        self,
+        data: List[Dict[Any, Any]],
+        session: Optional[ClientSession] = None,
+        stream: bool = False,
+        batch_size: Optional[int] = None,
+        allow_disk_use: bool = False,
+        result_model: Optional[Type[BaseModel]] = None,
+    ) -> Union[List, QuerySet]:
         """raw aggregation query
 
         Args:
             data (List[Dict[Any, Any]]): aggregation query
             session (Optional[ClientSession], optional): pymongo session. Defaults to None.
+            stream (bool, optional): return lazy QuerySet backed by cursor instead of list. Defaults to False.
+            batch_size (Optional[int], optional): documents per cursor batch. Defaults to None.
+            allow_disk_use (bool, optional): allow stages to write temporary files. Defaults to False.
+            result_model (Optional[Type[BaseModel]], optional): pydantic model for rows. Defaults to None - dicts.
+
+        Returns:
+            Union[List, QuerySet]: aggregation result
+        """
+        parser = result_model.parse_obj if result_model else _raw_document
+        return self._raw_aggregate(
+            data, session, stream, batch_size, allow_disk_use, parser
+        )
+
+    def raw_aggregate_iter(
+        self,
+        data: List[Dict[Any, Any]],
+        session: Optional[ClientSession] = None,
+        batch_size: Optional[int] = None,
+        allow_disk_use: bool = False,
+        result_model: Optional[Type[BaseModel]] = None,
+    ) -> QuerySet:
+        """raw_aggregate with stream=True, rows are fetched lazily by cursor batches"""
+        parser = result_model.parse_obj if result_model else _raw_document
+        return self._raw_aggregate(
+            data, session, True, batch_size, allow_disk_use, parser
+        )
+
+    @staticmethod
+    def _pop_stream_options(query: Dict) -> Tuple[bool, Optional[int], bool]:
+        """stream, batch_size and allow_disk_use of simple_aggregate"""
+        return (
+            query.pop('stream', False),
+            query.pop('batch_size', None),
+            query.pop('allow_disk_use', False),
+        )
+
+    @staticmethod
+    def _parse_aggregate_row(row: Dict) -> Tuple[Optional[str], Dict]:
+        name = generate_name_field(row.pop('_id'))
+        return name, row
+
+    def pipeline(self) -> Pipeline:
+        """new aggregation pipeline builder of this model
+
+        Returns:
+            Pipeline: empty pipeline
+        """
+        return Pipeline(self._mongo_model)
+
+    @staticmethod
+    def _prepare_pipeline(
+        pipeline: Union[Pipeline, List[Dict]],
+        allow_disk_use: bool = False,
+        batch_size: Optional[int] = None,
+    ) -> Tuple[List[Dict], Dict]:
+        """stages and driver options of aggregate"""
+        options: Dict[str, Any] = {}
+        if allow_disk_use:
+            options['allowDiskUse'] = True
+        if batch_size:
+            options['batchSize'] = batch_size
+        stages = pipeline.stages if isinstance(pipeline, Pipeline) else list(pipeline)
+        return stages, options
+
+    def _aggregate_cursor(
+        self,
+        pipeline: Union[Pipeline, List[Dict]],
+        session: Optional[ClientSession] = None,
+        allow_disk_use: bool = False,
+        batch_size: Optional[int] = None,
+    ) -> Any:
+        stages, options = self._prepare_pipeline(pipeline, allow_disk_use, batch_size)
+        return self.__query('aggregate', stages, session=session, **options)
+
+    def aggregate(
+        self,
+        pipeline: Union[Pipeline, List[Dict]],
+        session: Optional[ClientSession] = None,
+        allow_disk_use: bool = False,
+        batch_size: Optional[int] = None,
+        result_model: Optional[Type[BaseModel]] = None,
+    ) -> QuerySet:
+        """run aggregation pipeline, rows are fetched lazily by cursor batches
+
+        Args:
+            pipeline (Union[Pipeline, List[Dict]]): Pipeline or raw stages
+            session (Optional[ClientSession], optional): pymongo session. Defaults to None.
+            allow_disk_use (bool, optional): allow stages to write temporary files. Defaults to False.
+            batch_size (Optional[int], optional): documents per cursor batch. Defaults to None.
+            result_model (Optional[Type[BaseModel]], optional): pydantic model for rows. Defaults to None - dicts.
 
         Returns:
-            list: aggregation result
+            QuerySet: yields result documents
         """
-        return list(self.__query("aggregate", data, session=session))
+        data = self._aggregate_cursor(pipeline, session, allow_disk_use, batch_size)
+        parser = result_model.parse_obj if result_model else _raw_document
+        return QuerySet(self._mongo_model, data, parser)
 
-    def _aggregate(self, *args, **query) -> dict:
-        """main aggregate method
+    def _aggregate(self, *args, **query) -> Union[dict, QuerySet]:
+        """main aggregate method, with stream=True returns lazy QuerySet of
+        (group name, values) pairs, dict(pairs) is equal to not streamed result
+        for grouped aggregation
 
         Raises:
             MongoValidationError: miss aggregation or group_by
 
         Returns:
-            dict: aggregation result
+            Union[dict, QuerySet]: aggregation result
         """
         session = query.pop('session', None)
-        aggregation = query.pop('aggregation', None)
-        group_by = query.pop('group_by', None)
+        stream, batch_size, allow_disk_use = self._pop_stream_options(query)
+        data = self._prepare_aggregate(*args, **query)
+        if stream:
+            return self._raw_aggregate(
+                data,
+                session,
+                True,
+                batch_size,
+                allow_disk_use,
+                self._parse_aggregate_row,
+            )
+        result = self._raw_aggregate(data, session, False, batch_size, allow_disk_use)
+        return self._parse_aggregate_result(result)
+
+    def _prepare_aggregate(self, *args, **query) -> List[Dict]:
+        """build $match + $group pipeline for _aggregate
+
+        Raises:
+            MongoValidationError: miss aggregation or group_by
+
+        Returns:
+            List[Dict]: aggregation pipeline
+        """
+        aggregation = query.pop('aggregation', None)
+        group_by = query.pop('group_by', None)
         if not aggregation and not group_by:
             raise MongoValidationError('miss aggregation or group_by')
         if isinstance(aggregation, Iterable):
@@ -632,7 +1452,7 @@ class QueryBuilder(object):
                 if '_id' not in aggregate_query
                 else aggregate_query
             }
-        data = [
+        return [
             {
                 "$match": self._mongo_model._validate_query_data(query)
                 if not args
@@ -640,7 +1460,9 @@ class QueryBuilder(object):
             },
             group_params,
         ]
-        result = list(self.__query("aggregate", data, session=session))
+
+    @staticmethod
+    def _parse_aggregate_result(result: List[Dict]) -> dict:
         if not result:
             return {}
         result_data = {}
@@ -672,129 +1494,271 @@ class QueryBuilder(object):
             f'{agg_field}__avg', 0
         )
 
+    def _iter_bulk_batches(
+        self,
+        models: Iterable,
+        batch_size: Optional[int] = 10000,
+        prepare: Optional[Callable] = None,
+    ) -> Generator:
+        """lazy chunks of models as (offset, prepared batch), one chunk if batch_size is empty"""
+        if batch_size is None or batch_size <= 0:
+            models = list(models)
+            yield 0, prepare(models) if prepare else models
+            return
+        iterator = iter(models)
+        offset = 0
+        while True:
+            chunk = list(islice(iterator, batch_size))
+            if not chunk:
+                return
+            yield offset, prepare(chunk) if prepare else chunk
+            offset += len(chunk)
+
+    def _execute_batches(
+        self,
+        batches: Iterable,
+        write: Callable,
+        ordered: bool = True,
+        parallelism: int = 1,
+        threaded: bool = False,
+        session: Optional[ClientSession] = None,
+    ) -> BulkResult:
+        """write batches, up to `parallelism` batches are in flight while next batch is prepared,
+        with parallelism > 1 writes are ordered only within a batch
+
+        Args:
+            batches (Iterable): (offset, batch) items
+            write (Callable): write function for batch, returns BulkResult
+            ordered (bool, optional): raise first BulkWriteError and stop, else errors are collected. Defaults to True.
+            parallelism (int, optional): max concurrent batches. Defaults to 1.
+            threaded (bool, optional): write in background threads even if parallelism is 1. Defaults to False.
+            session (Optional[ClientSession], optional): session of writes, can't be shared by concurrent batches,
+                with session batches are written inline in calling thread. Defaults to None.
+
+        Raises:
+            ValueError: if session is set with parallelism > 1
+
+        Returns:
+            BulkResult: merged result of batches
+        """
+        if session is not None and parallelism > 1:
+            raise ValueError('session can not be used with parallelism > 1')
+
+        def run(batch_number: int, offset: int, batch: List) -> BulkResult:
+            try:
+                return write(batch)
+            except BulkWriteError as e:
+                if ordered:
+                    raise
+                return BulkResult.from_error(batch_number, offset, e.details)
+
+        result = BulkResult()
+        parallelism = max(parallelism or 1, 1)
+        if parallelism == 1 and (not threaded or session is not None):
+            for batch_number, (offset, batch) in enumerate(batches):
+                result.merge(run(batch_number, offset, batch))
+            return result
+        # shared pool caps parallelism by THREAD_POOL_SIZE
+        executor = _get_thread_pool()
+        pending: Deque[Future] = deque()
+        try:
+            for batch_number, (offset, batch) in enumerate(batches):
+                if len(pending) >= parallelism:
+                    result.merge(pending.popleft().result())
+                pending.append(executor.submit(run, batch_number, offset, batch))
+            while pending:
+                result.merge(pending.popleft().result())
+        finally:
+            # batches already sent are finished before the error is raised
+            wait(pending)
+        return result
+
     def _bulk_operation(
         self,
-        models: List,
+        models: Iterable,
         updated_fields: Optional[List] = None,
         query_fields: Optional[List] = None,
         batch_size: Optional[int] = 10000,
         upsert: bool = False,
         session: Optional[ClientSession] = None,
-    ) -> None:
+        ordered: bool = True,
+        parallelism: int = 1,
+    ) -> BulkResult:
         """base bulk operation method
 
         Args:
-            models (List): MongoModels objects
+            models (Iterable): MongoModels objects
             updated_fields (Optional[List], optional): list of updated fields. Defaults to None.
             query_fields (Optional[List], optional): list of query fields. Defaults to None.
             batch_size (Optional[int], optional): query batch. Defaults to 10000.
             upsert (bool, optional): for upsert pymongo queries. Defaults to False.
             session (Optional[ClientSession], optional): pymongo session. Defaults to None.
+            ordered (bool, optional): pymongo ordered bulk_write, errors are raised. Defaults to True.
+            parallelism (int, optional): max concurrent batches. Defaults to 1.
+
+        Returns:
+            BulkResult: counts and errors of batches
         """
-        if batch_size is not None and batch_size > 0:
-            for requests in chunk_by_length(models, batch_size):
-                data = bulk_query_generator(
-                    requests,
-                    updated_fields=updated_fields,
-                    query_fields=query_fields,
-                    upsert=upsert,
-                )
-                self.__query('bulk_write', data, session=session)
-            return None
-        data = bulk_query_generator(
-            models,
+        prepare = partial(
+            bulk_query_generator,
             updated_fields=updated_fields,
             query_fields=query_fields,
             upsert=upsert,
         )
-        self.__query('bulk_write', data, session=session)
+
+        def write(data: List) -> BulkResult:
+            return BulkResult.from_bulk_write(
+                self.__query('bulk_write', data, session=session, ordered=ordered)
+            )
+
+        return self._execute_batches(
+            self._iter_bulk_batches(models, batch_size, prepare),
+            write,
+            ordered=ordered,
+            parallelism=parallelism,
+            session=session,
+        )
 
     def bulk_update(
         self,
-        models: List,
+        models: Iterable,
         updated_fields: List,
         batch_size: Optional[int] = None,
         session: Optional[ClientSession] = None,
-    ) -> None:
+        ordered: bool = True,
+        parallelism: int = 1,
+    ) -> BulkResult:
         """bulk update method
 
         Args:
-            models (List): MongoModel objects
+            models (Iterable): MongoModel objects
             updated_fields (List): list of updated fields, like ['name', 'last_name']
             batch_size (Optional[int], optional): query batch. Defaults to None.
             session (Optional[ClientSession], optional): pymongo session. Defaults to None.
+            ordered (bool, optional): False - continue after failed writes and collect errors in result. Defaults to True.
+            parallelism (int, optional): max concurrent batches, up to connection pool size, order is kept only within a batch. Defaults to 1.
 
         Raises:
             MongoValidationError: if invalid param
+            ValueError: if session is set with parallelism > 1
+
+        Returns:
+            BulkResult: counts and errors of batches
         """
         if not updated_fields:
             raise MongoValidationError('updated_fields cannot be empty')
-        self._bulk_operation(
+        return self._bulk_operation(
             models,
             updated_fields=updated_fields,
             batch_size=batch_size
             if batch_size is not None and batch_size > 0
             else 10000,
             session=session,
+            ordered=ordered,
+            parallelism=parallelism,
         )
 
     def bulk_create(
         self,
-        models: List,
+        models: Iterable,
         batch_size: Optional[int] = 30000,
         session: Optional[ClientSession] = None,
         _ordered: bool = True,
         _bypass_document_validation: bool = False,
-    ) -> int:
-        """bulk create method
+        pipeline: bool = False,
+        ordered: bool = True,
+        parallelism: int = 1,
+        return_result: bool = False,
+    ) -> Union[int, BulkResult]:
+        """bulk create method, models are chunked lazily and with pipeline next batch
+        is validated while previous ones are written
 
         Args:
-            models (List): MongoModels obejcts
+            models (Iterable): MongoModels obejcts or dicts, list or any iterable/generator
             batch_size (Optional[int], optional): query batch. Defaults to None.
             session (Optional[ClientSession], optional): pymongo session. Defaults to None.
+            pipeline (bool, optional): write batches in background thread, ignored with session. Defaults to False.
+            ordered (bool, optional): False - continue after failed inserts and collect errors. Defaults to True.
+            parallelism (int, optional): max concurrent batches, up to connection pool size, order is kept only within a batch. Defaults to 1.
+            return_result (bool, optional): return BulkResult instead of count. Defaults to False.
+
+        Raises:
+            BulkOperationError: if unordered inserts failed and return_result is False
+            ValueError: if session is set with parallelism > 1
 
         Returns:
-            int: count of objects created
+            Union[int, BulkResult]: count of objects created or BulkResult
         """
         if batch_size is None or batch_size <= 0:
             batch_size = 30000
-        result = 0
-        for data in chunk_by_length(models, batch_size):
-            result += self.insert_many(
-                data,
-                session=session,
-                _ordered=_ordered,
-                _bypass_document_validation=_bypass_document_validation,
+        ordered = ordered and _ordered
+
+        def write(documents: List[Dict]) -> BulkResult:
+            return BulkResult(
+                inserted_count=self._insert_documents(
+                    documents,
+                    session=session,
+                    ordered=ordered,
+                    bypass_document_validation=_bypass_document_validation,
+                )
             )
-        return result
+
+        result = self._execute_batches(
+            self._iter_bulk_batches(models, batch_size, self._prepare_insert_data),
+            write,
+            ordered=ordered,
+            parallelism=parallelism,
+            session=session,
+            threaded=pipeline,
+        )
+        return self._bulk_create_result(result, return_result)
+
+    @staticmethod
+    def _bulk_create_result(
+        result: BulkResult, return_result: bool
+    ) -> Union[int, BulkResult]:
+        if return_result:
+            return result
+        if result.errors:
+            raise BulkOperationError(result)
+        return result.inserted_count
 
     def bulk_update_or_create(
         self,
-        models: List,
+        models: Iterable,
         query_fields: List,
         batch_size: Optional[int] = 10000,
         session: Optional[ClientSession] = None,
-    ) -> None:
+        ordered: bool = True,
+        parallelism: int = 1,
+    ) -> BulkResult:
         """Method for update/create rows
 
         Args:
-            models (List): List of MongoModels objects
+            models (Iterable): List of MongoModels objects
             query_fields (List): list of query fields like ['name'], perfect if this fields in indexes
             batch_size (Optional[int], optional): query obejcts batch. Defaults to 10000.
             session (Optional[ClientSession], optional): pymongo session. Defaults to None.
+            ordered (bool, optional): False - continue after failed writes and collect errors in result. Defaults to True.
+            parallelism (int, optional): max concurrent batches, up to connection pool size, order is kept only within a batch. Defaults to 1.
 
         Raises:
             MongoValidationError: if invalid models
+            ValueError: if session is set with parallelism > 1
 
+        Returns:
+            BulkResult: counts and errors of batches
         """
         if not query_fields:
             raise MongoValidationError('query_fields cannot be empty')
-        self._bulk_operation(
+        return self._bulk_operation(
             models,
             query_fields=query_fields,
             batch_size=batch_size,
             upsert=True,
             session=session,
+            ordered=ordered,
+            parallelism=parallelism,
         )
 
     def _find_with_replacement_or_with_update(
@@ -820,6 +1784,21 @@ class QueryBuilder(object):
         Returns:
             Union[Dict, 'MongoModel']: MongoModel or Dict
         """
+        filter_, set_values, extra_params = self._prepare_find_and_modify(
+            projection_fields, sort_fields, sort, upsert, session, **query
+        )
+        data = self.__query(operation, filter_, {'$set': set_values}, **extra_params)
+        return self._parse_find_and_modify(data, extra_params['projection'])
+
+    def _prepare_find_and_modify(
+        self,
+        projection_fields: Optional[list] = None,
+        sort_fields: Optional[Union[Tuple, List]] = None,
+        sort: Optional[int] = None,
+        upsert: bool = False,
+        session: Optional[ClientSession] = None,
+        **query,
+    ) -> Tuple[Dict, Dict, Dict]:
         filter_, set_values = self._prepare_update_data(**query)
         return_document = ReturnDocument.AFTER
         replacement = query.pop('replacement', None)
@@ -836,8 +1815,11 @@ class QueryBuilder(object):
 
         if replacement:
             extra_params['replacement'] = replacement
+        return filter_, set_values, extra_params
 
-        data = self.__query(operation, filter_, {'$set': set_values}, **extra_params)
+    def _parse_find_and_modify(
+        self, data: Dict, projection: Optional[Dict] = None
+    ) -> Union[Dict, 'MongoModel']:
         if projection:
             return {
                 field: value for field, value in data.items() if field in projection
@@ -939,74 +1921,152 @@ class QueryBuilder(object):
 
 
 class AsyncQueryBuilder(QueryBuilder):
+    _queryset_class = AsyncQuerySet
+
+    @async_handle_and_convert_connection_errors
     @sync_to_async
+    @without_retries
     def __query(self, *args, **kwargs):
         return super().__query(*args, **kwargs)
 
+    @async_handle_and_convert_connection_errors
     @sync_to_async
+    @without_retries
     def insert_one(self, *args, **kwargs):
         return super().insert_one(*args, **kwargs)
 
+    @async_handle_and_convert_connection_errors
     @sync_to_async
+    @without_retries
     def insert_many(self, *args, **kwargs):
         return super().insert_many(*args, **kwargs)
 
+    @async_handle_and_convert_connection_errors
+    @sync_to_async
+    @without_retries
+    def _insert_documents(self, *args, **kwargs):
+        return super()._insert_documents(*args, **kwargs)
+
+    @async_handle_and_convert_connection_errors
     @sync_to_async
+    @without_retries
     def delete_one(self, *args, **kwargs):
         return super().delete_one(*args, **kwargs)
 
+    @async_handle_and_convert_connection_errors
     @sync_to_async
+    @without_retries
     def delete_many(self, *args, **kwargs):
         return super().delete_many(*args, **kwargs)
 
+    @async_handle_and_convert_connection_errors
     @sync_to_async
+    @without_retries
     def update_one(self, *args, **kwargs):
         return super().update_one(*args, **kwargs)
 
+    @async_handle_and_convert_connection_errors
     @sync_to_async
+    @without_retries
     def update_many(self, *args, **kwargs):
         return super().update_many(*args, **kwargs)
 
+    @async_handle_and_convert_connection_errors
     @sync_to_async
+    @without_retries
     def distinct(self, *args, **kwargs):
         return super().distinct(*args, **kwargs)
 
+    @async_handle_and_convert_connection_errors
     @sync_to_async
+    @without_retries
     def raw_aggregate(self, *args, **kwargs):
         return super().raw_aggregate(*args, **kwargs)
 
+    @async_handle_and_convert_connection_errors
+    @sync_to_async
+    @without_retries
+    def raw_aggregate_iter(self, *args, **kwargs):
+        return super().raw_aggregate_iter(*args, **kwargs)
+
+    @async_handle_and_convert_connection_errors
     @sync_to_async
+    @without_retries
     def raw_query(self, *args, **kwargs):
         return super().raw_query(*args, **kwargs)
 
+    @async_handle_and_convert_connection_errors
     @sync_to_async
+    @without_retries
+    def parallel_scan(self, *args, **kwargs):
+        return super().parallel_scan(*args, **kwargs)
+
+    @async_handle_and_convert_connection_errors
+    @sync_to_async
+    @without_retries
     def replace_one(self, *args, **kwargs):
         return super().replace_one(*args, **kwargs)
 
+    @async_handle_and_convert_connection_errors
     @sync_to_async
+    @without_retries
     def _find(self, *args, **kwargs):
         return super()._find(*args, **kwargs)
 
+    @async_handle_and_convert_connection_errors
     @sync_to_async
+    @without_retries
     def find_one(self, *args, **kwargs):
         return super().find_one(*args, **kwargs)
 
+    @async_handle_and_convert_connection_errors
     @sync_to_async
+    @without_retries
     def _aggregate(self, *args, **kwargs):
         return super()._aggregate(*args, **kwargs)
 
+    @async_handle_and_convert_connection_errors
+    @sync_to_async
+    @without_retries
+    def _aggregate_cursor(self, *args, **kwargs):
+        return super()._aggregate_cursor(*args, **kwargs)
+
+    @async_handle_and_convert_connection_errors
     @sync_to_async
+    @without_retries
     def _bulk_operation(self, *args, **kwargs):
         return super()._bulk_operation(*args, **kwargs)
 
+    @async_handle_and_convert_connection_errors
     @sync_to_async
+    @without_retries
     def _find_with_replacement_or_with_update(self, *args, **kwargs):
         return super()._find_with_replacement_or_with_update(*args, **kwargs)
 
+    @async_handle_and_convert_connection_errors
     @sync_to_async
+    @without_retries
     def count(self, *args, **kwargs):
         return super().count(*args, **kwargs)
 
+    @async_handle_and_convert_connection_errors
+    @sync_to_async
+    @without_retries
+    def _find_page(self, *args, **kwargs):
+        return super()._find_page(*args, **kwargs)
+
+    @async_handle_and_convert_connection_errors
+    @sync_to_async
+    @without_retries
+    def _count_with_cache(self, *args, **kwargs):
+        return super()._count_with_cache(*args, **kwargs)
+
+    @async_handle_and_convert_connection_errors
+    @sync_to_async
+    @without_retries
+    def _find_prefetched(self, *args, **kwargs):
+        return super()._find_prefetched(*args, **kwargs)
+
     @no_type_check
     async def find(
         self,
@@ -1016,12 +2076,28 @@ class AsyncQueryBuilder(QueryBuilder):
         session: Optional[ClientSession] = None,
         sort_fields: Optional[Union[Tuple, List]] = None,
         sort: Optional[int] = None,
+        only: Union[Tuple, List, None] = None,
+        exclude: Union[Tuple, List, None] = None,
+        validate: bool = True,
         **query,
-    ) -> QuerySet:
+    ) -> AsyncQuerySet:
         data = await self._find(  # type: ignore
-            logical_query, skip_rows, limit_rows, session, sort_fields, sort, **query
+            logical_query,
+            skip_rows,
+            limit_rows,
+            session,
+            sort_fields,
+            sort,
+            only=only,
+            exclude=exclude,
+            **query,
         )
-        return QuerySet(self._mongo_model, data)
+        queryset = AsyncQuerySet(
+            self._mongo_model,
+            data,
+            self._get_parser(generate_projection(self._mongo_model, only, exclude)),
+        )
+        return queryset if validate else queryset.raw()
 
     @no_type_check
     async def count_documents(
@@ -1044,6 +2120,21 @@ class AsyncQueryBuilder(QueryBuilder):
             obj = await self.find_one(_id=inserted_id)
         return obj, created
 
+    @no_type_check
+    async def aggregate(
+        self,
+        pipeline: Union[Pipeline, List[Dict]],
+        session: Optional[ClientSession] = None,
+        allow_disk_use: bool = False,
+        batch_size: Optional[int] = None,
+        result_model: Optional[Type[BaseModel]] = None,
+    ) -> AsyncQuerySet:
+        data = await self._aggregate_cursor(
+            pipeline, session, allow_disk_use, batch_size
+        )
+        parser = result_model.parse_obj if result_model else _raw_document
+        return AsyncQuerySet(self._mongo_model, data, parser, batch_size)
+
     @no_type_check
     async def simple_aggregate(self, *args, **kwargs):
         return await self._aggregate(*args, **kwargs)
@@ -1068,53 +2159,124 @@ class AsyncQueryBuilder(QueryBuilder):
         result = await self._aggregate(aggregation=Avg(agg_field), **query)
         return result.get(f'{agg_field}__avg', 0)
 
+    @no_type_check
+    async def _execute_batches_async(
+        self,
+        batches: Iterator,
+        write: Callable,
+        ordered: bool = True,
+        parallelism: int = 1,
+        session: Optional[ClientSession] = None,
+    ) -> BulkResult:
+        """async variant of _execute_batches, next batch is taken and prepared
+        in thread while up to `parallelism` batches are written"""
+        if session is not None and parallelism > 1:
+            raise ValueError('session can not be used with parallelism > 1')
+
+        async def run(batch_number: int, offset: int, batch: List) -> BulkResult:
+            try:
+                return await write(batch)
+            except BulkWriteError as e:
+                if ordered:
+                    raise
+                return BulkResult.from_error(batch_number, offset, e.details)
+
+        next_batch = sync_to_async(next)
+        result = BulkResult()
+        parallelism = max(parallelism or 1, 1)
+        pending: Deque = deque()
+        batch_number = 0
+        try:
+            while True:
+                item = await next_batch(batches, None)
+                if item is None:
+                    break
+                if len(pending) >= parallelism:
+                    result.merge(await pending.popleft())
+                pending.append(asyncio.ensure_future(run(batch_number, *item)))
+                batch_number += 1
+            while pending:
+                result.merge(await pending.popleft())
+        finally:
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        return result
+
     @no_type_check
     async def bulk_create(
         self,
-        models: List,
+        models: Iterable,
         batch_size: Optional[int] = None,
         session: Optional[ClientSession] = None,
-    ) -> int:  # type: ignore
+        _ordered: bool = True,
+        _bypass_document_validation: bool = False,
+        ordered: bool = True,
+        parallelism: int = 1,
+        return_result: bool = False,
+    ) -> Union[int, BulkResult]:  # type: ignore
         if batch_size is None or batch_size <= 0:
             batch_size = 30000
-        result = 0
-        for data in chunk_by_length(models, batch_size):
-            result += await self.insert_many(data, session=session)  # type: ignore
-        return result
+        ordered = ordered and _ordered
+
+        async def write(documents: List[Dict]) -> BulkResult:
+            inserted_count = await self._insert_documents(
+                documents,
+                session=session,
+                ordered=ordered,
+                bypass_document_validation=_bypass_document_validation,
+            )
+            return BulkResult(inserted_count=inserted_count)
+
+        result = await self._execute_batches_async(
+            self._iter_bulk_batches(models, batch_size, self._prepare_insert_data),
+            write,
+            ordered=ordered,
+            parallelism=parallelism,
+            session=session,
+        )
+        return self._bulk_create_result(result, return_result)
 
     @no_type_check
     async def bulk_update(
         self,
-        models: List,
+        models: Iterable,
         updated_fields: List,
         batch_size: Optional[int] = None,
         session: Optional[ClientSession] = None,
-    ) -> None:
+        ordered: bool = True,
+        parallelism: int = 1,
+    ) -> BulkResult:
         if not updated_fields:
             raise MongoValidationError('updated_fields cannot be empty')
-        await self._bulk_operation(
+        return await self._bulk_operation(
             models,
             updated_fields=updated_fields,
             batch_size=batch_size,
             session=session,
+            ordered=ordered,
+            parallelism=parallelism,
         )
 
     @no_type_check
     async def bulk_update_or_create(
         self,
-        models: List,
+        models: Iterable,
         query_fields: List,
         batch_size: Optional[int] = 10000,
         session: Optional[ClientSession] = None,
-    ) -> None:
+        ordered: bool = True,
+        parallelism: int = 1,
+    ) -> BulkResult:
         if not query_fields:
             raise MongoValidationError('query_fields cannot be empty')
-        await self._bulk_operation(
+        return await self._bulk_operation(
             models,
             query_fields=query_fields,
             batch_size=batch_size,
             upsert=True,
             session=session,
+            ordered=ordered,
+            parallelism=parallelism,
         )
 
     @no_type_check
@@ -1124,6 +2286,8 @@ class AsyncQueryBuilder(QueryBuilder):
         session: Optional[ClientSession] = None,
         sort_fields: Optional[Union[Tuple, List]] = None,
         sort: Optional[int] = None,
+        only: Union[Tuple, List, None] = None,
+        exclude: Union[Tuple, List, None] = None,
         **query,
     ) -> Any:  # type: ignore
         obj = await self.find_one(
@@ -1131,6 +2295,8 @@ class AsyncQueryBuilder(QueryBuilder):
             session=session,
             sort_fields=sort_fields,
             sort=sort,
+            only=only,
+            exclude=exclude,
             **query,
         )
         if not obj:
@@ -1187,20 +2353,556 @@ class AsyncQueryBuilder(QueryBuilder):
         session: Optional[ClientSession] = None,
         sort_fields: Optional[Union[Tuple, List]] = None,
         sort: Optional[int] = None,
+        only: Union[Tuple, List, None] = None,
+        exclude: Union[Tuple, List, None] = None,
+        estimated: bool = False,
         **query,
     ) -> tuple:
-        count = await self.count(
+        if session is not None:
+            # session can not be used by two operations at once
+            count = await self._count_with_cache(
+                logical_query, session, estimated, query
+            )
+            results = await self.find(
+                skip_rows=skip_rows,
+                limit_rows=limit_rows,
+                session=session,
+                logical_query=logical_query,
+                sort_fields=sort_fields,
+                sort=sort,
+                only=only,
+                exclude=exclude,
+                **query,
+            )
+            return count, results
+        count, data = await asyncio.gather(
+            self._count_with_cache(logical_query, None, estimated, query),
+            self._find_prefetched(
+                logical_query,
+                skip_rows,
+                limit_rows,
+                None,
+                sort_fields,
+                sort,
+                only,
+                exclude,
+                query,
+            ),
+        )
+        results = AsyncQuerySet(
+            self._mongo_model,
+            data,
+            self._get_parser(generate_projection(self._mongo_model, only, exclude)),
+        )
+        return count, results
+
+    @no_type_check
+    async def paginate(
+        self,
+        logical_query: Union[Query, LogicalCombination, None] = None,
+        after: Optional[str] = None,
+        limit: int = 100,
+        sort_fields: Optional[Union[Tuple, List]] = None,
+        sort: Optional[int] = None,
+        session: Optional[ClientSession] = None,
+        only: Union[Tuple, List, None] = None,
+        exclude: Union[Tuple, List, None] = None,
+        with_count: bool = False,
+        validate: bool = True,
+        **query,
+    ) -> Page:
+        keyset, filter_, projection = self._prepare_paginate(
+            logical_query, after, limit, sort_fields, sort, only, exclude, query
+        )
+        documents = await self._find_page(keyset, filter_, limit, projection, session)
+        count = None
+        if with_count:
+            count = await self.count(logical_query, session=session, **query)
+        return self._parse_page(keyset, documents, limit, projection, count, validate)
+
+
+class MotorQueryBuilder(AsyncQueryBuilder):
+    """AQ implementation on top of non-blocking motor client"""
+
+    @async_handle_and_convert_connection_errors
+    async def __query(
+        self,
+        method_name: str,
+        query_params: Union[List, Dict, str, Query, LogicalCombination],
+        set_values: Optional[Dict] = None,
+        session: Optional[ClientSession] = None,
+        logical: bool = False,
+        **kwargs,
+    ) -> Any:
+        method = getattr(self._mongo_model._motor_collection, method_name)
+        query, kwargs = self._prepare_query(
+            query_params, set_values, session, logical, **kwargs
+        )
+        event = start_event(self._mongo_model, method_name, query, kwargs)
+        try:
+            result = await method(*query, **kwargs)
+        except Exception as e:
+            finish_event(event, error=e)
+            raise
+        finally:
+            if method_name in _WRITE_METHODS:
+                self._invalidate_result_cache(session)
+        finish_event(event, result)
+        return result
+
+    def __cursor(
+        self,
+        method_name: str,
+        query_params: Union[List, Dict, str, Query, LogicalCombination],
+        session: Optional[ClientSession] = None,
+        logical: bool = False,
+        **kwargs,
+    ) -> Any:
+        method = getattr(self._mongo_model._motor_collection, method_name)
+        query, kwargs = self._prepare_query(
+            query_params, None, session, logical, **kwargs
+        )
+        event = start_event(self._mongo_model, method_name, query, kwargs)
+        try:
+            cursor = method(*query, **kwargs)
+        except Exception as e:
+            finish_event(event, error=e)
+            raise
+        if event is None:
+            return cursor
+        # motor cursor is lazy, the event is finished with the first batch
+        return MonitoredAsyncCursor(cursor, event)
+
+    async def _monitored_call_async(
+        self, method_name: str, query: Any, *args, **kwargs
+    ) -> Any:
+        """async variant of _monitored_call for motor collection"""
+        method = getattr(self._mongo_model._motor_collection, method_name)
+        event = start_event(self._mongo_model, method_name, (query,), kwargs)
+        try:
+            result = method(*args, **kwargs)
+            if isawaitable(result):
+                result = await result
+        except Exception as e:
+            finish_event(event, error=e)
+            raise
+        finish_event(event, result)
+        return result
+
+    @no_type_check
+    async def count(
+        self,
+        logical_query: Union[Query, LogicalCombination, None] = None,
+        session: Optional[ClientSession] = None,
+        **query,
+    ) -> int:
+        filter_ = self._compile_filter(logical_query, query)
+        key = self._result_cache_key('count', session, filter_)
+        found, count = self._get_cached_result(key)
+        if not found:
+            count = await self.__query('count_documents', filter_, session=session)
+            self._set_cached_result(key, count)
+        return count
+
+    @async_handle_and_convert_connection_errors
+    async def _estimated_count(self) -> int:
+        return await self._monitored_call_async('estimated_document_count', None)
+
+    @no_type_check
+    async def _count_with_cache(
+        self,
+        logical_query: Union[Query, LogicalCombination, None] = None,
+        session: Optional[ClientSession] = None,
+        estimated: bool = False,
+        query: Optional[Dict] = None,
+    ) -> int:
+        filter_, estimated, key = self._prepare_count(
+            logical_query, session, estimated, query or {}
+        )
+        count = self._get_cached_count(key)
+        if count is None:
+            if estimated:
+                count = await self._estimated_count()
+            else:
+                count = await self.__query('count_documents', filter_, session=session)
+            self._set_cached_count(key, count)
+        return count
+
+    @no_type_check
+    async def find_one(
+        self,
+        logical_query: Union[Query, LogicalCombination, None] = None,
+        session: Optional[ClientSession] = None,
+        sort_fields: Optional[Union[Tuple, List]] = None,
+        sort: Optional[int] = None,
+        only: Union[Tuple, List, None] = None,
+        exclude: Union[Tuple, List, None] = None,
+        **query,
+    ) -> Optional['MongoModel']:
+        sort, sort_fields = sort_validation(sort, sort_fields)
+        projection = generate_projection(self._mongo_model, only, exclude)
+        filter_ = self._compile_filter(logical_query, query)
+        sort_ = [(field, sort or 1) for field in sort_fields] if sort_fields else None
+        key = self._result_cache_key('find_one', session, filter_, sort_, projection)
+        found, data = self._get_cached_result(key)
+        if not found:
+            data = await self.__query(
+                'find_one',
+                filter_,
+                session=session,
+                sort=sort_,
+                projection=projection,
+            )
+            self._set_cached_result(key, data)
+        if data:
+            return self._get_parser(projection)(data)
+        return None
+
+    @no_type_check
+    async def _find(
+        self,
+        logical_query: Union[Query, LogicalCombination, None] = None,
+        skip_rows: Optional[int] = None,
+        limit_rows: Optional[int] = None,
+        session: Optional[ClientSession] = None,
+        sort_fields: Optional[Union[Tuple, List]] = None,
+        sort: Optional[int] = None,
+        only: Union[Tuple, List, None] = None,
+        exclude: Union[Tuple, List, None] = None,
+        **query,
+    ) -> Any:
+        return self.__cursor(
+            'find',
+            logical_query or query,
             session=session,
-            logical_query=logical_query,
-            **query,
+            logical=bool(logical_query),
+            projection=generate_projection(self._mongo_model, only, exclude),
+            **self._cursor_options(skip_rows, limit_rows, sort_fields, sort),
         )
-        results = await self.find(
-            skip_rows=skip_rows,
-            limit_rows=limit_rows,
+
+    @async_handle_and_convert_connection_errors
+    async def _find_prefetched(
+        self,
+        logical_query: Union[Query, LogicalCombination, None],
+        skip_rows: Optional[int],
+        limit_rows: Optional[int],
+        session: Optional[ClientSession],
+        sort_fields: Optional[Union[Tuple, List]],
+        sort: Optional[int],
+        only: Union[Tuple, List, None],
+        exclude: Union[Tuple, List, None],
+        query: Dict,
+    ) -> AsyncGenerator:
+        cursor = self.__cursor(
+            'find',
+            logical_query or query,
             session=session,
-            logical_query=logical_query,
-            sort_fields=sort_fields,
-            sort=sort,
-            **query,
+            logical=bool(logical_query),
+            projection=generate_projection(self._mongo_model, only, exclude),
+            **self._cursor_options(skip_rows, limit_rows, sort_fields, sort),
         )
-        return count, results
+        try:
+            first = await cursor.next()
+        except StopAsyncIteration:
+            first = None
+
+        async def documents() -> AsyncGenerator:
+            if first is None:
+                return
+            yield first
+            async for document in cursor:
+                yield document
+
+        return documents()
+
+    @no_type_check
+    async def _find_page(
+        self,
+        keyset: Keyset,
+        filter_: Dict,
+        limit: int,
+        projection: Optional[Dict] = None,
+        session: Optional[ClientSession] = None,
+    ) -> List[Dict]:
+        cursor = self.__cursor(
+            'find',
+            filter_,
+            session=session,
+            projection=projection,
+            sort=keyset.sort,
+            limit=limit + 1,
+        )
+        return await cursor.to_list(None)
+
+    @no_type_check
+    async def insert_one(self, session: Optional[ClientSession] = None, **query):
+        obj = self._mongo_model.parse_obj(query)
+        data = await self.__query('insert_one', obj.query_data, session=session)
+        return data.inserted_id
+
+    @no_type_check
+    async def insert_many(
+        self,
+        data: List,
+        session: Optional[ClientSession] = None,
+        _ordered: bool = True,
+        _bypass_document_validation: bool = False,
+    ) -> int:
+        return await self._insert_documents(
+            self._prepare_insert_data(data),
+            session=session,
+            ordered=_ordered,
+            bypass_document_validation=_bypass_document_validation,
+        )
+
+    @no_type_check
+    async def _insert_documents(
+        self,
+        documents: List[Dict],
+        session: Optional[ClientSession] = None,
+        ordered: bool = True,
+        bypass_document_validation: bool = False,
+    ) -> int:
+        r = await self.__query(
+            'insert_many',
+            documents,
+            session=session,
+            ordered=ordered,
+            bypass_document_validation=bypass_document_validation,
+        )
+        return len(r.inserted_ids)
+
+    @no_type_check
+    async def delete_one(
+        self,
+        logical_query: Union[Query, LogicalCombination, None] = None,
+        session: Optional[ClientSession] = None,
+        **query,
+    ) -> int:
+        r = await self.__query(
+            'delete_one',
+            logical_query or query,
+            session=session,
+            logical=bool(logical_query),
+        )
+        return r.deleted_count
+
+    @no_type_check
+    async def delete_many(
+        self,
+        logical_query: Union[Query, LogicalCombination, None] = None,
+        session: Optional[ClientSession] = None,
+        **query,
+    ) -> int:
+        r = await self.__query(
+            'delete_many',
+            logical_query or query,
+            session=session,
+            logical=bool(logical_query),
+        )
+        return r.deleted_count
+
+    @no_type_check
+    async def replace_one(
+        self,
+        replacement: Dict,
+        upsert: bool = False,
+        session: Optional[ClientSession] = None,
+        **filter_query,
+    ) -> Any:
+        if not filter_query:
+            raise MongoValidationError('not filter parameters')
+        if not replacement:
+            raise MongoValidationError('not replacement parameters')
+        return await self.__query(
+            'replace_one',
+            self._mongo_model._validate_query_data(filter_query),
+            replacement=self._mongo_model._validate_query_data(replacement),
+            upsert=upsert,
+            session=session,
+        )
+
+    @no_type_check
+    async def raw_query(
+        self,
+        method_name: str,
+        raw_query: Union[Dict, List[Dict], Tuple[Dict]],
+        session: Optional[ClientSession] = None,
+    ) -> Any:
+        parsed_query = self._validate_raw_query(method_name, raw_query)
+        try:
+            return await self._monitored_call_async(
+                method_name,
+                parsed_query[0] if parsed_query else None,
+                *parsed_query,
+                session=session,
+            )
+        finally:
+            if method_name in _WRITE_METHODS:
+                self._invalidate_result_cache(session)
+
+    @no_type_check
+    async def _update(
+        self,
+        method: str,
+        query: Dict,
+        upsert: bool = True,
+        session: Optional[ClientSession] = None,
+    ) -> int:
+        query, update = self._prepare_update_document(**query)
+        r = await self.__query(method, query, update, upsert=upsert, session=session)
+        return r.modified_count
+
+    @no_type_check
+    async def update_one(
+        self, upsert: bool = False, session: Optional[ClientSession] = None, **query
+    ) -> int:
+        return await self._update('update_one', query, upsert=upsert, session=session)
+
+    @no_type_check
+    async def update_many(
+        self, upsert: bool = False, session: Optional[ClientSession] = None, **query
+    ) -> int:
+        return await self._update(
+            'update_many', query, upsert=upsert, session=session
+        )
+
+    @no_type_check
+    async def distinct(
+        self, field: str, session: Optional[ClientSession] = None, **query
+    ) -> list:
+        query = self._mongo_model._validate_query_data(query)
+        key = self._result_cache_key('distinct', session, field, query)
+        found, values = self._get_cached_result(key)
+        if not found:
+            values = await self._monitored_call_async(
+                'distinct', query, key=field, filter=query, session=session
+            )
+            self._set_cached_result(key, values)
+        return values
+
+    @no_type_check
+    async def _aggregate_cursor(
+        self,
+        pipeline: Union[Pipeline, List[Dict]],
+        session: Optional[ClientSession] = None,
+        allow_disk_use: bool = False,
+        batch_size: Optional[int] = None,
+    ) -> Any:
+        stages, options = self._prepare_pipeline(pipeline, allow_disk_use, batch_size)
+        return self.__cursor('aggregate', stages, session=session, **options)
+
+    @no_type_check
+    async def _raw_aggregate(
+        self,
+        data: Union[Pipeline, List[Dict[Any, Any]]],
+        session: Optional[ClientSession] = None,
+        stream: bool = False,
+        batch_size: Optional[int] = None,
+        allow_disk_use: bool = False,
+        parser: Callable = _raw_document,
+    ) -> Union[List, AsyncQuerySet]:
+        stages, options = self._prepare_pipeline(data, allow_disk_use, batch_size)
+        cursor = self.__cursor('aggregate', stages, session=session, **options)
+        if stream:
+            return AsyncQuerySet(self._mongo_model, cursor, parser, batch_size)
+        return [parser(row) for row in await cursor.to_list(None)]
+
+    @no_type_check
+    async def raw_aggregate(
+        self,
+        data: List[Dict[Any, Any]],
+        session: Optional[ClientSession] = None,
+        stream: bool = False,
+        batch_size: Optional[int] = None,
+        allow_disk_use: bool = False,
+        result_model: Optional[Type[BaseModel]] = None,
+    ) -> Union[List, AsyncQuerySet]:
+        parser = result_model.parse_obj if result_model else _raw_document
+        return await self._raw_aggregate(
+            data, session, stream, batch_size, allow_disk_use, parser
+        )
+
+    @no_type_check
+    async def raw_aggregate_iter(
+        self,
+        data: List[Dict[Any, Any]],
+        session: Optional[ClientSession] = None,
+        batch_size: Optional[int] = None,
+        allow_disk_use: bool = False,
+        result_model: Optional[Type[BaseModel]] = None,
+    ) -> AsyncQuerySet:
+        parser = result_model.parse_obj if result_model else _raw_document
+        return await self._raw_aggregate(
+            data, session, True, batch_size, allow_disk_use, parser
+        )
+
+    @no_type_check
+    async def _aggregate(self, *args, **query) -> Union[dict, AsyncQuerySet]:
+        session = query.pop('session', None)
+        stream, batch_size, allow_disk_use = self._pop_stream_options(query)
+        data = self._prepare_aggregate(*args, **query)
+        if stream:
+            return await self._raw_aggregate(
+                data,
+                session,
+                True,
+                batch_size,
+                allow_disk_use,
+                self._parse_aggregate_row,
+            )
+        result = await self._raw_aggregate(
+            data, session, False, batch_size, allow_disk_use
+        )
+        return self._parse_aggregate_result(result)
+
+    @no_type_check
+    async def _bulk_operation(
+        self,
+        models: Iterable,
+        updated_fields: Optional[List] = None,
+        query_fields: Optional[List] = None,
+        batch_size: Optional[int] = 10000,
+        upsert: bool = False,
+        session: Optional[ClientSession] = None,
+        ordered: bool = True,
+        parallelism: int = 1,
+    ) -> BulkResult:
+        prepare = partial(
+            bulk_query_generator,
+            updated_fields=updated_fields,
+            query_fields=query_fields,
+            upsert=upsert,
+        )
+
+        async def write(data: List) -> BulkResult:
+            return BulkResult.from_bulk_write(
+                await self.__query('bulk_write', data, session=session, ordered=ordered)
+            )
+
+        return await self._execute_batches_async(
+            self._iter_bulk_batches(models, batch_size, prepare),
+            write,
+            ordered=ordered,
+            parallelism=parallelism,
+            session=session,
+        )
+
+    @no_type_check
+    async def _find_with_replacement_or_with_update(
+        self,
+        operation: str,
+        projection_fields: Optional[list] = None,
+        sort_fields: Optional[Union[Tuple, List]] = None,
+        sort: Optional[int] = None,
+        upsert: bool = False,
+        session: Optional[ClientSession] = None,
+        **query,
+    ) -> Union[Dict, 'MongoModel']:
+        filter_, set_values, extra_params = self._prepare_find_and_modify(
+            projection_fields, sort_fields, sort, upsert, session, **query
+        )
+        data = await self.__query(
+            operation, filter_, {'$set': set_values}, **extra_params
+        )
+        return self._parse_find_and_modify(data, extra_params['projection'])
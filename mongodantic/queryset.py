@@ -1,12 +1,32 @@
-from json import dumps
-from typing import Generator, List, Union, Any, Tuple, List, TYPE_CHECKING
-
+from itertools import islice
+from typing import (
+    AsyncGenerator,
+    Generator,
+    Iterator,
+    List,
+    Union,
+    Any,
+    Callable,
+    Tuple,
+    List,
+    Optional,
+    TYPE_CHECKING,
+)
+
+from .encoders import json_dumps
 from .helpers import handle_and_convert_connection_errors
+from .sync_async import sync_to_async
 
 if TYPE_CHECKING:
     from .models import MongoModel
 
-__all__ = ('QuerySet',)
+__all__ = ('QuerySet', 'AsyncQuerySet')
+
+DEFAULT_ASYNC_BATCH_SIZE = 1000
+
+
+def _raw_document(obj: dict) -> dict:
+    return obj
 
 
 class QuerySet(object):
@@ -14,21 +34,43 @@ class QuerySet(object):
         self,
         model: 'MongoModel',
         data: Generator,
+        parser: Optional[Callable] = None,
     ):
         self._data = data
         self._model = model
+        self._parser = parser or model.parse_obj
 
     @handle_and_convert_connection_errors
     def __iter__(self):
+        parser = self._parser
         for obj in self._data:
-            yield self._model.parse_obj(obj)
+            yield parser(obj)
 
     def __next__(self):
         return next(self.__iter__())
 
+    def _clone(self, parser: Callable) -> 'QuerySet':
+        return self.__class__(self._model, self._data, parser)
+
+    def raw(self) -> 'QuerySet':
+        """QuerySet of plain documents, without model validation
+
+        Returns:
+            QuerySet: yields dicts
+        """
+        return self._clone(_raw_document)
+
+    def construct(self) -> 'QuerySet':
+        """QuerySet of models built with pydantic construct, without validation
+
+        Returns:
+            QuerySet: yields MongoModel objects
+        """
+        return self._clone(self._model._construct_obj)
+
     @property
     def data(self) -> List:
-        return [obj.data for obj in self.__iter__()]
+        return list(self._model._data_generator(self.__iter__()))
 
     @property
     def generator(self) -> Generator:
@@ -36,14 +78,31 @@ class QuerySet(object):
 
     @property
     def data_generator(self) -> Generator:
-        return (obj.data for obj in self.__iter__())
+        return self._model._data_generator(self.__iter__())
 
     @property
     def list(self) -> List:
         return list(self.__iter__())
 
     def json(self) -> str:
-        return dumps(self.data)
+        return json_dumps(self.data)
+
+    def json_stream(self, fields: Union[Tuple, List, None] = None) -> Generator:
+        """encode QuerySet as json array chunk by chunk, one row per chunk
+
+        Args:
+            fields (Union[Tuple, List, None], optional): serialize only this fields. Defaults to None.
+
+        Yields:
+            str: json chunk
+        """
+        rows = self.data_generator if fields is None else self.serialize_generator(fields)
+        yield '['
+        separator = ''
+        for row in rows:
+            yield separator + json_dumps(row)
+            separator = ','
+        yield ']'
 
     def first(self) -> Any:
         return next(self.__iter__())
@@ -51,15 +110,128 @@ class QuerySet(object):
     def serialize(
         self, fields: Union[Tuple, List], to_list: bool = True
     ) -> Union[Tuple, List]:
-        return (
-            [obj.serialize(fields) for obj in self.__iter__()]
-            if to_list
-            else tuple(obj.serialize(fields) for obj in self.__iter__())
-        )
+        rows = self._model._serialize_generator(self.__iter__(), fields)
+        return list(rows) if to_list else tuple(rows)
 
     def serialize_generator(self, fields: Union[Tuple, List]) -> Generator:
-        for obj in self.__iter__():
-            yield obj.serialize(fields)
+        yield from self._model._serialize_generator(self.__iter__(), fields)
 
     def serialize_json(self, fields: Union[Tuple, List]) -> str:
-        return dumps(self.serialize(fields))
+        return json_dumps(self.serialize(fields))
+
+
+class AsyncQuerySet(QuerySet):
+    """QuerySet for AQ queries, supports `async for`
+
+    pymongo cursor batches are fetched and parsed in thread pool, motor cursor
+    is iterated natively. Sync QuerySet api is kept for pymongo cursors.
+    """
+
+    def __init__(
+        self,
+        model: 'MongoModel',
+        data: Any,
+        parser: Optional[Callable] = None,
+        batch_size: Optional[int] = None,
+    ):
+        super().__init__(model, data, parser)
+        self._batch_size = batch_size or DEFAULT_ASYNC_BATCH_SIZE
+        self._iterator: Optional[Iterator] = None
+
+    def _clone(self, parser: Callable) -> 'AsyncQuerySet':
+        return self.__class__(self._model, self._data, parser, self._batch_size)
+
+    @property
+    def _is_native_async(self) -> bool:
+        return hasattr(self._data, '__aiter__')
+
+    def __iter__(self):
+        if self._is_native_async:
+            raise TypeError(
+                'motor cursor supports only async iteration, use `async for` or `await to_list()`'
+            )
+        return super().__iter__()
+
+    def batch_size(self, batch_size: int) -> 'AsyncQuerySet':
+        """set count of documents fetched per round trip
+
+        Args:
+            batch_size (int): documents per batch
+
+        Returns:
+            AsyncQuerySet: self
+        """
+        if batch_size <= 0:
+            raise ValueError('batch_size must be greater than 0')
+        self._batch_size = batch_size
+        if hasattr(self._data, 'batch_size'):
+            self._data.batch_size(batch_size)
+        return self
+
+    def _fetch_batch(self, size: int) -> List:
+        if self._iterator is None:
+            self._iterator = iter(self._data)
+        parser = self._parser
+        return [parser(obj) for obj in islice(self._iterator, size)]
+
+    async def _batches(self, length: Optional[int] = None) -> AsyncGenerator:
+        """parsed batches, documents after `length` ones are left in cursor"""
+        remaining = length
+        if self._is_native_async:
+            if remaining is not None and remaining <= 0:
+                return
+            parser = self._parser
+            batch = []
+            async for obj in self._data:
+                batch.append(parser(obj))
+                if remaining is not None:
+                    remaining -= 1
+                    if not remaining:
+                        break
+                if len(batch) >= self._batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+            return
+        fetch_batch = sync_to_async(self._fetch_batch)
+        while remaining is None or remaining > 0:
+            size = self._batch_size
+            if remaining is not None:
+                size = min(size, remaining)
+            batch = await fetch_batch(size)
+            if not batch:
+                return
+            if remaining is not None:
+                remaining -= len(batch)
+            yield batch
+
+    async def __aiter__(self) -> AsyncGenerator:
+        async for batch in self._batches():
+            for obj in batch:
+                yield obj
+
+    async def to_list(self, length: Optional[int] = None) -> List:
+        """fetch documents into list, next documents are left for later iteration
+
+        Args:
+            length (Optional[int], optional): max count of documents. Defaults to None.
+
+        Returns:
+            List: MongoModel objects
+        """
+        result: List = []
+        async for batch in self._batches(length):
+            result.extend(batch)
+        return result
+
+    async def first_async(self) -> Any:
+        async for batch in self._batches(1):
+            return batch[0]
+        return None
+
+    async def serialize_generator_async(
+        self, fields: Union[Tuple, List]
+    ) -> AsyncGenerator:
+        async for obj in self:
+            yield obj.serialize(fields)
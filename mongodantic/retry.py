@@ -0,0 +1,242 @@
+import asyncio
+import threading
+from contextvars import ContextVar
+from functools import wraps
+from random import uniform
+from time import monotonic, sleep
+from types import GeneratorType
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+from pymongo.errors import (
+    ServerSelectionTimeoutError,
+    AutoReconnect,
+    NetworkTimeout,
+    ConnectionFailure,
+)
+
+from .exceptions import MongoConnectionError
+
+__all__ = (
+    'RetryPolicy',
+    'DEFAULT_RETRY_POLICY',
+    'get_retry_policy',
+    'handle_and_convert_connection_errors',
+    'async_handle_and_convert_connection_errors',
+    'without_retries',
+    'current_attempt',
+)
+
+CONNECTION_ERRORS: Tuple[Type[BaseException], ...] = (
+    AutoReconnect,
+    ServerSelectionTimeoutError,
+    NetworkTimeout,
+    ConnectionFailure,
+)
+
+_retry_state = threading.local()
+# attempt number of running query, it is read by monitoring events
+_attempt: ContextVar[int] = ContextVar('mongodantic_retry_attempt', default=1)
+
+
+class RetryPolicy(object):
+    """retry policy for connection errors
+
+    Args:
+        max_attempts (int, optional): attempts including the first one. Defaults to 5.
+        backoff_base (float, optional): delay before first retry in seconds. Defaults to 0.1.
+        backoff_multiplier (float, optional): delay growth per retry. Defaults to 2.
+        backoff_max (float, optional): max delay in seconds. Defaults to 5.
+        jitter (bool, optional): randomize delay in [0, delay] range. Defaults to True.
+        deadline (Optional[float], optional): max seconds for all attempts. Defaults to None.
+        retry_on (Tuple[Type[BaseException], ...], optional): retryable errors. Defaults to connection errors.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        backoff_base: float = 0.1,
+        backoff_multiplier: float = 2.0,
+        backoff_max: float = 5.0,
+        jitter: bool = True,
+        deadline: Optional[float] = None,
+        retry_on: Tuple[Type[BaseException], ...] = CONNECTION_ERRORS,
+    ):
+        if max_attempts < 1:
+            raise ValueError('max_attempts must be greater than 0')
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_multiplier = backoff_multiplier
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.deadline = deadline
+        self.retry_on = tuple(retry_on)
+        self._lock = threading.Lock()
+        self._stats = {'calls': 0, 'retries': 0, 'failures': 0}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # lock is not picklable, copy in worker process has own lock and counters
+        state = dict(self.__dict__)
+        del state['_lock']
+        state['_stats'] = {key: 0 for key in self._stats}
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            f'RetryPolicy(max_attempts={self.max_attempts}, '
+            f'backoff_base={self.backoff_base}, deadline={self.deadline})'
+        )
+
+    def delay(self, retry: int) -> float:
+        """delay before retry number `retry` (starts from 1)"""
+        delay = min(
+            self.backoff_max,
+            self.backoff_base * self.backoff_multiplier ** (retry - 1),
+        )
+        return uniform(0, delay) if self.jitter else delay
+
+    def next_delay(
+        self, error: BaseException, attempt: int, started: float
+    ) -> Optional[float]:
+        """delay before next attempt or None if error must be raised"""
+        if not isinstance(error, self.retry_on) or attempt >= self.max_attempts:
+            return None
+        delay = self.delay(attempt)
+        if self.deadline is not None and monotonic() + delay - started > self.deadline:
+            return None
+        return delay
+
+    def _count(self, key: str, value: int = 1) -> None:
+        with self._lock:
+            self._stats[key] += value
+
+    def stats(self) -> Dict[str, int]:
+        """counters: calls, retries and failures (calls failed after all attempts)"""
+        with self._lock:
+            return dict(self._stats)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            for key in self._stats:
+                self._stats[key] = 0
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+def get_retry_policy(env_name: Optional[str] = None) -> RetryPolicy:
+    """retry policy from `connect` settings of env, or default policy"""
+    from .connection import _connection_settings, get_connection_env
+
+    settings = _connection_settings.get(env_name or get_connection_env(), {})
+    return settings.get('retry_policy') or DEFAULT_RETRY_POLICY
+
+
+def current_attempt() -> int:
+    """attempt number of query running in current thread or task, starts from 1"""
+    return _attempt.get()
+
+
+def _resolve_policy(args: tuple) -> RetryPolicy:
+    policy = getattr(args[0], '_retry_policy', None) if args else None
+    return policy or get_retry_policy()
+
+
+def _convert_error(error: BaseException) -> BaseException:
+    if isinstance(error, CONNECTION_ERRORS):
+        return MongoConnectionError(str(error))
+    return error
+
+
+def without_retries(func: Callable) -> Callable:
+    """run func without sync retries, errors are handled by caller (async wrapper)"""
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        previous = getattr(_retry_state, 'disabled', False)
+        _retry_state.disabled = True
+        try:
+            return func(*args, **kwargs)
+        finally:
+            # nested wrapped calls keep retries disabled for the outer call
+            _retry_state.disabled = previous
+
+    return wrapper
+
+
+def handle_and_convert_connection_errors(func: Callable) -> Any:
+    """decorator for handle connection errors and raise MongoConnectionError
+
+    Args:
+        func (Callable):any query to mongo
+
+    Returns:
+        Any: data
+    """
+
+    def generator_wrapper(generator):
+        yield from generator
+
+    @wraps(func)
+    def main_wrapper(*args, **kwargs):
+        if getattr(_retry_state, 'disabled', False):
+            return func(*args, **kwargs)
+        policy = _resolve_policy(args)
+        policy._count('calls')
+        started = monotonic()
+        attempt = 1
+        while True:
+            token = _attempt.set(attempt)
+            try:
+                result = func(*args, **kwargs)
+                if isinstance(result, GeneratorType):
+                    result = generator_wrapper(result)
+                return result
+            except (CONNECTION_ERRORS + policy.retry_on) as e:
+                delay = policy.next_delay(e, attempt, started)
+                if delay is None:
+                    policy._count('failures')
+                    raise _convert_error(e) from e
+                policy._count('retries')
+                attempt += 1
+                sleep(delay)
+            finally:
+                _attempt.reset(token)
+
+    return main_wrapper
+
+
+def async_handle_and_convert_connection_errors(func: Callable) -> Any:
+    """async variant of handle_and_convert_connection_errors, waits with asyncio.sleep
+
+    Args:
+        func (Callable): coroutine function with query to mongo
+
+    Returns:
+        Any: data
+    """
+
+    @wraps(func)
+    async def main_wrapper(*args, **kwargs):
+        policy = _resolve_policy(args)
+        policy._count('calls')
+        started = monotonic()
+        attempt = 1
+        while True:
+            token = _attempt.set(attempt)
+            try:
+                return await func(*args, **kwargs)
+            except (CONNECTION_ERRORS + policy.retry_on) as e:
+                delay = policy.next_delay(e, attempt, started)
+                if delay is None:
+                    policy._count('failures')
+                    raise _convert_error(e) from e
+                policy._count('retries')
+                attempt += 1
+                await asyncio.sleep(delay)
+            finally:
+                _attempt.reset(token)
+
+    return main_wrapper
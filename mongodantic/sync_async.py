@@ -1,5 +1,6 @@
 import asyncio
 import concurrent.futures
+import contextvars
 import functools
 import threading
 from typing import Coroutine, Callable, no_type_check_decorator
@@ -100,9 +101,11 @@ class SyncToAsync:
 
     async def __call__(self, *args, **kwargs):
         loop = asyncio.get_event_loop()
+        # context variables (e.g. retry attempt) are visible in thread
+        context = contextvars.copy_context()
         future = loop.run_in_executor(
             None,
-            functools.partial(self.thread_handler, loop, *args, **kwargs),
+            functools.partial(context.run, self.thread_handler, loop, *args, **kwargs),
         )
         return await asyncio.wait_for(future, timeout=None)
 
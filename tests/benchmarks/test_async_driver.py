@@ -0,0 +1,51 @@
+import os
+import asyncio
+from time import perf_counter
+
+import pytest
+
+from mongodantic import connect
+from mongodantic.models import MongoModel
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get('MONGODANTIC_BENCHMARK'),
+    reason='set MONGODANTIC_BENCHMARK=1 to run benchmarks',
+)
+
+CONCURRENCY = 1000
+
+
+class BenchTicket(MongoModel):
+    name: str
+    position: int
+
+
+async def _throughput() -> float:
+    start = perf_counter()
+    await asyncio.gather(
+        *(
+            BenchTicket.AQ.find_one(position=i % 100)
+            for i in range(CONCURRENCY)
+        )
+    )
+    return CONCURRENCY / (perf_counter() - start)
+
+
+@pytest.mark.asyncio
+async def test_async_driver_throughput():
+    connect("mongodb://127.0.0.1:27017", "test")
+    BenchTicket.Q.drop_collection(force=True)
+    BenchTicket.Q.insert_many(
+        [BenchTicket(name=str(i), position=i) for i in range(100)]
+    )
+    results = {}
+    for driver in ('executor', 'motor'):
+        connect("mongodb://127.0.0.1:27017", "test", async_driver=driver)
+        BenchTicket._reconnect()
+        await _throughput()  # warm up pools
+        results[driver] = await _throughput()
+    print(
+        f'\n{CONCURRENCY} concurrent find_one: '
+        + ', '.join(f'{k}={v:.0f} req/s' for k, v in results.items())
+    )
+    assert all(v > 0 for v in results.values())
@@ -0,0 +1,81 @@
+import os
+from time import perf_counter
+
+import pytest
+from bson import ObjectId
+from pymongo import UpdateOne
+
+from mongodantic.helpers import bulk_query_generator
+from mongodantic.models import MongoModel
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get('MONGODANTIC_BENCHMARK'),
+    reason='set MONGODANTIC_BENCHMARK=1 to run benchmarks',
+)
+
+MODELS = 100000
+
+
+class BenchOrder(MongoModel):
+    number: int
+    customer: str
+    total: float
+    items: list
+    meta: dict
+
+    @property
+    def label(self):
+        return f'{self.number}-{self.customer}'
+
+
+def _previous_bulk_query_generator(requests, updated_fields=None, query_fields=None):
+    data = []
+    if updated_fields:
+        for obj in requests:
+            query = {'_id': ObjectId(obj._id)}
+            update = {}
+            for field in updated_fields:
+                update.update({field: getattr(obj, field)})
+            data.append(UpdateOne(query, {'$set': update}))
+    elif query_fields:
+        for obj in requests:
+            query, update = {}, {}
+            for field, value in obj.data.items():
+                if field not in query_fields:
+                    update.update({field: value})
+                else:
+                    query.update({field: value})
+            data.append(UpdateOne(query, {'$set': update}))
+    return data
+
+
+def test_bulk_query_generator_cost():
+    models = [
+        BenchOrder.parse_obj(
+            {
+                '_id': ObjectId(),
+                'number': i,
+                'customer': str(i),
+                'total': float(i),
+                'items': [i],
+                'meta': {'i': i},
+            }
+        )
+        for i in range(MODELS)
+    ]
+    results = {}
+    for name, generator in (
+        ('previous', _previous_bulk_query_generator),
+        ('compiled', bulk_query_generator),
+    ):
+        for kwargs in ({'updated_fields': ['total', 'meta']}, {'query_fields': ['number']}):
+            start = perf_counter()
+            generator(models, **kwargs)
+            key = f'{name}_{list(kwargs)[0]}'
+            results[key] = (perf_counter() - start) / MODELS * 1e6
+    print(
+        f'\nper model cost on {MODELS} models: '
+        + ', '.join(f'{k}={v:.2f}us' for k, v in results.items())
+    )
+    assert results['compiled_query_fields'] < results['previous_query_fields']
+    assert results['compiled_updated_fields'] < results['previous_updated_fields']
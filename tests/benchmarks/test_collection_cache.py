@@ -0,0 +1,36 @@
+import os
+from time import perf_counter
+
+import pytest
+
+from mongodantic import connect
+from mongodantic.models import MongoModel
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get('MONGODANTIC_BENCHMARK'),
+    reason='set MONGODANTIC_BENCHMARK=1 to run benchmarks',
+)
+
+ITERATIONS = 100000
+
+
+def test_collection_resolve_overhead():
+    connect("mongodb://127.0.0.1:27017", "test")
+
+    class BenchTicket(MongoModel):
+        name: str
+
+    results = {}
+    for name, resolve in (
+        ('get_collection', BenchTicket.get_collection),
+        ('cached', lambda: BenchTicket._collection),
+    ):
+        start = perf_counter()
+        for _ in range(ITERATIONS):
+            resolve()
+        results[name] = (perf_counter() - start) / ITERATIONS * 1e6
+    print(
+        f'\nper query collection overhead on {ITERATIONS} queries: '
+        + ', '.join(f'{k}={v:.2f}us' for k, v in results.items())
+    )
+    assert results['cached'] < results['get_collection']
@@ -0,0 +1,57 @@
+import os
+from time import perf_counter
+
+import pytest
+from bson import ObjectId
+
+from mongodantic.models import MongoModel
+from mongodantic.queryset import QuerySet
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get('MONGODANTIC_BENCHMARK'),
+    reason='set MONGODANTIC_BENCHMARK=1 to run benchmarks',
+)
+
+DOCUMENTS = 100000
+
+
+class BenchProduct(MongoModel):
+    title: str
+    cost: float
+    quantity: int
+    tags: list
+    config: dict
+
+
+def _documents() -> list:
+    return [
+        {
+            '_id': ObjectId(),
+            'title': str(i),
+            'cost': float(i),
+            'quantity': i,
+            'tags': ['a', 'b'],
+            'config': {'type_id': i},
+        }
+        for i in range(DOCUMENTS)
+    ]
+
+
+def test_queryset_modes_per_document_cost():
+    documents = _documents()
+    modes = {
+        'parse_obj': lambda: QuerySet(BenchProduct, iter(documents)),
+        'construct': lambda: QuerySet(BenchProduct, iter(documents)).construct(),
+        'raw': lambda: QuerySet(BenchProduct, iter(documents)).raw(),
+    }
+    results = {}
+    for name, queryset in modes.items():
+        start = perf_counter()
+        for _ in queryset():
+            pass
+        results[name] = (perf_counter() - start) / DOCUMENTS * 1e6
+    print(
+        f'\nper document cost on {DOCUMENTS} documents: '
+        + ', '.join(f'{k}={v:.2f}us' for k, v in results.items())
+    )
+    assert results['raw'] < results['construct'] < results['parse_obj']
@@ -1,12 +1,14 @@
 import pytest
 from random import randint
+from pydantic import BaseModel, Field
 
 from mongodantic.models import MongoModel
+from mongodantic.queryset import QuerySet
 from mongodantic.types import ObjectIdStr
 from mongodantic.logical import Query
 from mongodantic import init_db_connection_params
 from mongodantic.aggregation import Sum, Max, Min, Avg, Count
-from mongodantic.exceptions import MongoValidationError
+from mongodantic.exceptions import MongoValidationError, NotDeclaredField
 
 product_types = {1: 'phone', 2: 'book', 3: 'food'}
 
@@ -340,3 +342,158 @@ class TestAggregation:
     #         await self.Product.AQ.simple_aggregate(
     #             title='not_match', aggregation=[Avg('cost123'), Max('quantityzzzz')]
     #         )
+
+    def _create_products(self):
+        self.Product.Q.insert_many(
+            [
+                self.Product(
+                    title=str(i),
+                    cost=float(i),
+                    quantity=i,
+                    product_type=product_types[i % 3 + 1],
+                    config={'type_id': i},
+                )
+                for i in range(1, 7)
+            ]
+        )
+
+    def test_pipeline_stages(self):
+        pipeline = (
+            self.Product.Q.pipeline()
+            .match(cost__gte='2', product_type__in=['phone', 'book'])
+            .group('product_type', Sum('cost'), total=Count('_id'))
+            .sort(('cost__sum', -1))
+            .limit(10)
+        )
+        assert pipeline.stages == [
+            {'$match': {'cost': {'$gte': 2.0}, 'product_type': {'$in': ['phone', 'book']}}},
+            {
+                '$group': {
+                    '_id': '$product_type',
+                    'cost__sum': {'$sum': '$cost'},
+                    'total': {'$sum': 1},
+                }
+            },
+            {'$sort': {'cost__sum': -1}},
+            {'$limit': 10},
+        ]
+        with pytest.raises(NotDeclaredField):
+            self.Product.Q.pipeline().group('product_type', Sum('price'))
+        with pytest.raises(NotDeclaredField):
+            self.Product.Q.pipeline().group('product_type', Sum('cost')).sort('title')
+        with pytest.raises(NotDeclaredField):
+            self.Product.Q.pipeline().project('title', price={'$multiply': ['$costs', 2]})
+        with pytest.raises(NotDeclaredField):
+            self.Product.Q.pipeline().lookup(self.ProductImage, '_id', 'product', 'images')
+        with pytest.raises(MongoValidationError):
+            self.Product.Q.pipeline().group(None, Query(title='1'))
+        unchecked = self.Product.Q.pipeline().stage({'$addFields': {'x': 1}}).sort('x')
+        assert unchecked.stages[-1] == {'$sort': {'x': 1}}
+
+    def test_pipeline_aggregate(self):
+        self._create_products()
+        pipeline = (
+            self.Product.Q.pipeline()
+            .match(Query(cost__gte=2))
+            .project('product_type', 'quantity', total={'$multiply': ['$cost', 2]})
+            .group('product_type', Sum('total'), Max('quantity'))
+            .match(total__sum={'$gt': 10})
+            .sort('total__sum', sort=-1)
+        )
+        rows = self.Product.Q.aggregate(pipeline, allow_disk_use=True, batch_size=2).list
+        assert rows == [
+            {'_id': 'phone', 'total__sum': 18.0, 'quantity__max': 6},
+            {'_id': 'food', 'total__sum': 14.0, 'quantity__max': 5},
+        ]
+
+        product = self.Product.Q.find_one(title='1')
+        self.ProductImage.Q.insert_many(
+            [self.ProductImage(url=f'url{i}', product_id=product._id) for i in range(2)]
+        )
+        pipeline = (
+            self.Product.Q.pipeline()
+            .match(title='1')
+            .lookup(self.ProductImage, '_id', 'product_id', 'images')
+            .unwind('images')
+            .project('title', url='$images.url', _id=0)
+        )
+        assert self.Product.Q.aggregate(pipeline).list == [
+            {'title': '1', 'url': 'url0'},
+            {'title': '1', 'url': 'url1'},
+        ]
+
+        base = self.Product.Q.pipeline()
+        pipeline = base.facet(
+            expensive=base.branch().match(cost__gte=5).project('title', _id=0),
+            buckets=base.branch().bucket('quantity', [0, 3, 10], total=Sum('cost')),
+        )
+        result = self.Product.Q.aggregate(pipeline).first()
+        assert result['expensive'] == [{'title': '5'}, {'title': '6'}]
+        assert result['buckets'] == [{'_id': 0, 'total': 3.0}, {'_id': 3, 'total': 18.0}]
+
+    @pytest.mark.asyncio
+    async def test_async_pipeline_aggregate(self):
+        self._create_products()
+        pipeline = (
+            self.Product.Q.pipeline()
+            .group('product_type', quantity=Sum('quantity'))
+            .sort('_id')
+        )
+        queryset = await self.Product.AQ.aggregate(pipeline, batch_size=1)
+        rows = [row async for row in queryset]
+        assert rows == [
+            {'_id': 'book', 'quantity': 5},
+            {'_id': 'food', 'quantity': 7},
+            {'_id': 'phone', 'quantity': 9},
+        ]
+
+    def test_aggregate_stream(self):
+        class TypeTotal(BaseModel):
+            product_type: str = Field(alias='_id')
+            quantity: int
+
+        self._create_products()
+        stages = [
+            {'$group': {'_id': '$product_type', 'quantity': {'$sum': '$quantity'}}},
+            {'$sort': {'_id': 1}},
+        ]
+        rows = self.Product.Q.raw_aggregate(stages, stream=True, batch_size=1)
+        assert isinstance(rows, QuerySet)
+        assert [row['quantity'] for row in rows] == [5, 7, 9]
+
+        totals = self.Product.Q.raw_aggregate_iter(
+            stages, allow_disk_use=True, result_model=TypeTotal
+        )
+        assert [(t.product_type, t.quantity) for t in totals] == [
+            ('book', 5),
+            ('food', 7),
+            ('phone', 9),
+        ]
+        totals = self.Product.Q.raw_aggregate(stages, result_model=TypeTotal)
+        assert isinstance(totals, list)
+        assert totals[0].quantity == 5
+
+        pairs = self.Product.Q.simple_aggregate(
+            aggregation=Sum('cost'), group_by='product_type', stream=True
+        )
+        assert dict(pairs) == self.Product.Q.simple_aggregate(
+            aggregation=Sum('cost'), group_by='product_type'
+        )
+
+    @pytest.mark.asyncio
+    async def test_async_aggregate_stream(self):
+        self._create_products()
+        stages = [{'$sort': {'quantity': -1}}, {'$project': {'_id': 0, 'title': 1}}]
+        rows = await self.Product.AQ.raw_aggregate_iter(stages, batch_size=2)
+        assert [row['title'] async for row in rows] == ['6', '5', '4', '3', '2', '1']
+        rows = await self.Product.AQ.raw_aggregate(stages, stream=True)
+        assert len(await rows.to_list(3)) == 3
+
+        pairs = await self.Product.AQ.simple_aggregate(
+            aggregation=Max('cost'), group_by='product_type', stream=True
+        )
+        assert dict(await pairs.to_list()) == {
+            'book': {'cost__max': 4.0},
+            'food': {'cost__max': 5.0},
+            'phone': {'cost__max': 6.0},
+        }
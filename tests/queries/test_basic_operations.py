@@ -1,10 +1,20 @@
+from threading import Barrier, current_thread
+from typing import Any, Dict, List, Optional, Tuple
+
 import pytest
 from bson import ObjectId
+from pydantic import BaseModel
 
 from mongodantic import connect
 from mongodantic.models import MongoModel
+from mongodantic.pagination import Keyset
 from mongodantic.session import Session
-from mongodantic.exceptions import DoesNotExist
+from mongodantic.exceptions import (
+    DoesNotExist,
+    MongoValidationError,
+    NotDeclaredField,
+    BulkOperationError,
+)
 
 
 class TestBasicOperation:
@@ -56,6 +66,108 @@ class TestBasicOperation:
         assert new_obj.name == 'updated'
         assert new_obj.position == 2310
 
+    def test_save_dirty_fields(self, monkeypatch):
+        class Note(MongoModel):
+            title: str
+            tags: list = []
+            description: Optional[str] = None
+
+        Note.Q.drop_collection(force=True)
+        note = Note(title='first', tags=['a'], description='text').save()
+        assert note.get_dirty_fields() == set()
+        note = Note.Q.find_one(_id=note._id)
+        assert note.get_dirty_fields() == set()
+
+        note.tags.append('b')
+        note.description = None
+        assert note.get_dirty_fields() == {'tags', 'description'}
+        data, fields = note._prepare_save_data([])
+        assert fields == ('tags', 'description')
+        assert data == {
+            '_id': ObjectId(note._id),
+            'tags__set': ['a', 'b'],
+            'description__set': None,
+        }
+        note.save()
+        assert note.get_dirty_fields() == set()
+        raw = Note._collection.find_one({'_id': ObjectId(note._id)})
+        assert raw['tags'] == ['a', 'b']
+        assert raw['description'] is None
+
+        copied = note.copy()
+        copied.title = 'copy'
+        assert copied.get_dirty_fields() == {'title'}
+        assert note.get_dirty_fields() == set()
+
+        def update_one(*args, **kwargs):
+            raise AssertionError('clean object must not be updated')
+
+        monkeypatch.setattr(Note.Q, 'update_one', update_one)
+        note.save()
+
+    def test_dirty_fields_by_declared_type(self):
+        class Author(BaseModel):
+            name: str
+
+        class Post(MongoModel):
+            title: str
+            tags: List[str] = []
+            meta: Dict[str, int] = {}
+            labels: Tuple[str, ...] = ()
+            author: Optional[Author] = None
+            extra: Any = None
+
+        assert Post.__snapshot_fields__ == {'tags', 'meta'}
+        assert Post.__opaque_fields__ == {'author', 'extra'}
+
+        Post.Q.drop_collection(force=True)
+        post = Post(title='first', extra={'a': 1}).save()
+        post = Post.Q.find_one(_id=post._id)
+        assert post.get_dirty_fields() == {'author', 'extra'}
+        post.meta['views'] = 1
+        post.extra['a'] = 2
+        assert post.get_dirty_fields() == {'meta', 'author', 'extra'}
+        post.save()
+        post = Post.Q.find_one(_id=post._id)
+        assert post.meta == {'views': 1}
+        assert post.extra == {'a': 2}
+
+    @pytest.mark.asyncio
+    async def test_async_save_dirty_fields(self):
+        self.test_get_or_create()
+        obj = await self.Ticket.AQ.find_one(name='testerino1', position=222222)
+        assert obj.get_dirty_fields() == set()
+
+        class UntrackedTicket(MongoModel):
+            name: str
+
+            class Config:
+                dirty_tracking = False
+
+            @classmethod
+            def set_collection_name(cls):
+                return 'ticket'
+
+        untracked = await UntrackedTicket.AQ.find_one(name='testerino1')
+        assert untracked.get_dirty_fields() is None
+
+        class TrackedTicket(MongoModel):
+            name: str
+            position: int
+            config: dict
+
+            @classmethod
+            def set_collection_name(cls):
+                return 'ticket'
+
+        obj = await TrackedTicket.AQ.find_one(name='testerino1', position=222222)
+        obj.config['updated'] = True
+        assert obj.get_dirty_fields() == {'config'}
+        await obj.save_async()
+        new_obj = await TrackedTicket.AQ.find_one(_id=obj._id)
+        assert new_obj.config['updated'] is True
+        assert new_obj.name == 'testerino1'
+
     @pytest.mark.asyncio
     async def test_async_bulk(self):
         self.test_get_or_create()
@@ -230,6 +342,253 @@ class TestBasicOperation:
         inserted = self.Ticket.Q.insert_many(data)
         assert inserted == 2
 
+    def _ticket_rows(self, count):
+        for i in range(count):
+            yield {'name': f'bulk{i}', 'position': i, 'config': {}}
+
+    def test_bulk_create_from_generator(self):
+        created = self.Ticket.Q.bulk_create(self._ticket_rows(25), batch_size=10)
+        assert created == 25
+        created = self.Ticket.Q.bulk_create(
+            self._ticket_rows(5), batch_size=2, pipeline=True
+        )
+        assert created == 5
+        assert self.Ticket.Q.count() == 30
+        assert self.Ticket.Q.bulk_create(iter([]), batch_size=10) == 0
+
+    def test_bulk_create_pipeline_with_session(self, monkeypatch):
+        threads = []
+
+        def insert_documents(documents, session=None, **kwargs):
+            threads.append((current_thread(), session))
+            return len(documents)
+
+        monkeypatch.setattr(self.Ticket.Q, '_insert_documents', insert_documents)
+        session = object()
+        created = self.Ticket.Q.bulk_create(
+            self._ticket_rows(5), batch_size=2, session=session, pipeline=True
+        )
+        assert created == 5
+        assert threads == [(current_thread(), session)] * 3
+
+    def test_bulk_create_unordered_errors(self):
+        rows = list(self._ticket_rows(10))
+        for i in (3, 7):
+            rows[i]['_id'] = rows[i - 1]['_id'] = str(ObjectId())
+        result = self.Ticket.Q.bulk_create(
+            rows, batch_size=4, ordered=False, parallelism=2, return_result=True
+        )
+        assert result.inserted_count == 8
+        assert result.failed_indices == [3, 7]
+        assert [error.batch for error in result.errors] == [0, 1]
+        with pytest.raises(BulkOperationError):
+            self.Ticket.Q.bulk_create(rows[2:4], ordered=False)
+
+    def test_bulk_update_parallel(self):
+        self.Ticket.Q.bulk_create(self._ticket_rows(20))
+        tickets = list(self.Ticket.Q.find())
+        for ticket in tickets:
+            ticket.position += 100
+        result = self.Ticket.Q.bulk_update(
+            tickets, ['position'], batch_size=3, parallelism=4
+        )
+        assert result.matched_count == 20
+        assert result.modified_count == 20
+        assert not result.errors
+        assert self.Ticket.Q.count(position__gte=100) == 20
+        with pytest.raises(ValueError):
+            self.Ticket.Q.bulk_update(
+                tickets, ['position'], parallelism=2, session=object()
+            )
+
+    @pytest.mark.asyncio
+    async def test_async_bulk_update_or_create_parallel(self):
+        tickets = [
+            self.Ticket(name=f'bulk{i}', position=i, config={}) for i in range(10)
+        ]
+        result = await self.Ticket.AQ.bulk_update_or_create(
+            tickets, ['name'], batch_size=3, parallelism=3, ordered=False
+        )
+        assert result.upserted_count == 10
+        assert await self.Ticket.AQ.count() == 10
+        with pytest.raises(ValueError):
+            await self.Ticket.AQ.bulk_create(tickets, parallelism=2, session=object())
+
+    @pytest.mark.asyncio
+    async def test_async_bulk_create_from_generator(self):
+        created = await self.Ticket.AQ.bulk_create(self._ticket_rows(25), batch_size=10)
+        assert created == 25
+        assert await self.Ticket.AQ.count(name__regex='^bulk') == 25
+
+    def test_paginate(self):
+        self.Ticket.Q.bulk_create(self._ticket_rows(25))
+        self.Ticket.Q.insert_one(name='bulk_same', position=10, config={})
+        positions, after, pages = [], None, 0
+        while True:
+            page = self.Ticket.Q.paginate(
+                after=after, limit=10, sort_fields=['position'], sort=-1
+            )
+            positions.extend(ticket.position for ticket in page)
+            pages += 1
+            if not page.has_next:
+                break
+            after = page.next_token
+        assert pages == 3
+        assert positions == sorted(positions, reverse=True)
+        assert len(positions) == 26
+
+        page = self.Ticket.Q.paginate(
+            limit=5, sort_fields=['position'], with_count=True, position__gte=20
+        )
+        assert page.count == 5
+        assert page.has_next is False
+        assert [t.position for t in page.items] == [20, 21, 22, 23, 24]
+
+        with pytest.raises(MongoValidationError):
+            self.Ticket.Q.paginate(after=after, sort_fields=['name'])
+        with pytest.raises(MongoValidationError):
+            self.Ticket.Q.paginate(after='broken', sort_fields=['position'], sort=-1)
+
+    def test_paginate_null_sort_values(self):
+        class Rated(MongoModel):
+            name: str
+            rank: Optional[int] = None
+
+        Rated.Q.drop_collection(force=True)
+        Rated.Q.insert_many(
+            [Rated(name=f'r{i}', rank=i % 3 or None) for i in range(9)]
+        )
+        Rated._collection.insert_one({'name': 'missing'})
+        for sort in (1, -1):
+            names, after = [], None
+            while True:
+                page = Rated.Q.paginate(
+                    after=after, limit=2, sort_fields=['rank'], sort=sort, validate=False
+                )
+                names.extend(row['name'] for row in page)
+                if not page.has_next:
+                    break
+                after = page.next_token
+            assert len(names) == 10
+            assert set(names) == {f'r{i}' for i in range(9)} | {'missing'}
+
+    def test_paginate_projection_paths(self):
+        keyset = Keyset(['config.size', 'name'])
+        assert keyset.projection({'config': 1}) == {'config': 1, 'name': 1, '_id': 1}
+        assert keyset.projection({'config.size.unit': 1, '_id': 0}) == {
+            'config.size': 1,
+            'name': 1,
+            '_id': 1,
+        }
+        assert keyset.projection({'config': 0, 'array': 0}) == {'array': 0}
+
+    @pytest.mark.asyncio
+    async def test_async_paginate(self):
+        self.Ticket.Q.bulk_create(self._ticket_rows(15))
+        page = await self.Ticket.AQ.paginate(limit=10, only=['name'])
+        assert page.has_next
+        assert [t.name for t in page.items] == [f'bulk{i}' for i in range(10)]
+        page = await self.Ticket.AQ.paginate(
+            after=page.next_token, limit=10, with_count=True, validate=False
+        )
+        assert page.count == 15
+        assert [row['name'] for row in page.items] == [f'bulk{i}' for i in range(10, 15)]
+
+    def test_find_with_count_estimated_and_cached(self):
+        class CachedTicket(MongoModel):
+            name: str
+            position: int
+
+            class Config:
+                count_cache_ttl = 60
+
+            @classmethod
+            def set_collection_name(cls) -> str:
+                return 'ticket'
+
+        self.Ticket.Q.bulk_create(self._ticket_rows(5))
+        count, qs = self.Ticket.Q.find_with_count(estimated=True)
+        assert count == 5
+        assert len(qs.list) == 5
+        count, _ = self.Ticket.Q.find_with_count(estimated=True, position__gte=3)
+        assert count == 2
+
+        assert CachedTicket.Q.find_with_count(position__gte=3)[0] == 2
+        self.Ticket.Q.insert_one(name='new', position=10, config={})
+        assert CachedTicket.Q.find_with_count(position__gte=3)[0] == 2
+        assert CachedTicket.Q.find_with_count(estimated=True)[0] == 6
+        info = CachedTicket.count_cache_info()
+        assert info['hits'] == 1
+        assert info['currsize'] == 2
+
+        CachedTicket.clear_count_cache()
+        assert CachedTicket.Q.find_with_count(position__gte=3)[0] == 3
+        assert self.Ticket.count_cache_info()['maxsize'] == 0
+
+    def test_find_with_count_concurrent(self):
+        self.Ticket.Q.bulk_create(self._ticket_rows(5))
+        count, qs = self.Ticket.Q.find_with_count(
+            concurrent=True, sort_fields=['position'], sort=-1, limit_rows=2
+        )
+        assert count == 5
+        assert [t.position for t in qs] == [4, 3]
+        count, qs = self.Ticket.Q.find_with_count(concurrent=True, name='missing')
+        assert count == 0
+        assert qs.list == []
+
+    def test_concurrent_operations_share_thread_pool(self):
+        from mongodantic import querybuilder
+
+        self.Ticket.Q.find_with_count(concurrent=True)
+        pool = querybuilder._get_thread_pool()
+        self.Ticket.Q.bulk_create(self._ticket_rows(6), batch_size=2, parallelism=2)
+        self.Ticket.Q.find_with_count(concurrent=True)
+        assert querybuilder._get_thread_pool() is pool
+        assert self.Ticket.Q.count() == 6
+
+    @pytest.mark.asyncio
+    async def test_async_find_with_count_estimated(self):
+        self.Ticket.Q.bulk_create(self._ticket_rows(5))
+        count, qs = await self.Ticket.AQ.find_with_count(estimated=True, limit_rows=3)
+        assert count == 5
+        assert len(await qs.to_list()) == 3
+
+    @pytest.mark.asyncio
+    async def test_async_find_with_count_concurrent(self):
+        self.Ticket.Q.bulk_create(self._ticket_rows(5))
+        collection = self.Ticket._collection
+        # count and find pass the barrier only when both are in flight at once
+        in_flight = Barrier(2, timeout=5)
+
+        class OverlapCollection(object):
+            """stand-in server which blocks count and find until both are sent"""
+
+            def __getattr__(self, name):
+                return getattr(collection, name)
+
+            def count_documents(self, *args, **kwargs):
+                in_flight.wait()
+                return collection.count_documents(*args, **kwargs)
+
+            def find(self, *args, **kwargs):
+                in_flight.wait()
+                return collection.find(*args, **kwargs)
+
+        self.Ticket.__collection__ = OverlapCollection()
+        querybuilder = self.Ticket.__async_querybuilder__
+        try:
+            count, qs = await querybuilder.find_with_count(position__gte=1)
+            data = await qs.to_list()
+        finally:
+            self.Ticket.__collection__ = None
+        assert not in_flight.broken
+        assert count == 4
+        assert [t.position for t in data] == [1, 2, 3, 4]
+
+        count, qs = await self.Ticket.AQ.find_with_count(name='missing')
+        assert count == 0
+        assert await qs.to_list() == []
+
     def test_find_in_array(self):
         self.test_insert_many()
         data = self.Ticket.Q.find_one(array__in=['google']).data
@@ -287,6 +646,100 @@ class TestBasicOperation:
         assert len(data) == 2
         assert isinstance(data[0], MongoModel)
 
+    @pytest.mark.asyncio
+    async def test_async_find_iteration(self):
+        self.test_insert_many()
+        self.test_insert_many_with_dict()
+        r = await self.Ticket.AQ.find(sort=1, sort_fields=('position',))
+        positions = [obj.position async for obj in r.batch_size(1)]
+        assert positions == [2, 2, 3, 4]
+
+        r = await self.Ticket.AQ.find(name='second')
+        data = await r.to_list(1)
+        assert len(data) == 1
+        assert isinstance(data[0], MongoModel)
+        # documents after length are left in cursor
+        rest = await r.to_list()
+        assert len(rest) == 1
+        assert rest[0]._id != data[0]._id
+
+        r = await self.Ticket.AQ.find(position=4)
+        first = await r.first_async()
+        assert first.name == 'four'
+
+        r = await self.Ticket.AQ.find(sort=1, sort_fields=('position',))
+        first = await r.first_async()
+        assert first.position == 2
+        assert [obj.position async for obj in r] == [2, 3, 4]
+
+        r = await self.Ticket.AQ.find(name='second')
+        serialized = [obj async for obj in r.serialize_generator_async(['name'])]
+        assert serialized == [{'name': 'second'}, {'name': 'second'}]
+
+    def test_find_with_projection(self):
+        self.test_insert_many()
+        data = self.Ticket.Q.find(name='second', only=['name']).list
+        assert len(data) == 2
+        assert data[0].name == 'second'
+        assert data[0]._id is not None
+        assert 'position' not in data[0].__fields_set__
+        assert not hasattr(data[0], 'position')
+
+        obj = self.Ticket.Q.find_one(name='second', exclude=['config', 'array'])
+        assert obj.position == 2
+        # default is not filled for unfetched field
+        assert not hasattr(obj, 'array')
+        assert 'array' not in obj.data
+        assert 'array' not in self.Ticket.Q.find(
+            _id=obj._id, exclude=['array']
+        ).data[0]
+
+        count, qs = self.Ticket.Q.find_with_count(name='second', only=['position'])
+        assert count == 2
+        assert [o.position for o in qs] == [2, 2]
+
+        with pytest.raises(MongoValidationError):
+            self.Ticket.Q.find_one(only=['name'], exclude=['position'])
+        with pytest.raises(NotDeclaredField):
+            self.Ticket.Q.find_one(only=['invalid'])
+
+        # partial object saves only fetched and changed fields
+        with pytest.raises(MongoValidationError):
+            obj.save(updated_fields=['array'])
+        obj.position = 3
+        obj.save()
+        stored = self.Ticket.Q.get(_id=obj._id)
+        assert stored.position == 3
+        assert stored.array in (['test', 'google'], ['test', 'adv'])
+        assert stored.config['param1'] in ('2222', '3333')
+        obj.array = [5]
+        obj.save()
+        assert self.Ticket.Q.get(_id=obj._id).array == [5]
+
+    def test_find_without_validation(self):
+        self.test_insert_many()
+        raw = self.Ticket.Q.find(name='second', validate=False).list
+        assert isinstance(raw[0], dict)
+        assert isinstance(raw[0]['_id'], ObjectId)
+        assert raw[0]['position'] == 2
+
+        raw = self.Ticket.Q.find(name='second').raw().first()
+        assert raw['name'] == 'second'
+
+        constructed = self.Ticket.Q.find(name='second').construct().list
+        assert isinstance(constructed[0], self.Ticket)
+        assert constructed[0].position == 2
+        assert constructed[0]._id == raw['_id']
+
+    @pytest.mark.asyncio
+    async def test_async_find_with_projection(self):
+        self.test_insert_many()
+        obj = await self.Ticket.AQ.get(name='second', only=['position'])
+        assert obj.position == 2
+        r = await self.Ticket.AQ.find(name='second', only=['name'])
+        data = await r.to_list()
+        assert [o.name for o in data] == ['second', 'second']
+
     def test_get(self):
         self.test_insert_one()
         data = self.Ticket.Q.get(name='first')
@@ -323,6 +776,60 @@ class TestBasicOperation:
         assert data[0]['name'] == 'second'
         assert isinstance(data, list)
 
+    def test_queryset_data_with_properties(self):
+        class PropTicket(MongoModel):
+            name: str
+            position: int
+
+            @property
+            def title(self) -> str:
+                return f'{self.name}-{self.position}'
+
+            @classmethod
+            def set_collection_name(cls) -> str:
+                return 'ticket'
+
+        assert PropTicket._get_properties() == ['title']
+        assert self.Ticket._get_properties() == []
+
+        class PlainTitleTicket(PropTicket):
+            def title(self) -> str:
+                return self.name
+
+            @property
+            def label(self) -> str:
+                return self.name
+
+        assert PlainTitleTicket._get_properties() == ['label']
+        self.test_insert_many()
+        data = PropTicket.Q.find(name='second').data
+        assert data[0]['title'] == 'second-2'
+        assert isinstance(data[0]['_id'], str)
+        serialized = PropTicket.Q.find(name='second').serialize(['title', 'name'])
+        assert serialized[0] == {'title': 'second-2', 'name': 'second'}
+
+    def test_queryset_data_with_dict_override(self):
+        class ExtraTicket(MongoModel):
+            name: str
+            position: int
+
+            def dict(self, **kwargs):
+                data = super().dict(**kwargs)
+                data['extra'] = self.position * 10
+                return data
+
+            @classmethod
+            def set_collection_name(cls) -> str:
+                return 'ticket'
+
+        self.test_insert_many()
+        obj = ExtraTicket.Q.find_one(name='second')
+        data = ExtraTicket.Q.find(name='second').data
+        assert data[0] == obj.data
+        assert data[0]['extra'] == 20
+        serialized = ExtraTicket.Q.find(name='second').serialize(['extra', 'name'])
+        assert serialized[0] == {'extra': 20, 'name': 'second'}
+
     def test_delete_one(self):
         self.test_insert_one()
         deleted = self.Ticket.Q.delete_one(position=1)
@@ -5,6 +5,7 @@ from pymongo import IndexModel
 from mongodantic.models import MongoModel
 from mongodantic import connect
 from mongodantic.exceptions import MongoIndexError
+from mongodantic.indexes import plan_indexes
 
 
 class TestIndexOperation:
@@ -52,3 +53,117 @@ class TestIndexOperation:
         result = self.Ticket.querybuilder.drop_index('position_1')
         assert result == 'position_1 dropped.'
         self.setup(True, False)
+
+    def test_execute_indexes_rebuilds_changed_spec(self):
+        self.setup(True)
+
+        class Ticket(MongoModel):
+            name: str
+            position: int
+            config: dict
+
+            class Config:
+                indexes = [
+                    IndexModel([('position', 1)], unique=True),
+                    IndexModel([('name', 1), ('position', -1)], name='by_name'),
+                ]
+
+        events = []
+        task = Ticket.execute_indexes(on_progress=events.append)
+        plan = task.plan
+        assert [i.document['name'] for i in plan.rebuild] == ['position_1']
+        assert [i.document['name'] for i in plan.create] == ['by_name']
+        assert plan.drop == ['name_1']
+        phases = [e['phase'] for e in events]
+        assert phases.index('replacing') < phases.index('dropping')
+        assert phases[-1] == 'done'
+        assert events[-1]['done'] == events[-1]['total'] == 5
+        assert Ticket.__indexes__ == {'_id_', 'position_1', 'by_name'}
+        indexes = {i['name']: i for i in Ticket.Q.list_indexes()}
+        assert indexes['position_1']['unique'] is True
+        assert set(indexes) == {'_id_', 'position_1', 'by_name'}
+
+        assert not Ticket.execute_indexes().plan
+        assert Ticket.execute_indexes().plan.unchanged == ['position_1', 'by_name']
+
+    def test_execute_indexes_in_background(self):
+        self.setup(True, False)
+
+        class Ticket(MongoModel):
+            name: str
+            position: int
+            config: dict
+
+            class Config:
+                indexes = [IndexModel([('name', 1)])]
+
+        task = Ticket.execute_indexes(background=True, drop_unknown=False)
+        plan = task.wait(5)
+        assert task.done()
+        assert task.progress['phase'] == 'done'
+        assert [i.document['name'] for i in plan.create] == ['name_1']
+        assert plan.drop == []
+        assert set(Ticket.Q.check_indexes()) == {'_id_', 'position_1', 'name_1'}
+
+    def test_plan_indexes(self):
+        existing = [
+            {'key': {'_id': 1}, 'name': '_id_', 'v': 2},
+            {'key': {'a': 1.0}, 'name': 'a_1', 'v': 2, 'background': True},
+            {
+                'key': {'b': 1},
+                'name': 'b_1',
+                'collation': {'locale': 'en', 'strength': 3, 'caseLevel': False},
+            },
+            {'key': {'c': 1}, 'name': 'c_1', 'expireAfterSeconds': 60},
+            {'key': {'d': 1}, 'name': 'old_d'},
+            {'key': {'_fts': 'text', '_ftsx': 1}, 'name': 'text', 'weights': {'title': 1}},
+            {'key': {'e': 1}, 'name': 'e_1'},
+        ]
+        declared = [
+            IndexModel([('a', 1)]),
+            IndexModel([('b', 1)], collation={'locale': 'en'}),
+            IndexModel([('c', 1)], expireAfterSeconds=120),
+            IndexModel([('d', 1)]),
+            IndexModel([('title', 'text')], name='text'),
+        ]
+        plan = plan_indexes(declared, existing)
+        assert plan.unchanged == ['a_1', 'b_1', 'text']
+        assert [i.document['name'] for i in plan.rebuild] == ['c_1']
+        assert [i.document['name'] for i in plan.create] == ['d_1']
+        assert plan.rebuild_drop == ['c_1', 'old_d']
+        assert plan.drop == ['e_1']
+        assert plan.steps == 6
+        assert plan_indexes(declared, existing, drop_unknown=False).drop == []
+
+        changed = [IndexModel([('b', 1)], collation={'locale': 'fr'}, name='b_1')]
+        assert plan_indexes(changed, existing).rebuild_drop == ['b_1']
+
+    def test_rebuild_without_replacement(self, monkeypatch, caplog):
+        self.setup(True)
+
+        class Ticket(MongoModel):
+            name: str
+            position: int
+            config: dict
+
+            class Config:
+                indexes = [IndexModel([('position', 1)], unique=True)]
+
+        create_indexes = Ticket.Q.create_indexes
+        built = []
+
+        def conflicting_create_indexes(indexes, session=None):
+            names = [index.document['name'] for index in indexes]
+            if names == ['position_1__rebuild']:
+                raise pymongo.errors.OperationFailure('conflict', code=85)
+            built.extend(names)
+            return create_indexes(indexes, session=session)
+
+        monkeypatch.setattr(Ticket.Q, 'create_indexes', conflicting_create_indexes)
+        task = Ticket.execute_indexes(drop_unknown=False)
+        assert 'position_1 of Ticket is missing until it is rebuilt' in caplog.text
+        assert built == ['position_1']
+        assert task.progress['done'] == task.progress['total'] == 4
+        indexes = {i['name']: i for i in Ticket.Q.list_indexes()}
+        assert indexes['position_1']['unique'] is True
+        assert set(indexes) == {'_id_', 'position_1', 'name_1'}
@@ -0,0 +1,131 @@
+import multiprocessing
+import pickle
+from datetime import datetime, timedelta
+
+import pytest
+from bson import ObjectId
+
+from mongodantic import connect, RetryPolicy
+from mongodantic.connection import get_connection_env
+from mongodantic.models import MongoModel
+from mongodantic.parallel import (
+    id_ranges,
+    interpolate_ids,
+    sample_boundaries,
+    worker_settings,
+)
+
+
+class Measurement(MongoModel):
+    sensor: str
+    value: int
+
+
+class ArchivedMeasurement(MongoModel):
+    sensor: str
+    value: int
+
+    class Config:
+        connection_env = 'archive'
+
+
+def double(obj):
+    return obj.value * 2
+
+
+def add(first, second):
+    return first + second
+
+
+class TestParallelScan:
+    def setup(self):
+        connect("mongodb://127.0.0.1:27017", "test")
+        Measurement.Q.drop_collection(force=True)
+        Measurement.Q.insert_many(
+            [Measurement(sensor=f's{i % 3}', value=i) for i in range(60)]
+        )
+
+    def test_boundaries(self):
+        assert sample_boundaries(list(range(100, 0, -1)), 4) == [26, 51, 76]
+        assert sample_boundaries([1, 1, 1, 2], 4) == [1, 2]
+        assert sample_boundaries([], 4) == []
+        assert interpolate_ids(0, 100, 4) == [25, 50, 75]
+        assert interpolate_ids('a', 'z', 4) == []
+
+        start = datetime(2021, 1, 1)
+        low = ObjectId.from_datetime(start)
+        high = ObjectId.from_datetime(start + timedelta(days=4))
+        boundaries = interpolate_ids(low, high, 4)
+        assert [b.generation_time.day for b in boundaries] == [2, 3, 4]
+        assert interpolate_ids(low, low, 4) == []
+
+        assert id_ranges([10, 20]) == [(None, 10), (10, 20), (20, None)]
+        assert id_ranges([]) == [(None, None)]
+
+    def test_scan_in_current_process(self):
+        expected = [i * 2 for i in range(60)]
+        assert Measurement.Q.parallel_scan(double, partitions=4, workers=0) == expected
+        assert (
+            Measurement.Q.parallel_scan(double, partitions=4, workers=0, split='interpolate')
+            == expected
+        )
+        assert Measurement.Q.parallel_scan(
+            double, partitions=5, workers=0, reduce=add, sensor='s1'
+        ) == sum(i * 2 for i in range(1, 60, 3))
+        assert (
+            Measurement.Q.parallel_scan(double, workers=0, reduce=add, sensor='none')
+            is None
+        )
+        assert Measurement.Q.parallel_scan(
+            lambda obj: obj.sensor, partitions=3, workers=0, only=['sensor']
+        ) == [f's{i % 3}' for i in range(60)]
+
+        with pytest.raises(ValueError):
+            Measurement.Q.parallel_scan(double, workers=0, split='splitVector')
+        with pytest.raises(ValueError):
+            Measurement.Q.parallel_scan(double, partitions=0, workers=0)
+
+    def test_scan_in_process_pool(self):
+        result = Measurement.Q.parallel_scan(double, partitions=6, workers=2)
+        assert result == [i * 2 for i in range(60)]
+        assert Measurement.Q.parallel_scan(
+            double, partitions=6, workers=2, reduce=add, value__gte=30
+        ) == sum(i * 2 for i in range(30, 60))
+
+    def test_scan_in_spawned_workers(self):
+        # spawned workers get connection settings, retry policy included, by pickle
+        connect(
+            "mongodb://127.0.0.1:27017",
+            "test",
+            server_selection_timeout_ms=5000,
+            retry_policy=RetryPolicy(max_attempts=2),
+        )
+        context = multiprocessing.get_context('spawn')
+        assert Measurement.Q.parallel_scan(
+            double, partitions=4, workers=2, reduce=add, mp_context=context
+        ) == sum(i * 2 for i in range(60))
+
+    def test_worker_settings(self):
+        connect(
+            "mongodb://127.0.0.1:27017",
+            "archive",
+            env_name='archive',
+            retry_policy=RetryPolicy(max_attempts=2),
+        )
+        connect(
+            "mongodb://127.0.0.1:27017", "test", retry_policy=RetryPolicy(max_attempts=3)
+        )
+        env_name, settings = pickle.loads(
+            pickle.dumps(worker_settings(ArchivedMeasurement))
+        )
+        assert env_name == get_connection_env()
+        assert set(settings) == {env_name, 'archive'}
+        assert settings['archive']['dbname'] == 'archive'
+        policy = settings[env_name]['retry_policy']
+        assert policy.max_attempts == 3
+        assert policy.stats() == {'calls': 0, 'retries': 0, 'failures': 0}
+
+    @pytest.mark.asyncio
+    async def test_async_scan(self):
+        result = await Measurement.AQ.parallel_scan(double, partitions=3, workers=0)
+        assert result == [i * 2 for i in range(60)]
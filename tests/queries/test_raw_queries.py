@@ -62,6 +62,18 @@ class TestBasicOperation:
         assert result['name'] == 'first'
         assert result['email'] == 'first@mail.ru'
 
+    @pytest.mark.asyncio
+    async def test_raw_invalid_method(self):
+        for method_name in ('find_ones', 'name', '_Collection__database'):
+            with pytest.raises(MongoValidationError):
+                self.User.Q.raw_query(method_name, {'name': 'first'})
+            with pytest.raises(MongoValidationError):
+                await self.User.AQ.raw_query(method_name, {'name': 'first'})
+            with pytest.raises(MongoValidationError):
+                await self.User.__motor_querybuilder__.raw_query(
+                    method_name, {'name': 'first'}
+                )
+
     # @pytest.mark.asyncio
     # async def test_async_raw_find_one(self):
     #     await self.test_async_raw_insert_one()
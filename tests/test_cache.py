@@ -0,0 +1,168 @@
+from fnmatch import fnmatch
+from time import sleep
+
+import pytest
+
+from mongodantic import connect
+from mongodantic.cache import MemoryCacheBackend, RedisCacheBackend, ResultCache
+from mongodantic.exceptions import DoesNotExist
+from mongodantic.models import MongoModel
+
+
+class FakeRedis(object):
+    """redis-compatible stand-in, keeps values in dict and ignores expiration"""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, px=None):
+        self.data[key] = value
+
+    def incr(self, key):
+        self.data[key] = int(self.data.get(key, 0)) + 1
+        return self.data[key]
+
+    def scan_iter(self, pattern):
+        return [key for key in list(self.data) if fnmatch(key, pattern)]
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+
+class TestResultCache:
+    def setup(self):
+        connect("mongodb://127.0.0.1:27017", "test")
+        self.redis = FakeRedis()
+
+        class Setting(MongoModel):
+            key: str
+            value: int
+
+            class Config:
+                result_cache = True
+                result_cache_ttl = 60
+
+        class SharedSetting(MongoModel):
+            key: str
+            value: int
+
+            class Config:
+                result_cache = True
+                result_cache_backend = RedisCacheBackend(self.redis, prefix='test:')
+
+            @classmethod
+            def set_collection_name(cls) -> str:
+                return 'setting'
+
+        Setting.Q.drop_collection(force=True)
+        Setting.Q.insert_many(
+            [Setting(key='a', value=1), Setting(key='b', value=2)]
+        )
+        self.Setting = Setting
+        self.SharedSetting = SharedSetting
+
+    def test_read_through_and_invalidation(self):
+        assert self.Setting.Q.get(key='a').value == 1
+        obj = self.Setting.Q.get(key='a')
+        assert obj.value == 1
+        assert self.Setting.result_cache_info()['hits'] == 1
+        assert self.Setting.result_cache_info()['misses'] == 1
+
+        obj.value = 10
+        obj.save()
+        assert self.Setting.Q.find_one(key='a').value == 10
+
+        assert self.Setting.Q.count(value__gte=2) == 2
+        assert sorted(self.Setting.Q.distinct('key')) == ['a', 'b']
+        hits = self.Setting.result_cache_info()['hits']
+        assert self.Setting.Q.count(value__gte=2) == 2
+        assert sorted(self.Setting.Q.distinct('key')) == ['a', 'b']
+        assert self.Setting.result_cache_info()['hits'] == hits + 2
+
+        self.Setting.Q.update_many(key='b', value__set=20)
+        assert self.Setting.Q.find_one(key='b').value == 20
+        self.Setting.Q.bulk_create([self.Setting(key='c', value=3)])
+        assert self.Setting.Q.count(value__gte=2) == 3
+        self.Setting.Q.delete_one(key='c')
+        assert sorted(self.Setting.Q.distinct('key')) == ['a', 'b']
+        with pytest.raises(DoesNotExist):
+            self.Setting.Q.get(key='c')
+        assert self.Setting.result_cache_info()['invalidations'] >= 5
+
+    def test_cached_objects_are_not_shared(self):
+        first = self.Setting.Q.get(key='a')
+        first.value = 100
+        assert self.Setting.Q.get(key='a').value == 1
+
+    def test_ttl(self):
+        cache = ResultCache(MemoryCacheBackend(), ttl=0.05)
+        key = cache.key('test:setting', 'count', ({'key': 'a'},))
+        cache.set(key, 1)
+        assert cache.get(key) == (True, 1)
+        sleep(0.06)
+        assert cache.get(key) == (False, None)
+
+    def test_raw_query_invalidation(self):
+        assert self.Setting.Q.count(value__gte=2) == 1
+        self.Setting.Q.raw_query('insert_one', {'key': 'c', 'value': 3})
+        assert self.Setting.Q.count(value__gte=2) == 2
+        self.Setting.Q.raw_query('delete_many', {'key': 'b'})
+        assert self.Setting.Q.count(value__gte=2) == 1
+
+    def test_transaction_write_is_invalidated_after_commit(self):
+        class FakeSession(object):
+            in_transaction = True
+
+        session = FakeSession()
+        cache = ResultCache(MemoryCacheBackend())
+        cache.invalidate('test:setting', session)
+        # committed value is read by other client while transaction is active
+        cache.set(cache.key('test:setting', 'count', ({},)), 1)
+        assert cache.get(cache.key('test:setting', 'count', ({},))) == (True, 1)
+
+        session.in_transaction = False
+        assert cache.get(cache.key('test:setting', 'count', ({},))) == (False, None)
+        assert cache.info()['invalidations'] == 2
+        assert cache._deferred == []
+
+    def test_uncached_model(self):
+        class Plain(MongoModel):
+            key: str
+
+        assert Plain.__result_cache__ is None
+        assert Plain.result_cache_info() == {'hits': 0, 'misses': 0, 'invalidations': 0}
+
+    def test_redis_backend(self):
+        assert self.SharedSetting.Q.get(key='b').value == 2
+        assert self.SharedSetting.Q.get(key='b').value == 2
+        assert self.SharedSetting.result_cache_info()['hits'] == 1
+        assert all(key.startswith('test:') for key in self.redis.data)
+
+        self.SharedSetting.Q.update_one(key='b', value__set=5)
+        assert self.SharedSetting.Q.get(key='b').value == 5
+        self.SharedSetting.clear_result_cache()
+        assert self.SharedSetting.Q.get(key='b').value == 5
+        assert self.SharedSetting.result_cache_info()['misses'] == 3
+
+    def test_models_of_one_collection(self):
+        assert self.Setting.Q._result_cache_namespace() == 'test.setting'
+        assert self.SharedSetting.Q.get(key='a').value == 1
+        assert self.Setting.Q.get(key='a').value == 1
+        self.Setting.Q.update_one(key='a', value__set=3)
+        assert self.SharedSetting.Q.get(key='a').value == 3
+        self.SharedSetting.Q.update_one(key='a', value__set=4)
+        assert self.Setting.Q.get(key='a').value == 4
+        assert self.SharedSetting.result_cache_info()['hits'] == 0
+
+    @pytest.mark.asyncio
+    async def test_async_read_through(self):
+        assert (await self.Setting.AQ.get(key='a')).value == 1
+        assert (await self.Setting.AQ.get(key='a')).value == 1
+        assert await self.Setting.AQ.count(key='a') == 1
+        assert self.Setting.result_cache_info()['hits'] == 1
+
+        await self.Setting.AQ.update_one(key='a', value__set=7)
+        assert (await self.Setting.AQ.find_one(key='a')).value == 7
@@ -1,9 +1,11 @@
 import os
 
-from mongodantic import connect
-from mongodantic.connection import _DBConnection, _connection_settings
-from mongodantic.connection import DEFAULT_CONNECTION_NAME
-from pymongo import MongoClient
+from mongodantic import connect, set_connection_env, get_connection_env
+from mongodantic.connection import _DBConnection, _connection_settings, _connections
+from mongodantic.connection import DEFAULT_CONNECTION_NAME, _reset_after_fork
+from mongodantic.models import MongoModel
+from mongodantic.querybuilder import AsyncQueryBuilder, MotorQueryBuilder
+from pymongo import MongoClient, ReadPreference, WriteConcern
 
 
 class TestWriteConnectionParams:
@@ -27,3 +29,84 @@ class TestWriteConnectionParams:
         assert self.connection._mongo_connection.get_database('test') == MongoClient(
             "mongodb://127.0.0.1:27017"
         ).get_database("test")
+
+
+class TestConnectionRegistry:
+    def setup(self):
+        connect("mongodb://127.0.0.1:27017", "test")
+        connect("mongodb://127.0.0.1:27017", "test_second", env_name='second')
+        set_connection_env(DEFAULT_CONNECTION_NAME)
+
+        class Ticket(MongoModel):
+            name: str
+
+        class SecondTicket(MongoModel):
+            name: str
+
+            class Config:
+                connection_env = 'second'
+
+        self.Ticket = Ticket
+        self.SecondTicket = SecondTicket
+
+    def test_envs_do_not_collide(self):
+        pid = str(os.getpid())
+        assert (pid, DEFAULT_CONNECTION_NAME) in _connections
+        assert (pid, 'second') in _connections
+        assert self.Ticket._connection is _connections[(pid, DEFAULT_CONNECTION_NAME)]
+        assert self.SecondTicket._connection is _connections[(pid, 'second')]
+        assert self.SecondTicket.get_database().name == 'test_second'
+
+    def test_collection_is_cached(self):
+        collection = self.Ticket._collection
+        assert self.Ticket._collection is collection
+        self.Ticket._reconnect()
+        assert self.Ticket._collection is not collection
+
+    def test_collection_options(self):
+        class ConcernTicket(MongoModel):
+            name: str
+
+            class Config:
+                write_concern = WriteConcern(w=0)
+                read_preference = ReadPreference.SECONDARY_PREFERRED
+
+        collection = ConcernTicket._collection
+        assert collection.write_concern == WriteConcern(w=0)
+        assert collection.read_preference == ReadPreference.SECONDARY_PREFERRED
+        assert self.Ticket._collection.write_concern == WriteConcern()
+
+    def test_set_connection_env(self):
+        connection = self.Ticket._connection
+        set_connection_env('second')
+        assert get_connection_env() == 'second'
+        assert self.Ticket._connection is not connection
+        assert self.Ticket.get_database().name == 'test_second'
+        set_connection_env(DEFAULT_CONNECTION_NAME)
+        assert self.Ticket._connection is connection
+
+    def test_reset_after_fork(self):
+        connection = self.Ticket._connection
+        _reset_after_fork()
+        assert not _connections
+        assert self.Ticket._connection is not connection
+
+    def test_async_querybuilder_without_connection(self):
+        class OfflineTicket(MongoModel):
+            name: str
+
+            class Config:
+                connection_env = 'offline'
+
+        assert type(OfflineTicket.AQ) is AsyncQueryBuilder
+        assert (str(os.getpid()), 'offline') not in _connections
+
+    def test_motor_querybuilder(self):
+        connect(
+            "mongodb://127.0.0.1:27017",
+            "test_second",
+            env_name='second',
+            async_driver='motor',
+        )
+        set_connection_env(DEFAULT_CONNECTION_NAME)
+        assert type(self.SecondTicket.AQ) is MotorQueryBuilder
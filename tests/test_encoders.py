@@ -0,0 +1,70 @@
+import json
+from decimal import Decimal
+from datetime import datetime
+
+import pytest
+from bson import ObjectId, Decimal128
+
+from mongodantic.encoders import json_dumps, set_json_backend, get_json_backend
+from mongodantic.models import MongoModel
+from mongodantic.queryset import QuerySet
+from mongodantic import connect
+
+
+class TestJsonEncoders:
+    def setup(self):
+        connect("mongodb://127.0.0.1:27017", "test")
+
+        class Order(MongoModel):
+            number: int
+            created: datetime
+
+        self.Order = Order
+
+    def teardown(self):
+        set_json_backend()
+
+    @pytest.mark.parametrize('backend', ['json', 'orjson'])
+    def test_bson_types(self, backend):
+        pytest.importorskip(backend)
+        set_json_backend(backend)
+        assert get_json_backend() == backend
+        oid = ObjectId()
+        data = {
+            '_id': oid,
+            'created': datetime(2020, 1, 1, 10, 30),
+            'price': Decimal128('10.50'),
+            'total': Decimal('3.3'),
+        }
+        assert json.loads(json_dumps(data)) == {
+            '_id': str(oid),
+            'created': '2020-01-01T10:30:00',
+            'price': '10.50',
+            'total': '3.3',
+        }
+
+    def test_default_backend(self):
+        set_json_backend()
+        assert get_json_backend() == 'json'
+        data = {'_id': ObjectId(), 'numbers': [1, 2], 'name': 'тест'}
+        assert json_dumps(data) == json.dumps(data, default=str)
+
+    def test_invalid_backend(self):
+        with pytest.raises(ValueError):
+            set_json_backend('pickle')
+
+    def test_json_stream(self):
+        documents = [
+            {'_id': ObjectId(), 'number': i, 'created': datetime(2020, 1, i + 1)}
+            for i in range(3)
+        ]
+        chunks = list(QuerySet(self.Order, iter(documents)).json_stream(['number']))
+        assert chunks[0] == '['
+        assert chunks[-1] == ']'
+        assert len(chunks) == 5
+        assert json.loads(''.join(chunks)) == [{'number': i} for i in range(3)]
+
+        empty = ''.join(QuerySet(self.Order, iter([])).json_stream())
+        assert json.loads(empty) == []
+        full = json.loads(''.join(QuerySet(self.Order, iter(documents)).json_stream()))
+        assert full[0]['_id'] == str(documents[0]['_id'])
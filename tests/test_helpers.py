@@ -1,7 +1,14 @@
 import re
 import pytest
-
-from mongodantic.helpers import ExtraQueryMapper
+from bson import ObjectId
+from pydantic import BaseModel
+
+from mongodantic.helpers import (
+    ExtraQueryMapper,
+    bulk_query_generator,
+    compile_bulk_query,
+)
+from mongodantic.exceptions import MongoValidationError
 from mongodantic.models import MongoModel
 from mongodantic import connect
 
@@ -107,3 +114,107 @@ class TestExtraQueryMapper:
 
         extra = ExtraQueryMapper(self.User, 'counter').extra_query(['exists'], False)
         assert extra == {'counter': {'$exists': False}}
+
+
+class TestQueryPlanCache:
+    def setup(self):
+        connect("mongodb://127.0.0.1:27017", "test")
+
+        class User(MongoModel):
+            name: str
+            counter: int
+
+            class Config:
+                query_plan_cache_size = 2
+
+        class Uncached(MongoModel):
+            name: str
+
+            class Config:
+                query_plan_cache_size = 0
+
+        self.User = User
+        self.Uncached = Uncached
+
+    def test_plan_reused_for_same_keys(self):
+        first = self.User._validate_query_data({'name': 1, 'counter__gte': '3'})
+        second = self.User._validate_query_data({'name': 2, 'counter__gte': '4'})
+        assert first == {'name': '1', 'counter': {'$gte': 3}}
+        assert second == {'name': '2', 'counter': {'$gte': 4}}
+        info = self.User.query_plan_cache_info()
+        assert info['hits'] == 1
+        assert info['misses'] == 1
+
+    def test_plan_cache_bounded(self):
+        self.User._validate_query_data({'name': 'a'})
+        self.User._validate_query_data({'counter': 1})
+        self.User._validate_query_data({'counter__lt': 1})
+        assert self.User.query_plan_cache_info()['currsize'] == 2
+
+    def test_plan_cache_disabled(self):
+        data = self.Uncached._validate_query_data({'name': 'a'})
+        assert data == {'name': 'a'}
+        assert self.Uncached.query_plan_cache_info()['maxsize'] == 0
+
+
+class TestCompileBulkQuery:
+    def setup(self):
+        connect("mongodb://127.0.0.1:27017", "test")
+
+        class Address(BaseModel):
+            city: str
+
+        class Customer(MongoModel):
+            name: str
+            email: str
+            address: Address
+            tags: list = []
+
+            @property
+            def title(self):
+                return self.name.title()
+
+        self.Customer = Customer
+        self.customer = Customer.parse_obj(
+            {
+                '_id': ObjectId(),
+                'name': 'john',
+                'email': 'john@test.com',
+                'address': {'city': 'Moscow'},
+            }
+        )
+
+    def test_updated_fields(self):
+        operation = bulk_query_generator([self.customer], updated_fields=['address'])[0]
+        assert operation._filter == {'_id': ObjectId(self.customer._id)}
+        assert operation._doc == {'$set': {'address': {'city': 'Moscow'}}}
+
+    def test_query_fields(self):
+        operation = bulk_query_generator(
+            [self.customer], query_fields=['email'], upsert=True
+        )[0]
+        assert operation._filter == {'email': 'john@test.com'}
+        assert operation._doc == {
+            '$set': {'name': 'john', 'address': {'city': 'Moscow'}, 'tags': []}
+        }
+        assert operation._upsert is True
+
+    def test_compiled_once(self):
+        build = compile_bulk_query(self.Customer, ('name',), ())
+        assert compile_bulk_query(self.Customer, ('name',), ()) is build
+        assert self.Customer.__bulk_query_cache__[(('name',), ())][1] is build
+
+        self.Customer.sort_fields(['tags', 'email', 'name', 'address'])
+        resorted = compile_bulk_query(self.Customer, ('name',), ())
+        assert resorted is not build
+        assert compile_bulk_query(self.Customer, ('name',), ()) is resorted
+
+    def test_not_fetched_fields(self):
+        partial = self.Customer._parse_partial(
+            {'_id': ObjectId(self.customer._id), 'name': 'john'}
+        )
+        assert bulk_query_generator([partial], updated_fields=['name'])
+        with pytest.raises(MongoValidationError):
+            bulk_query_generator([partial], updated_fields=['email'])
+        with pytest.raises(MongoValidationError):
+            bulk_query_generator([partial], query_fields=['name'])
@@ -0,0 +1,114 @@
+import io
+from datetime import datetime
+
+from pymongo import IndexModel
+
+from mongodantic import connect
+from mongodantic.logical import Query
+from mongodantic.indexes import (
+    QueryShape,
+    ShapeRecorder,
+    advise_indexes,
+    load_shapes,
+)
+from mongodantic.models import MongoModel
+from mongodantic.monitoring import register_listener, unregister_listener
+
+
+class TestIndexAdvisor:
+    def setup(self):
+        connect("mongodb://127.0.0.1:27017", "test")
+
+        class Order(MongoModel):
+            status: str
+            customer: str
+            created: datetime
+            total: int = 0
+            archived: bool = False
+
+            class Config:
+                indexes = [
+                    IndexModel([('customer', 1)]),
+                    IndexModel([('customer', 1), ('created', -1)]),
+                    IndexModel([('archived', 1)]),
+                    IndexModel([('status', 1)], unique=True, name='status_unique'),
+                ]
+
+        Order.Q.drop_collection(force=True)
+        self.Order = Order
+        self.recorder = ShapeRecorder()
+        register_listener(self.recorder)
+
+    def teardown(self):
+        unregister_listener(self.recorder)
+
+    def test_record_shapes(self):
+        now = datetime.utcnow()
+        list(self.Order.Q.find(status='new', created__gte=now, sort_fields=['total']))
+        list(self.Order.Q.find(status='paid', created__gte=now, sort_fields=['total']))
+        self.Order.Q.count(customer='a', total__in=[1, 2])
+        self.Order.Q.update_many(customer='a', total__set=1)
+        self.Order.Q.raw_aggregate(
+            [{'$match': {'status': 'new'}}, {'$sort': {'created': -1}}, {'$limit': 1}]
+        )
+        self.Order.Q.insert_one(status='new', customer='a', created=now)
+
+        shapes = self.recorder.shapes()
+        find = QueryShape('Order', 'order', ['status'], [('total', 1)], ['created'])
+        assert shapes[find] == 2
+        assert shapes[QueryShape('Order', 'order', ['customer', 'total'])] == 1
+        assert shapes[QueryShape('Order', 'order', ['customer'])] == 1
+        assert shapes[QueryShape('Order', 'order', ['status'], [('created', -1)])] == 1
+        assert len(shapes) == 4
+        assert find.recommended_keys() == (('status', 1), ('total', 1), ('created', 1))
+
+    def test_or_branches(self):
+        self.Order.Q.find_one(
+            Query(status='new') & (Query(customer='a') | Query(total__gt=1))
+        )
+        assert set(self.recorder.shapes()) == {
+            QueryShape('Order', 'order', ['status', 'customer']),
+            QueryShape('Order', 'order', ['status'], range=['total']),
+        }
+
+    def test_report(self):
+        shapes = {
+            QueryShape('Order', 'order', ['status'], [('total', 1)], ['created']): 10,
+            QueryShape('Order', 'order', ['status'], [('total', 1)]): 3,
+            QueryShape('Order', 'order', ['customer'], [('created', 1)]): 5,
+            QueryShape('Order', 'order', ['_id']): 7,
+            QueryShape('Other', 'other', ['name']): 1,
+        }
+        report = advise_indexes([self.Order], shapes)
+        (missing,) = report.missing
+        assert missing['keys'] == (('status', 1), ('total', 1), ('created', 1))
+        assert missing['count'] == 13
+        assert len(missing['shapes']) == 2
+        (shadowed,) = report.shadowed
+        assert shadowed['name'] == 'customer_1'
+        assert shadowed['shadowed_by'] == 'customer_1_created_-1'
+        (redundant,) = report.redundant
+        assert redundant['name'] == 'archived_1'
+        assert 'missing Order {status: 1, total: 1, created: 1}' in report.format()
+
+        assert not advise_indexes([self.Order], shapes, min_count=20).missing
+
+    def test_offline_shape_log(self, tmp_path):
+        list(self.Order.Q.find(customer='a', sort_fields=['created'], sort=-1))
+        list(self.Order.Q.find(customer='b', sort_fields=['created'], sort=-1))
+        path = str(tmp_path / 'shapes.jsonl')
+        self.recorder.dump(path)
+        self.recorder.dump(path)
+        shapes = load_shapes(path)
+        assert shapes == {QueryShape('Order', 'order', ['customer'], [('created', -1)]): 4}
+
+        report = advise_indexes([self.Order], path)
+        assert report.missing == []
+        assert [item['name'] for item in report.redundant] == ['archived_1']
+
+        buffer = io.StringIO()
+        self.recorder.dump(buffer)
+        buffer.seek(0)
+        assert load_shapes(buffer) == {
+            QueryShape('Order', 'order', ['customer'], [('created', -1)]): 2
+        }
@@ -0,0 +1,209 @@
+import gc
+
+import pytest
+from pymongo.errors import AutoReconnect, OperationFailure
+
+from mongodantic import connect, RetryPolicy
+from mongodantic.models import MongoModel
+from mongodantic.monitoring import (
+    QueryListener,
+    QueryMetrics,
+    register_listener,
+    unregister_listener,
+    get_listeners,
+)
+
+
+class RecordingListener(QueryListener):
+    def __init__(self):
+        self.started_events = []
+        self.events = []
+
+    def started(self, event):
+        self.started_events.append(event)
+
+    def succeeded(self, event):
+        self.events.append(event)
+
+    def failed(self, event):
+        self.events.append(event)
+
+
+class BrokenListener(QueryListener):
+    def succeeded(self, event):
+        raise ValueError('broken listener')
+
+
+class TestMonitoring:
+    def setup(self):
+        connect(
+            "mongodb://127.0.0.1:27017",
+            "test",
+            retry_policy=RetryPolicy(max_attempts=3, backoff_base=0, jitter=False),
+        )
+
+        class Account(MongoModel):
+            name: str
+            balance: int = 0
+
+        Account.Q.drop_collection(force=True)
+        self.Account = Account
+        self.listener = RecordingListener()
+        self.metrics = QueryMetrics(buckets=(0.01, 0.1, 1.0))
+        register_listener(self.listener)
+        register_listener(self.metrics)
+
+    def teardown(self):
+        unregister_listener(self.listener)
+        unregister_listener(self.metrics)
+
+    def _use_flaky_collection(self, errors):
+        collection = self.Account._collection
+
+        class FlakyCollection(object):
+            def __getattr__(self, name):
+                return getattr(collection, name)
+
+            def find_one(self, *args, **kwargs):
+                if errors:
+                    raise errors.pop(0)
+                return collection.find_one(*args, **kwargs)
+
+        self.Account.__collection__ = FlakyCollection()
+
+    def test_events(self):
+        self.Account.Q.insert_one(name='first', balance=10)
+        obj = self.Account.Q.find_one(name='first', balance__gte='5')
+        assert obj.balance == 10
+        self.Account.Q.find_one(name='missing')
+
+        insert, find_one, missing = self.listener.events
+        assert len(self.listener.started_events) == 3
+        assert insert.model is self.Account
+        assert insert.method_name == 'insert_one'
+        assert find_one.method_name == 'find_one'
+        assert find_one.query == {'name': 'first', 'balance': {'$gte': 5}}
+        assert find_one.documents == 1
+        assert find_one.bytes > 0
+        assert find_one.duration >= 0
+        assert find_one.retries == 0
+        assert missing.documents == 0
+        assert missing.bytes is None
+
+    def test_direct_driver_calls(self):
+        self.Account.Q.raw_query('insert_one', {'name': 'raw', 'balance': 1})
+        assert self.Account.Q.distinct('name', balance__gte=1) == ['raw']
+        count, _ = self.Account.Q.find_with_count(estimated=True)
+        assert count == 1
+
+        raw, distinct, estimated = self.listener.events[:3]
+        assert raw.method_name == 'insert_one'
+        assert raw.query['name'] == 'raw'
+        assert distinct.method_name == 'distinct'
+        assert distinct.query == {'balance': {'$gte': 1}}
+        assert distinct.options['key'] == 'name'
+        assert distinct.result == ['raw']
+        assert estimated.method_name == 'estimated_document_count'
+        assert estimated.result == 1
+
+    def test_unread_cursor_events(self):
+        self.Account.Q.insert_one(name='first')
+        self.listener.events.clear()
+        queryset = self.Account.Q.find()
+        assert self.listener.events == []
+        queryset._data.close()
+        self.Account.Q.find(name='first')
+        gc.collect()
+
+        closed, collected = self.listener.events
+        assert closed.method_name == collected.method_name == 'find'
+        assert closed.duration is not None
+        assert collected.query == {'name': 'first'}
+        assert collected.documents is None
+        assert self.metrics.summary()[('Account', 'find')]['count'] == 2
+
+    @pytest.mark.asyncio
+    async def test_async_events(self):
+        self.Account.Q.insert_many([self.Account(name=str(i)) for i in range(3)])
+        self.listener.events.clear()
+        queryset = await self.Account.AQ.find(sort_fields=['name'])
+        assert [obj.name for obj in await queryset.to_list()] == ['0', '1', '2']
+        assert await self.Account.AQ.distinct('name', name='1') == ['1']
+        assert await self.Account.AQ.raw_query('find_one', {'name': '2'})
+
+        find, distinct, raw = self.listener.events
+        assert find.method_name == 'find'
+        assert find.options['sort'] == [('name', 1)]
+        assert find.duration is not None
+        assert distinct.method_name == 'distinct'
+        assert raw.method_name == 'find_one'
+        assert raw.documents == 1
+
+    def test_errors_and_retries(self):
+        self.Account.Q.insert_one(name='first')
+        self._use_flaky_collection([AutoReconnect('lost'), OperationFailure('bad')])
+        try:
+            with pytest.raises(OperationFailure):
+                self.Account.Q.find_one(name='first')
+        finally:
+            self.Account.__collection__ = None
+        lost, failed = self.listener.events[1:]
+        assert isinstance(lost.error, AutoReconnect)
+        assert lost.retries == 0
+        assert isinstance(failed.error, OperationFailure)
+        assert failed.retries == 1
+
+        summary = self.metrics.summary()[('Account', 'find_one')]
+        assert summary['count'] == 2
+        assert summary['errors'] == 2
+        assert summary['retries'] == 1
+
+    @pytest.mark.asyncio
+    async def test_async_retries(self):
+        self.Account.Q.insert_one(name='first')
+        self._use_flaky_collection([AutoReconnect('lost')])
+        querybuilder = self.Account.__async_querybuilder__
+        try:
+            obj = await querybuilder.find_one(name='first')
+        finally:
+            self.Account.__collection__ = None
+        assert obj.name == 'first'
+        assert [e.retries for e in self.listener.events[1:]] == [0, 1]
+
+    def test_metrics(self):
+        for i in range(10):
+            self.Account.Q.insert_one(name=str(i))
+        self.Account.Q.count()
+        summary = self.metrics.summary()
+        insert = summary[('Account', 'insert_one')]
+        assert insert['count'] == 10
+        assert insert['errors'] == 0
+        assert 0 < insert['p50'] <= insert['p99'] <= 1.0
+        assert summary[('Account', 'count_documents')]['count'] == 1
+
+        text = self.metrics.prometheus_text()
+        assert '# TYPE mongodantic_query_duration_seconds histogram' in text
+        assert (
+            'mongodantic_query_duration_seconds_bucket'
+            '{model="Account",method="insert_one",le="+Inf"} 10'
+        ) in text
+        assert (
+            'mongodantic_query_duration_seconds_count'
+            '{model="Account",method="insert_one"} 10'
+        ) in text
+        assert 'mongodantic_query_errors_total{model="Account",method="insert_one"} 0' in text
+
+        self.metrics.reset()
+        assert self.metrics.summary() == {}
+
+    def test_broken_listener_does_not_break_query(self):
+        broken = BrokenListener()
+        register_listener(broken)
+        register_listener(broken)
+        assert get_listeners().count(broken) == 1
+        try:
+            self.Account.Q.insert_one(name='first')
+            assert self.Account.Q.count(name='first') == 1
+        finally:
+            unregister_listener(broken)
+        assert broken not in get_listeners()
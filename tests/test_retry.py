@@ -0,0 +1,134 @@
+import asyncio
+
+import pytest
+from pymongo.errors import AutoReconnect
+
+from mongodantic import connect, RetryPolicy
+from mongodantic.exceptions import MongoConnectionError
+from mongodantic.models import MongoModel
+from mongodantic.retry import (
+    get_retry_policy,
+    handle_and_convert_connection_errors,
+    async_handle_and_convert_connection_errors,
+    without_retries,
+)
+
+
+class FlakyQuery(object):
+    def __init__(self, failures, retry_policy=None):
+        self.failures = failures
+        self.calls = 0
+        self._retry_policy = retry_policy
+
+    def _call(self):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise AutoReconnect('connection lost')
+        return 'ok'
+
+    @handle_and_convert_connection_errors
+    def query(self):
+        return self._call()
+
+    @async_handle_and_convert_connection_errors
+    async def async_query(self):
+        return self._call()
+
+
+class TestRetryPolicy:
+    def setup(self):
+        self.policy = RetryPolicy(max_attempts=3, backoff_base=0, jitter=False)
+        connect("mongodb://127.0.0.1:27017", "test", retry_policy=self.policy)
+
+        class Ticket(MongoModel):
+            name: str
+
+        self.Ticket = Ticket
+
+    def test_delay(self):
+        policy = RetryPolicy(backoff_base=0.1, backoff_max=0.5, jitter=False)
+        assert [policy.delay(i) for i in range(1, 5)] == [0.1, 0.2, 0.4, 0.5]
+        policy = RetryPolicy(backoff_base=0.1, jitter=True)
+        assert 0 <= policy.delay(3) <= 0.4
+        with pytest.raises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+    def test_deadline(self):
+        policy = RetryPolicy(backoff_base=10, jitter=False, deadline=1)
+        error = AutoReconnect('connection lost')
+        assert policy.next_delay(error, 1, started=0) is None
+        assert policy.next_delay(ValueError(), 1, started=0) is None
+
+    def test_env_policy(self):
+        assert get_retry_policy() is self.policy
+        query = FlakyQuery(failures=2)
+        assert query.query() == 'ok'
+        assert query.calls == 3
+        assert self.policy.stats() == {'calls': 1, 'retries': 2, 'failures': 0}
+
+        query = FlakyQuery(failures=3)
+        with pytest.raises(MongoConnectionError):
+            query.query()
+        assert self.policy.stats()['failures'] == 1
+
+    def test_own_policy(self):
+        policy = RetryPolicy(max_attempts=1)
+        query = FlakyQuery(failures=1, retry_policy=policy)
+        with pytest.raises(MongoConnectionError):
+            query.query()
+        assert query.calls == 1
+        assert policy.stats() == {'calls': 1, 'retries': 0, 'failures': 1}
+
+    def test_async_retry(self):
+        query = FlakyQuery(failures=2)
+        assert asyncio.run(query.async_query()) == 'ok'
+        assert query.calls == 3
+
+    def test_querybuilder_with_retry(self):
+        policy = RetryPolicy(max_attempts=2)
+        querybuilder = self.Ticket.Q.with_retry(policy)
+        assert querybuilder._retry_policy is policy
+        assert self.Ticket.Q._retry_policy is None
+        querybuilder.count()
+        assert policy.stats()['calls'] == 1
+
+    def test_nested_without_retries(self):
+        query = FlakyQuery(failures=1)
+
+        @without_retries
+        def inner():
+            return 'inner'
+
+        @without_retries
+        def outer():
+            inner()
+            # retries stay disabled after nested call returns
+            return query.query()
+
+        # errors are not retried and not converted, async wrapper handles them
+        with pytest.raises(AutoReconnect):
+            outer()
+        assert query.calls == 1
+        assert query.query() == 'ok'
+
+    def test_prefetched_find_is_not_retried_twice(self):
+        collection = self.Ticket._collection
+        calls = []
+
+        class BrokenCollection(object):
+            def __getattr__(self, name):
+                return getattr(collection, name)
+
+            def find(self, *args, **kwargs):
+                calls.append(args)
+                raise AutoReconnect('connection lost')
+
+        self.Ticket.__collection__ = BrokenCollection()
+        try:
+            with pytest.raises(MongoConnectionError):
+                self.Ticket.Q.find_with_count(concurrent=True)
+        finally:
+            self.Ticket.__collection__ = None
+        assert len(calls) == 3
+        # count and find calls, find is retried only by the outer wrapper
+        assert self.policy.stats() == {'calls': 2, 'retries': 2, 'failures': 1}
@@ -0,0 +1,165 @@
+import logging
+from time import sleep
+
+from mongodantic import connect
+from mongodantic.models import MongoModel
+from mongodantic.monitoring import (
+    QueryListener,
+    SlowQueryLogger,
+    plan_flags,
+    query_shape,
+    register_listener,
+    unregister_listener,
+)
+
+PLAN = {
+    'queryPlanner': {
+        'winningPlan': {
+            'stage': 'SORT',
+            'inputStage': {'stage': 'COLLSCAN', 'direction': 'forward'},
+        },
+        'rejectedPlans': [{'stage': 'FETCH', 'inputStage': {'stage': 'IXSCAN'}}],
+    }
+}
+
+
+class RecordingListener(QueryListener):
+    def __init__(self):
+        self.events = []
+
+    def succeeded(self, event):
+        self.events.append(event)
+
+
+class FakeExplainLogger(SlowQueryLogger):
+    def __init__(self, *args, plan=PLAN, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.plan = plan
+        self.explained = []
+
+    def _explain(self, event):
+        self.explained.append(event)
+        if isinstance(self.plan, Exception):
+            raise self.plan
+        return self.plan
+
+
+class TestSlowQueries:
+    def setup(self):
+        connect("mongodb://127.0.0.1:27017", "test")
+
+        class Account(MongoModel):
+            name: str
+            balance: int = 0
+
+        Account.Q.drop_collection(force=True)
+        Account.Q.insert_many([Account(name=str(i), balance=i) for i in range(5)])
+        self.Account = Account
+        self.listeners = []
+
+    def teardown(self):
+        for listener in self.listeners:
+            unregister_listener(listener)
+            if isinstance(listener, SlowQueryLogger):
+                listener.close()
+
+    def _register(self, listener):
+        register_listener(listener)
+        self.listeners.append(listener)
+        return listener
+
+    def _records(self, caplog):
+        return [
+            r.slow_query for r in caplog.records if r.name == 'mongodantic.slow_queries'
+        ]
+
+    def test_find_event_is_finished_with_first_batch(self):
+        listener = self._register(RecordingListener())
+        queryset = self.Account.Q.find(
+            balance__gte=1, sort_fields=['balance'], sort=-1, skip_rows=1, limit_rows=2
+        )
+        assert listener.events == []
+        assert [obj.balance for obj in queryset] == [3, 2]
+        (event,) = listener.events
+        assert event.method_name == 'find'
+        assert event.options['sort'] == [('balance', -1)]
+        assert event.options['skip'] == 1
+        assert event.options['limit'] == 2
+        assert event.duration >= 0
+
+    def test_query_shape(self):
+        first = query_shape({'name': 'a', 'balance': {'$in': [1, 2]}, '$or': [{'x': 1}]})
+        second = query_shape({'$or': [{'x': 5}], 'balance': {'$in': [3]}, 'name': 'b'})
+        assert first == second == {
+            '$or': [{'x': '?'}],
+            'balance': {'$in': '?'},
+            'name': '?',
+        }
+
+    def test_plan_flags(self):
+        assert plan_flags(PLAN) == ['COLLSCAN', 'SORT']
+        assert plan_flags({'queryPlanner': {'winningPlan': {'stage': 'IXSCAN'}}}) == []
+        aggregate = {
+            'stages': [
+                {'$cursor': {'queryPlanner': {'winningPlan': {'stage': 'IXSCAN'}}}},
+                {'$sort': {'sortKey': {'balance': 1}}},
+            ]
+        }
+        assert plan_flags(aggregate) == ['SORT']
+
+    def test_log_once_per_shape(self, caplog):
+        slow = self._register(FakeExplainLogger(threshold=0, interval=0.2))
+        with caplog.at_level(logging.WARNING, logger='mongodantic.slow_queries'):
+            list(self.Account.Q.find(name='1', sort_fields=['balance']))
+            list(self.Account.Q.find(name='2', sort_fields=['balance']))
+            self.Account.Q.count(balance__gte=2)
+            self.Account.Q.insert_one(name='new')
+            slow.flush()
+            find, count = self._records(caplog)
+            assert find['method'] == 'find'
+            assert find['filter'] == {'name': '1'}
+            assert find['sort'] == [('balance', 1)]
+            assert find['flags'] == ['COLLSCAN', 'SORT']
+            assert count['method'] == 'count_documents'
+            assert count['filter'] == {'balance': {'$gte': 2}}
+            assert len(slow.explained) == 2
+
+            sleep(0.25)
+            list(self.Account.Q.find(name='3', sort_fields=['balance']))
+            slow.flush()
+            again = self._records(caplog)[-1]
+        assert again['suppressed'] == 1
+        assert again['flags'] == ['COLLSCAN', 'SORT']
+        assert len(slow.explained) == 2
+
+    def test_rate_limit(self, caplog):
+        slow = self._register(
+            FakeExplainLogger(threshold=0, explain=False, interval=0.2, max_per_interval=2)
+        )
+        with caplog.at_level(logging.WARNING, logger='mongodantic.slow_queries'):
+            self.Account.Q.count(name='1')
+            self.Account.Q.count(balance=1)
+            self.Account.Q.count(name='1', balance=1)
+            assert len(self._records(caplog)) == 2
+            sleep(0.25)
+            self.Account.Q.count(balance__gte=1)
+            records = self._records(caplog)
+        assert len(records) == 3
+        assert records[-1]['dropped'] == 1
+        assert records[-1]['flags'] is None
+        assert slow.explained == []
+
+    def test_threshold_and_explain_errors(self, caplog):
+        self._register(FakeExplainLogger(threshold=10))
+        failing = FakeExplainLogger(
+            threshold=0, methods=('aggregate',), plan=RuntimeError('no explain')
+        )
+        self._register(failing)
+        with caplog.at_level(logging.WARNING, logger='mongodantic.slow_queries'):
+            self.Account.Q.count(name='1')
+            self.Account.Q.raw_aggregate([{'$match': {'balance': {'$gte': 1}}}])
+            failing.flush()
+            (record,) = self._records(caplog)
+        assert record['method'] == 'aggregate'
+        assert record['flags'] is None
+        assert 'no explain' in record['explain_error']